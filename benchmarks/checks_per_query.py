@@ -0,0 +1,63 @@
+"""Measures average number of recursive checks per query on a corpus."""
+import argparse
+import random
+import typing as t
+from collections import abc
+from itertools import product
+
+from correct._core.budget import (Budget,
+                                  run_within)
+from correct._core.predicates import is_subtype
+from correct._core.variance import Variance
+from correct.caching import invalidate
+from correct.predicates import to_prefilter_hits
+
+leaves = [int, bool, str, bytes, float, t.SupportsInt, t.SupportsAbs[int],
+          t.Callable[[int, str], float], t.Callable[..., bytes]]
+corpus = [
+    *leaves,
+    *[t.Union[first, second] for first, second in product(leaves, leaves)
+      if first is not second],
+    *[t.Tuple[first, second] for first, second in product(leaves, leaves)],
+    *[t.Dict[first, second]
+      for first, second in product(leaves[:5], leaves)],
+    *[abc.Sequence[first] for first in leaves],
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=None,
+                        help='number of randomly sampled pairs to check, '
+                             'all pairs are checked by default')
+    parser.add_argument('--variance', choices=[variance.name.lower()
+                                               for variance in Variance],
+                        default='covariant',
+                        help='variance to compare annotations with')
+    namespace = parser.parse_args()
+    variance = Variance[namespace.variance.upper()]
+    pairs = list(product(corpus, corpus))
+    if namespace.size is not None:
+        pairs = random.Random(0).sample(pairs, namespace.size)
+    steps_count = unsupported_count = 0
+    initial_hits = to_prefilter_hits()
+    for left, right in pairs:
+        # every query starts with cold caches to count all the checks
+        invalidate()
+        try:
+            steps_count += run_within(
+                    lambda: is_subtype(variance, variance, left, right),
+                    Budget()
+            ).steps
+        except TypeError:
+            unsupported_count += 1
+    print(f'pairs: {len(pairs)}, unsupported: {unsupported_count}, '
+          f'average checks per query: '
+          f'{steps_count / (len(pairs) - unsupported_count):.3f}')
+    for tier, hits_count in to_prefilter_hits().items():
+        print(f'{tier.name.lower()} tier hits: '
+              f'{hits_count - initial_hits[tier]}')
+
+
+if __name__ == '__main__':
+    main()
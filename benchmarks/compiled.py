@@ -0,0 +1,45 @@
+"""Measures time of cold checks on a corpus with the installed build."""
+import argparse
+import random
+import time
+from importlib.machinery import EXTENSION_SUFFIXES
+from itertools import product
+
+from benchmarks.checks_per_query import corpus
+from correct._core import predicates
+from correct._core.predicates import is_subtype
+from correct._core.variance import Variance
+from correct.caching import invalidate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=None,
+                        help='number of randomly sampled pairs to check, '
+                             'all pairs are checked by default')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='number of runs to take the best one from')
+    namespace = parser.parse_args()
+    pairs = list(product(corpus, corpus))
+    if namespace.size is not None:
+        pairs = random.Random(0).sample(pairs, namespace.size)
+    variance = Variance.COVARIANT
+    elapsed = float('inf')
+    for _ in range(namespace.repeats):
+        start = time.perf_counter()
+        for left, right in pairs:
+            # every query starts with cold caches to time all the checks
+            invalidate()
+            try:
+                is_subtype(variance, variance, left, right)
+            except TypeError:
+                pass
+        elapsed = min(elapsed, time.perf_counter() - start)
+    compiled = (predicates.__file__ or '').endswith(tuple(EXTENSION_SUFFIXES))
+    print(f'build: {"mypyc" if compiled else "pure Python"}, '
+          f'pairs: {len(pairs)}, elapsed: {elapsed:.3f}s, '
+          f'throughput: {len(pairs) / elapsed:.1f} pairs/s')
+
+
+if __name__ == '__main__':
+    main()
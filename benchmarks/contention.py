@@ -0,0 +1,76 @@
+"""Measures throughput of cached checks under thread pool contention."""
+import argparse
+import sys
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+from correct.dispatching import multidispatch
+from correct.predicates import is_subtype
+
+protocols = [t.SupportsAbs, t.SupportsBytes, t.SupportsComplex,
+             t.SupportsFloat, t.SupportsIndex, t.SupportsInt,
+             t.SupportsRound]
+classes = [bool, bytes, complex, dict, float, int, list, str]
+pairs = list(product(classes, protocols))
+
+
+@multidispatch
+def describe(value: object) -> str:
+    return 'object'
+
+
+@describe.register
+def _(value: int) -> str:
+    return 'integer'
+
+
+@describe.register
+def _(value: t.Sequence[t.Any]) -> str:
+    return 'sequence'
+
+
+def run_checks(repeats: int) -> int:
+    for _ in range(repeats):
+        for left, right in pairs:
+            is_subtype(left, right)
+        for cls in classes:
+            describe.dispatch(cls)
+    return repeats * (len(pairs) + len(classes))
+
+
+def measure(threads_count: int, tasks_count: int, repeats: int) -> float:
+    with ThreadPoolExecutor(threads_count) as executor:
+        start = time.perf_counter()
+        checks_count = sum(executor.map(run_checks,
+                                        [repeats] * tasks_count))
+        return checks_count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', nargs='+', type=int,
+                        default=[1, 2, 4, 8],
+                        help='numbers of threads to measure with')
+    parser.add_argument('--tasks', type=int, default=64,
+                        help='number of tasks submitted to the pool')
+    parser.add_argument('--repeats', type=int, default=10,
+                        help='number of passes over workload per task')
+    namespace = parser.parse_args()
+    run_checks(1)  # warm up caches
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'GIL enabled: {gil_enabled}')
+    baseline = None
+    for threads_count in namespace.threads:
+        throughput = measure(threads_count, namespace.tasks,
+                             namespace.repeats)
+        if baseline is None:
+            baseline = throughput
+        print(f'threads: {threads_count:>3}, '
+              f'checks per second: {throughput:>12.0f}, '
+              f'scaling: {throughput / baseline:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Measures time of checking overrides of a synthetic classes hierarchy."""
+import argparse
+import random
+import time
+import types
+import typing as t
+from collections import Counter
+
+from correct.overrides import check_classes
+
+annotations: t.List[t.Any] = [int, bool, float, str, t.Optional[int],
+                              t.Sequence[int], t.List[int],
+                              t.Callable[[int], str], t.Any]
+methods_names = [f'method_{index}' for index in range(16)]
+
+
+def generate_classes(size: int, methods_count: int) -> t.List[type]:
+    generator = random.Random(0)
+    result: t.List[type] = []
+    for index in range(size):
+        bases = ((generator.choice(result[-100:]),)
+                 if result and generator.random() < 0.9
+                 else ())
+        namespace: t.Dict[str, t.Any] = {
+            '__module__': __name__,
+            **{name: to_method(generator.choice(annotations),
+                               generator.choice(annotations))
+               for name in generator.sample(methods_names, methods_count)}
+        }
+        name = f'Class{index}'
+        cls = types.new_class(name, bases,
+                              exec_body=lambda ns: ns.update(namespace))
+        # classes are passed to worker processes by reference
+        globals()[name] = cls
+        result.append(cls)
+    return result
+
+
+def to_method(parameter_annotation: t.Any,
+              return_annotation: t.Any) -> t.Callable[..., t.Any]:
+    def method(self: t.Any, value: t.Any) -> t.Any:
+        return value
+
+    method.__annotations__ = {'value': parameter_annotation,
+                              'return': return_annotation}
+    return method
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=20_000,
+                        help='number of classes')
+    parser.add_argument('--methods-count', type=int, default=4,
+                        help='number of methods defined by each class')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of worker processes')
+    namespace = parser.parse_args()
+    classes = generate_classes(namespace.size, namespace.methods_count)
+    start = time.perf_counter()
+    results = check_classes(classes,
+                            jobs=namespace.jobs)
+    elapsed = time.perf_counter() - start
+    statuses_counts = Counter(result.status.name.lower()
+                              for result in results)
+    statuses_summary = ', '.join(f'{status}: {count}'
+                                 for status, count
+                                 in sorted(statuses_counts.items()))
+    print(f'classes: {len(classes)}, overrides: {len(results)}, '
+          f'{statuses_summary}, elapsed: {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
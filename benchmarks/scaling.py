@@ -0,0 +1,195 @@
+"""Measures scaling of subtype checks with sizes of annotations."""
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+import types
+import typing as t
+from pathlib import Path
+
+import typing_extensions as te
+from paradigm.base import (OverloadedSignature,
+                           ParameterKind,
+                           PlainSignature,
+                           RequiredParameter)
+
+from correct._core import signatures
+from correct._core.predicates import is_covariant_subtype
+from correct.caching import invalidate
+
+# annotations are built deterministically from sizes,
+# so runs are comparable across revisions
+Case = t.Callable[[], bool]
+
+
+def to_union_case(size: int) -> Case:
+    bases = to_classes(size)
+    # variants are not identical, so they are not matched by equality
+    derived = [types.new_class(f'Derived{base.__name__}', (base,))
+               for base in bases]
+    left, right = t.Union[tuple(derived[::-1])], t.Union[tuple(bases)]
+    return lambda: is_covariant_subtype(left, right)
+
+
+def to_nesting_case(size: int) -> Case:
+    left: t.Any = bool
+    right: t.Any = int
+    for _ in range(size):
+        left, right = t.List[left], t.Sequence[right]
+    return lambda: is_covariant_subtype(left, right)
+
+
+def to_tuple_case(size: int) -> Case:
+    left, right = t.Tuple[(bool,) * size], t.Tuple[(int,) * size]
+    return lambda: is_covariant_subtype(left, right)
+
+
+def to_callable_case(size: int) -> Case:
+    left: t.Any = t.Callable[[int] * size, bool]
+    right: t.Any = t.Callable[[bool] * size, int]
+    return lambda: is_covariant_subtype(left, right)
+
+
+def to_overloads_case(size: int) -> Case:
+    overloads = [
+        PlainSignature(RequiredParameter(annotation=cls,
+                                         kind=ParameterKind.POSITIONAL_ONLY,
+                                         name='value'),
+                       returns=cls)
+        for cls in to_classes(size)
+    ]
+    left = OverloadedSignature(*overloads)
+    right = OverloadedSignature(*overloads[::-1])
+    return lambda: signatures.is_subtype_of(left, right, is_covariant_subtype)
+
+
+def to_protocol_case(size: int) -> Case:
+    methods = {f'method_{index}': to_method() for index in range(size)}
+    protocol = types.new_class('Members', (te.Protocol,),
+                               exec_body=lambda ns: ns.update(methods))
+    implementation = types.new_class('Implementation',
+                                     exec_body=lambda ns: ns.update(methods))
+    return lambda: is_covariant_subtype(implementation, protocol)
+
+
+def to_classes(size: int) -> t.List[type]:
+    return [types.new_class(f'Class{index}') for index in range(size)]
+
+
+def to_method() -> t.Callable[..., t.Any]:
+    def method(self: t.Any, value: int) -> int:
+        return value
+
+    return method
+
+
+dimensions: t.Dict[str, t.Callable[[int], Case]] = {
+    'union width': to_union_case,
+    'nesting depth': to_nesting_case,
+    'tuple length': to_tuple_case,
+    'callable parameters count': to_callable_case,
+    'overloads count': to_overloads_case,
+    'protocol members count': to_protocol_case,
+}
+
+
+class Measurement(t.NamedTuple):
+    elapsed: float
+    memory: int
+
+
+def measure(case: Case, repeats: int) -> Measurement:
+    elapsed = math.inf
+    for _ in range(repeats):
+        # every run starts with cold caches to time all the checks
+        invalidate()
+        start = time.perf_counter()
+        case()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    invalidate()
+    tracemalloc.start()
+    try:
+        case()
+        _, memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Measurement(elapsed, memory)
+
+
+def to_exponent(sizes: t.Sequence[int], values: t.Sequence[float]) -> float:
+    # slope of least squares fit in log-log scale,
+    # i.e. ``k`` for values growing as ``size ** k``
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, sys.float_info.min)) for value in values]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+            / sum((x - x_mean) ** 2 for x in xs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[8, 16, 32, 64, 128],
+                        help='sizes to grow each dimension through')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='number of runs to take the best one from')
+    parser.add_argument('--baseline', type=Path,
+                        default=Path('.scaling-baseline.json'),
+                        help='path to baseline exponents')
+    parser.add_argument('--record', action='store_true',
+                        help='record measured exponents as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='allowed growth of exponents over the baseline')
+    namespace = parser.parse_args()
+    if len(namespace.sizes) < 2:
+        parser.error('at least two sizes are required')
+    baseline: t.Dict[str, t.Dict[str, float]] = (
+        json.loads(namespace.baseline.read_text())
+        if not namespace.record and namespace.baseline.exists()
+        else {}
+    )
+    exponents: t.Dict[str, t.Dict[str, float]] = {}
+    regressions = []
+    for dimension, to_case in dimensions.items():
+        measurements = [measure(to_case(size), namespace.repeats)
+                        for size in namespace.sizes]
+        dimension_exponents = exponents[dimension] = {
+            'time': to_exponent(namespace.sizes,
+                                [measurement.elapsed
+                                 for measurement in measurements]),
+            'memory': to_exponent(namespace.sizes,
+                                  [measurement.memory
+                                   for measurement in measurements])
+        }
+        summaries = []
+        for metric, exponent in dimension_exponents.items():
+            baseline_exponent = baseline.get(dimension, {}).get(metric)
+            summary = f'{metric} exponent: {exponent:.2f}'
+            if baseline_exponent is not None:
+                summary += f' (baseline: {baseline_exponent:.2f})'
+                # only super-linear growth beyond the baseline is flagged,
+                # since exponents of fast checks are noisy
+                if (exponent > 1 + namespace.tolerance
+                        and exponent > baseline_exponent
+                        + namespace.tolerance):
+                    summary += ' REGRESSION'
+                    regressions.append(f'{dimension} {metric}')
+            summaries.append(summary)
+        largest = measurements[-1]
+        print(f'{dimension}: {", ".join(summaries)}, '
+              f'size {namespace.sizes[-1]}: {largest.elapsed:.6f}s, '
+              f'{largest.memory} bytes')
+    if namespace.record:
+        namespace.baseline.write_text(json.dumps(exponents,
+                                                 indent=2))
+        print(f'baseline is recorded to {namespace.baseline}')
+    elif regressions:
+        print(f'super-linear regressions: {", ".join(regressions)}',
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Checks subtyping of annotations pairs read as JSON Lines."""
+import argparse
+import sys
+import time
+import typing as t
+from functools import partial
+from itertools import islice
+from multiprocessing import Pool
+
+from ._core.bulk import check_lines
+from ._core.variance import Variance
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+            prog='python -m correct',
+            description=__doc__,
+            epilog='Input records are objects with "left" & "right" fields '
+                   'holding dotted paths or type expressions, '
+                   'output records are input ones '
+                   'with "status" & optional "reason" fields.'
+    )
+    parser.add_argument('input', nargs='?', type=argparse.FileType('r'),
+                        default=sys.stdin,
+                        help='path to JSON Lines file, '
+                             'standard input is read by default')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of worker processes')
+    parser.add_argument('--chunk-size', type=int, default=1024,
+                        help='number of lines sent to a worker at once')
+    parser.add_argument('--stats', action='store_true',
+                        help='print throughput summary to standard error')
+    parser.add_argument('--variance', choices=[variance.name.lower()
+                                               for variance in Variance],
+                        default='invariant',
+                        help='variance to compare annotations with')
+    namespace = parser.parse_args()
+    if namespace.jobs < 1:
+        parser.error('number of jobs should be positive')
+    if namespace.chunk_size < 1:
+        parser.error('chunk size should be positive')
+    lines: t.Iterator[str] = namespace.input
+    chunks = iter(partial(_to_chunk, lines, namespace.chunk_size), [])
+    function = partial(check_lines, Variance[namespace.variance.upper()])
+    start = time.perf_counter()
+    pairs_count = resolved_count = 0
+    if namespace.jobs == 1:
+        for outputs, chunk_resolved_count in map(function, chunks):
+            pairs_count += len(outputs)
+            resolved_count += chunk_resolved_count
+            _write(outputs)
+    else:
+        with Pool(namespace.jobs) as pool:
+            for outputs, chunk_resolved_count in pool.imap(function, chunks):
+                pairs_count += len(outputs)
+                resolved_count += chunk_resolved_count
+                _write(outputs)
+    if namespace.stats:
+        elapsed = time.perf_counter() - start
+        print(f'pairs: {pairs_count}, '
+              f'resolved annotations: {resolved_count}, '
+              f'elapsed: {elapsed:.3f}s, '
+              f'throughput: {pairs_count / (elapsed or 1):.1f} pairs/s',
+              file=sys.stderr)
+
+
+def _to_chunk(lines: t.Iterator[str], size: int) -> t.List[str]:
+    return list(islice(lines, size))
+
+
+def _write(lines: t.List[str]) -> None:
+    sys.stdout.writelines(lines)
+    sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import time
+import typing as t
+from contextvars import ContextVar
+
+
+class BudgetExhausted(Exception):
+    pass
+
+
+class Budget:
+    __slots__ = '_deadline', '_max_steps', '_start', 'steps'
+
+    def __init__(self,
+                 *,
+                 max_steps: t.Optional[int] = None,
+                 timeout: t.Optional[float] = None) -> None:
+        assert max_steps is None or max_steps >= 0, max_steps
+        assert timeout is None or timeout >= 0, timeout
+        self._start = time.perf_counter()
+        self._deadline = None if timeout is None else self._start + timeout
+        self._max_steps = max_steps
+        self.steps = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def spend(self) -> None:
+        if ((self._max_steps is not None and self.steps >= self._max_steps)
+                or (self._deadline is not None
+                    and time.perf_counter() > self._deadline)):
+            raise BudgetExhausted
+        self.steps += 1
+
+
+class BudgetedResult(t.NamedTuple):
+    value: t.Optional[bool]
+    steps: int
+    elapsed: float
+
+
+active_budget: ContextVar[t.Optional[Budget]] = ContextVar('active_budget',
+                                                           default=None)
+
+
+def run_within(function: t.Callable[[], bool],
+               budget: Budget) -> BudgetedResult:
+    token = active_budget.set(budget)
+    try:
+        value: t.Optional[bool] = function()
+    except BudgetExhausted:
+        value = None
+    finally:
+        active_budget.reset(token)
+    return BudgetedResult(value, budget.steps, budget.elapsed)
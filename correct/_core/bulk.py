@@ -0,0 +1,152 @@
+import ast
+import builtins
+import json
+import sys
+import typing as t
+from functools import singledispatch
+from importlib import import_module
+
+from .checking import (Status,
+                       check)
+from .hints import Annotation
+from .variance import Variance
+
+
+class Resolver:
+    __slots__ = '_annotations',
+
+    def __init__(self) -> None:
+        self._annotations: t.Dict[str, Annotation] = {}
+
+    def __len__(self) -> int:
+        return len(self._annotations)
+
+    def resolve(self, expression: str) -> Annotation:
+        try:
+            return self._annotations[expression]
+        except KeyError:
+            result = self._annotations[expression] = _evaluate(
+                    ast.parse(expression.strip(),
+                              mode='eval').body
+            )
+            return result
+
+
+def check_lines(variance: Variance,
+                lines: t.Iterable[str]) -> t.Tuple[t.List[str], int]:
+    # workers resolve lines on their own, so annotations are never pickled
+    resolved_count = len(_resolver)
+    result = [_check_line(variance, line) for line in lines if line.strip()]
+    return result, len(_resolver) - resolved_count
+
+
+def _check_line(variance: Variance, line: str) -> str:
+    try:
+        record = json.loads(line)
+        left_expression, right_expression = record['left'], record['right']
+    except Exception as error:
+        return _to_output_line({'line': line.strip()}, 'invalid',
+                               f'Invalid record: {error!r}.')
+    try:
+        left = _resolver.resolve(left_expression)
+        right = _resolver.resolve(right_expression)
+    except (Exception, SystemExit) as error:
+        # modules exiting on import (e.g. scripts)
+        # should not terminate workers
+        return _to_output_line(record, 'unresolved',
+                               f'Unresolvable annotation: {error!r}.')
+    try:
+        result = check(variance, variance, left, right)
+    except Exception as error:
+        # failures of single records do not abort their chunks
+        return _to_output_line(record, 'error', f'Check failed: {error!r}.')
+    return _to_output_line(record, result.status.name.lower(),
+                           (result.reason
+                            if result.status is Status.UNSUPPORTED
+                            else None))
+
+
+def _to_output_line(record: t.Dict[str, t.Any],
+                    status: str,
+                    reason: t.Optional[str]) -> str:
+    output = {**record, 'status': status}
+    if reason is not None:
+        output['reason'] = reason
+    return json.dumps(output) + '\n'
+
+
+@singledispatch
+def _evaluate(node: ast.AST) -> t.Any:
+    # only literals are evaluated, calls & other expressions are rejected
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f'Unsupported expression: {ast.dump(node)}.')
+
+
+@_evaluate.register(ast.Attribute)
+@_evaluate.register(ast.Name)
+def _(node: t.Union[ast.Attribute, ast.Name]) -> t.Any:
+    return _resolve_path(_to_path(node))
+
+
+@_evaluate.register(ast.BinOp)
+def _(node: ast.BinOp) -> t.Any:
+    if not isinstance(node.op, ast.BitOr):
+        raise ValueError(f'Unsupported operator: {ast.dump(node.op)}.')
+    return _evaluate(node.left) | _evaluate(node.right)
+
+
+@_evaluate.register(ast.List)
+def _(node: ast.List) -> t.Any:
+    return [_evaluate(element) for element in node.elts]
+
+
+@_evaluate.register(ast.Subscript)
+def _(node: ast.Subscript) -> t.Any:
+    return _evaluate(node.value)[_evaluate(node.slice)]
+
+
+@_evaluate.register(ast.Tuple)
+def _(node: ast.Tuple) -> t.Any:
+    return tuple(_evaluate(element) for element in node.elts)
+
+
+if sys.version_info < (3, 9):
+    @_evaluate.register(ast.Index)
+    def _(node: ast.Index) -> t.Any:
+        return _evaluate(node.value)
+
+
+def _resolve_path(path: t.Sequence[str]) -> t.Any:
+    result: t.Any
+    name, *rest = path
+    try:
+        result = vars(builtins)[name]
+    except KeyError:
+        # the longest importable prefix is a module,
+        # the rest are its attributes
+        for modules_count in range(len(path), 0, -1):
+            try:
+                result = import_module('.'.join(path[:modules_count]))
+            except ImportError:
+                continue
+            rest = list(path[modules_count:])
+            break
+        else:
+            raise NameError(f'Neither builtin nor module: {name!r}.')
+    for name in rest:
+        result = getattr(result, name)
+    return result
+
+
+def _to_path(node: ast.expr) -> t.List[str]:
+    if isinstance(node, ast.Name):
+        return [node.id]
+    elif isinstance(node, ast.Attribute):
+        return [*_to_path(node.value), node.attr]
+    else:
+        raise ValueError(f'Unsupported expression: {ast.dump(node)}.')
+
+
+_resolver = Resolver()
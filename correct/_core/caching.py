@@ -0,0 +1,172 @@
+import gc
+import threading
+import typing as t
+import weakref
+from abc import get_cache_token
+
+_KT = t.TypeVar('_KT')
+_VT = t.TypeVar('_VT')
+
+
+_generation = 0
+
+
+def freeze() -> None:
+    for cache in list(_caches):
+        cache.freeze()
+    gc.collect()
+    # not available on PyPy which has no reference counting
+    freeze_collector = getattr(gc, 'freeze', None)
+    if freeze_collector is not None:
+        freeze_collector()
+
+
+def invalidate() -> None:
+    global _generation
+    _generation += 1
+
+
+class _State(t.NamedTuple):
+    abc_token: object
+    generation: int
+    stripes: t.Tuple[t.Dict[t.Any, t.Any], ...]
+    frozen: t.Dict[t.Any, t.Any]
+
+
+class StripedCache(t.Generic[_KT, _VT]):
+    __slots__ = ('_locks', '_state', '_stripe_capacity', '__weakref__')
+
+    def __init__(self,
+                 *,
+                 capacity: t.Optional[int] = None,
+                 stripes_count: int = 16) -> None:
+        assert capacity is None or capacity > 0, capacity
+        assert stripes_count > 0, stripes_count
+        self._locks = tuple(threading.Lock() for _ in range(stripes_count))
+        self._state = _to_state(stripes_count)
+        self._stripe_capacity = (None
+                                 if capacity is None
+                                 else -(-capacity // stripes_count))
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        state = self._state
+        return len(state.frozen) + sum(map(len, state.stripes))
+
+    def clear(self) -> None:
+        self._state = _to_state(len(self._locks))
+
+    def freeze(self) -> None:
+        state = self._to_actual_state()
+        # entries are moved to a table which is written to
+        # only on freezing & removal of dead entries,
+        # so its memory stays shared by forked processes,
+        # while the ones added afterwards go to fresh stripes
+        frozen = state.frozen
+        for stripe in state.stripes:
+            frozen.update(stripe)
+        self._state = state._replace(
+                stripes=tuple({} for _ in range(len(self._locks)))
+        )
+
+    def lookup(self, key: _KT, factory: t.Callable[[_KT], _VT]) -> _VT:
+        state = self._to_actual_state()
+        stripes = state.stripes
+        try:
+            index = hash(key) % len(stripes)
+        except TypeError:
+            return factory(key)
+        frozen = state.frozen
+        if key in frozen:
+            return frozen[key]
+        stripe = stripes[index]
+        try:
+            return stripe[key]
+        except KeyError:
+            pass
+        value = factory(key)
+        with self._locks[index]:
+            value = stripe.setdefault(key, value)
+            self._evict(stripe)
+        return value
+
+    def _evict(self, stripe: t.Dict[t.Any, t.Any]) -> None:
+        if (self._stripe_capacity is not None
+                and len(stripe) > self._stripe_capacity):
+            stripe.pop(next(iter(stripe)), None)
+
+    def _to_actual_state(self) -> _State:
+        state = self._state
+        if (state.generation != _generation
+                or state.abc_token != get_cache_token()):
+            state = self._state = _to_state(len(self._locks))
+        return state
+
+
+_TupleT = t.TypeVar('_TupleT',
+                    bound=t.Tuple[t.Any, ...])
+
+
+class WeakStripedCache(StripedCache[_TupleT, _VT]):
+    __slots__ = ()
+
+    def lookup(self,
+               key: _TupleT,
+               factory: t.Callable[[_TupleT], _VT]) -> _VT:
+        state = self._to_actual_state()
+        stripes = state.stripes
+        identity = tuple(map(id, key))
+        index = hash(identity) % len(stripes)
+        stripe = stripes[index]
+        # entries of stripes are newer than frozen ones,
+        # so they shadow stale frozen entries
+        entry = stripe.get(identity)
+        if entry is None:
+            entry = state.frozen.get(identity)
+        if entry is not None and all(
+                reference() is component
+                for reference, component in zip(entry[0], key)
+        ):
+            return entry[1]
+        value = factory(key)
+        frozen = state.frozen
+
+        def remove(_: t.Any) -> None:
+            # entry can be moved to the frozen table in the meantime
+            stripe.pop(identity, None)
+            frozen.pop(identity, None)
+
+        references = tuple(to_reference(component, remove)
+                           for component in key)
+        with self._locks[index]:
+            stripe[identity] = references, value
+            self._evict(stripe)
+        return value
+
+
+class _StrongReference:
+    __slots__ = '_value',
+
+    def __init__(self, value: t.Any) -> None:
+        self._value = value
+
+    def __call__(self) -> t.Any:
+        return self._value
+
+
+def to_reference(
+        value: t.Any,
+        callback: t.Optional[t.Callable[[t.Any], None]] = None
+) -> t.Callable[[], t.Any]:
+    try:
+        return weakref.ref(value, callback)
+    except TypeError:
+        return _StrongReference(value)
+
+
+def _to_state(stripes_count: int) -> _State:
+    return _State(get_cache_token(), _generation,
+                  tuple({} for _ in range(stripes_count)), {})
+
+
+_caches: 'weakref.WeakSet[StripedCache[t.Any, t.Any]]' = weakref.WeakSet()
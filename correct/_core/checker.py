@@ -0,0 +1,98 @@
+import typing as t
+from functools import partial
+
+from .budget import (Budget,
+                     BudgetedResult,
+                     run_within)
+from .caching import WeakStripedCache
+from .checking import (CheckResult,
+                       check)
+from .dependencies import (TrackedResult,
+                           run_tracking)
+from .hints import Annotation
+from .predicates import subtype_predicates
+from .variance import Variance
+
+
+class CheckerStats(t.NamedTuple):
+    checks: int
+    misses: int
+
+
+class Checker:
+    __slots__ = ('_check', '_checks', '_is_subtype', '_misses', '_results',
+                 'left_variance', 'max_steps', 'right_variance', 'timeout')
+
+    def __init__(self,
+                 *,
+                 left_variance: Variance = Variance.INVARIANT,
+                 right_variance: Variance = Variance.INVARIANT,
+                 capacity: t.Optional[int] = 1 << 16,
+                 max_steps: t.Optional[int] = None,
+                 timeout: t.Optional[float] = None) -> None:
+        assert max_steps is None or max_steps >= 0, max_steps
+        assert timeout is None or timeout >= 0, timeout
+        self.left_variance, self.right_variance = (left_variance,
+                                                   right_variance)
+        self.max_steps, self.timeout = max_steps, timeout
+        self._check = partial(check, left_variance, right_variance)
+        self._is_subtype = subtype_predicates[left_variance, right_variance]
+        self._results: WeakStripedCache[t.Tuple[Annotation, Annotation],
+                                        bool] = WeakStripedCache(
+                capacity=capacity
+        )
+        # updated without locking, so counts are approximate under contention
+        self._checks = self._misses = 0
+
+    @property
+    def stats(self) -> CheckerStats:
+        return CheckerStats(self._checks, self._misses)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return (f'{type(self).__qualname__}('
+                f'left_variance=Variance.{self.left_variance.name}, '
+                f'right_variance=Variance.{self.right_variance.name}, '
+                f'max_steps={self.max_steps!r}, '
+                f'timeout={self.timeout!r})')
+
+    def check(self, left: Annotation, right: Annotation) -> CheckResult:
+        self._checks += 1
+        return self._check(left, right)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._checks = self._misses = 0
+
+    def is_subtype(self, left: Annotation, right: Annotation) -> bool:
+        self._checks += 1
+        return self._results.lookup((left, right), self._to_result)
+
+    def is_subtype_tracked(self,
+                           left: Annotation,
+                           right: Annotation) -> TrackedResult:
+        self._checks += 1
+        # results of checker do not carry dependencies,
+        # so tracked checks bypass its cache
+        return run_tracking(partial(self._is_subtype, left, right))
+
+    def is_subtype_within(self,
+                          left: Annotation,
+                          right: Annotation,
+                          *,
+                          max_steps: t.Optional[int] = None,
+                          timeout: t.Optional[float] = None) -> BudgetedResult:
+        self._checks += 1
+        return run_within(
+                partial(self._is_subtype, left, right),
+                Budget(max_steps=(self.max_steps
+                                  if max_steps is None
+                                  else max_steps),
+                       timeout=self.timeout if timeout is None else timeout)
+        )
+
+    def _to_result(self, key: t.Tuple[Annotation, Annotation]) -> bool:
+        self._misses += 1
+        return self._is_subtype(*key)
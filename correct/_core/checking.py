@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import enum
+import typing as t
+import weakref
+
+from .caching import (WeakStripedCache,
+                      to_reference)
+from .hints import Annotation
+from .errors import UnsupportedTypes
+from .predicates import is_subtype
+from .utils import annotation_repr
+from .variance import Variance
+
+
+class Status(enum.IntEnum):
+    NOT_SUBTYPE = 0
+    SUBTYPE = 1
+    UNSUPPORTED = 2
+
+
+class _Failure:
+    __slots__ = '_arguments', '_cls'
+
+    def __init__(self, error: Exception) -> None:
+        # failures are cached, so arguments of errors are held weakly
+        # to not retain checked annotations
+        self._arguments = tuple(map(to_reference, error.args))
+        self._cls = type(error)
+
+    def to_reason(self) -> t.Optional[str]:
+        if any(isinstance(reference, weakref.ref) and reference() is None
+               for reference in self._arguments):
+            return None
+        try:
+            error = self._cls(*[reference()
+                                for reference in self._arguments])
+        except Exception:
+            return None
+        return str(error)
+
+
+class CheckResult:
+    __slots__ = '_failure', '_left', '_right', 'status'
+
+    def __init__(self,
+                 status: Status,
+                 left: Annotation,
+                 right: Annotation,
+                 failure: t.Optional[_Failure] = None) -> None:
+        self._failure, self._left, self._right, self.status = (
+            failure, left, right, status
+        )
+
+    @property
+    def reason(self) -> str:
+        if self._failure is not None:
+            reason = self._failure.to_reason()
+            return (str(UnsupportedTypes(self._left, self._right))
+                    if reason is None
+                    else reason)
+        return (f'"{annotation_repr(self._left)}" is '
+                f'{"" if self.status is Status.SUBTYPE else "not "}'
+                f'a subtype of "{annotation_repr(self._right)}".')
+
+    def __bool__(self) -> bool:
+        return self.status is Status.SUBTYPE
+
+    def __repr__(self) -> str:
+        return f'{type(self).__qualname__}({self.status.name})'
+
+
+def check(default_left_variance: Variance,
+          default_right_variance: Variance,
+          left: Annotation,
+          right: Annotation) -> CheckResult:
+    status, failure = _check_outcomes_cache.lookup(
+            (default_left_variance, default_right_variance, left, right),
+            _to_check_outcome
+    )
+    return CheckResult(status, left, right, failure)
+
+
+_Outcome = t.Tuple[Status, t.Optional[_Failure]]
+
+
+def _to_check_outcome(
+        key: t.Tuple[Variance, Variance, Annotation, Annotation]
+) -> _Outcome:
+    default_left_variance, default_right_variance, left, right = key
+    try:
+        result = is_subtype(default_left_variance, default_right_variance,
+                            left, right)
+    except (NameError, SyntaxError, TypeError, ValueError) as error:
+        # e.g. unresolvable forward references of records & protocols
+        return Status.UNSUPPORTED, _Failure(error)
+    return (Status.SUBTYPE if result else Status.NOT_SUBTYPE), None
+
+
+_check_outcomes_cache: WeakStripedCache[
+    t.Tuple[Variance, Variance, Annotation, Annotation], _Outcome
+] = WeakStripedCache(capacity=1 << 16)
@@ -0,0 +1,350 @@
+import enum
+import importlib
+import os
+import sys
+import types
+import typing as t
+from collections import Counter
+from importlib import import_module
+
+from . import signatures
+from .hints import Annotation
+from .overrides import (collect_namespace_classes,
+                        walk_package)
+from .predicates import (instance_methods_types,
+                         is_covariant_subtype,
+                         is_type_var,
+                         is_union)
+from .utils import (to_arguments,
+                    to_base)
+
+
+class Change(enum.IntEnum):
+    UNCHANGED = enum.auto()
+    COMPATIBLE = enum.auto()
+    ADDED = enum.auto()
+    REMOVED = enum.auto()
+    INCOMPATIBLE = enum.auto()
+    UNSUPPORTED = enum.auto()
+
+
+class Difference(t.NamedTuple):
+    name: str
+    change: Change
+    reason: str
+
+
+def diff_modules(
+        old_modules: t.Mapping[str, types.ModuleType],
+        new_modules: t.Mapping[str, types.ModuleType]
+) -> t.List[Difference]:
+    translator = _Translator(_to_classes_correspondence(old_modules,
+                                                        new_modules))
+    result = []
+    for module_name, old_module in old_modules.items():
+        try:
+            new_module = new_modules[module_name]
+        except KeyError:
+            result.append(Difference(module_name, Change.REMOVED, ''))
+            continue
+        old_members = _to_public_members(old_module)
+        new_members = _to_public_members(new_module)
+        for name, old_member in old_members.items():
+            qualified_name = f'{module_name}.{name}'
+            try:
+                new_member = new_members[name]
+            except KeyError:
+                result.append(Difference(qualified_name, Change.REMOVED, ''))
+            else:
+                result.extend(_diff_members(qualified_name, old_member,
+                                            new_member, translator))
+        result.extend(Difference(f'{module_name}.{name}', Change.ADDED, '')
+                      for name in new_members
+                      if name not in old_members)
+    result.extend(Difference(module_name, Change.ADDED, '')
+                  for module_name in new_modules
+                  if module_name not in old_modules)
+    return result
+
+
+def load_package(name: str,
+                 path: t.Union[str, 'os.PathLike[str]']
+                 ) -> t.Dict[str, types.ModuleType]:
+    path = os.path.abspath(os.fspath(path))
+    # modules of other versions are stashed away while importing,
+    # so absolute imports inside of the package resolve to this version
+    stashed_modules = {module_name: sys.modules.pop(module_name)
+                       for module_name in list(sys.modules)
+                       if _is_package_module(module_name, name)}
+    sys.path.insert(0, path)
+    importlib.invalidate_caches()
+    try:
+        package = import_module(name)
+        if not os.path.abspath(package.__file__ or '').startswith(path):
+            raise ImportError(f'Package {name!r} is not found in {path!r}.')
+        return {module.__name__: module for module in walk_package(package)}
+    finally:
+        sys.path.remove(path)
+        for module_name in [module_name
+                            for module_name in sys.modules
+                            if _is_package_module(module_name, name)]:
+            del sys.modules[module_name]
+        sys.modules.update(stashed_modules)
+        importlib.invalidate_caches()
+
+
+def to_report(differences: t.Iterable[Difference]) -> str:
+    differences = list(differences)
+    changes_counts = Counter(difference.change
+                             for difference in differences)
+    lines = [', '.join(f'{change.name.lower()}: {changes_counts[change]}'
+                       for change in Change)]
+    lines.extend(f'{difference.change.name.lower()} {difference.name}'
+                 + (f': {difference.reason}' if difference.reason else '')
+                 for difference in differences
+                 if difference.change in _reported_changes)
+    return '\n'.join(lines)
+
+
+_reported_changes = frozenset({Change.INCOMPATIBLE, Change.REMOVED,
+                               Change.UNSUPPORTED})
+
+
+class _Translator:
+    # annotations of the new version refer to its own classes,
+    # so they are translated to the corresponding classes of the old one
+    __slots__ = '_cache', '_classes'
+
+    def __init__(self, classes: t.Mapping[type, type]) -> None:
+        self._cache: t.Dict[Annotation, Annotation] = {}
+        self._classes = classes
+
+    def is_subtype(self, left: Annotation, right: Annotation) -> bool:
+        return is_covariant_subtype(self.translate(left),
+                                    self.translate(right))
+
+    def translate(self, annotation: Annotation) -> Annotation:
+        try:
+            return self._cache[annotation]
+        except KeyError:
+            result = self._cache[annotation] = self._translate(annotation)
+            return result
+        except TypeError:
+            return self._translate(annotation)
+
+    def _translate(self, annotation: Annotation) -> Annotation:
+        if isinstance(annotation, type):
+            return self._classes.get(annotation, annotation)
+        elif is_type_var(annotation):
+            return self._translate_type_var(annotation)
+        origin = to_base(annotation)
+        if origin is None:
+            return annotation
+        arguments = to_arguments(annotation)
+        translated_arguments = tuple(map(self._translate_argument,
+                                         arguments))
+        translated_origin = (self.translate(origin)
+                             if isinstance(origin, type)
+                             else origin)
+        if translated_origin is origin and all(
+                translated_argument is argument
+                for translated_argument, argument in zip(translated_arguments,
+                                                         arguments)
+        ):
+            return annotation
+        elif is_union(annotation):
+            return t.Union[translated_arguments]
+        return translated_origin[translated_arguments
+                                 if len(translated_arguments) != 1
+                                 else translated_arguments[0]]
+
+    def _translate_argument(self, argument: t.Any) -> t.Any:
+        if not isinstance(argument, list):
+            return self.translate(argument)
+        translated_argument = [self.translate(element)
+                               for element in argument]
+        return (argument
+                if all(translated_element is element
+                       for translated_element, element
+                       in zip(translated_argument, argument))
+                else translated_argument)
+
+    def _translate_type_var(self, value: t.Any) -> Annotation:
+        bound = (None
+                 if value.__bound__ is None
+                 else self.translate(value.__bound__))
+        constraints = tuple(map(self.translate, value.__constraints__))
+        return (value
+                if (bound is value.__bound__
+                    and all(translated_constraint is constraint
+                            for translated_constraint, constraint
+                            in zip(constraints, value.__constraints__)))
+                else t.TypeVar(value.__name__, *constraints,  # type: ignore
+                               bound=bound,
+                               covariant=value.__covariant__,
+                               contravariant=value.__contravariant__))
+
+
+_fields_kinds: t.Dict[t.Type[t.Any], str] = {
+    classmethod: 'class method',
+    property: 'property',
+    staticmethod: 'static method',
+    **dict.fromkeys(instance_methods_types, 'method')
+}
+
+
+def _diff_callables(name: str,
+                    old: t.Callable[..., t.Any],
+                    new: t.Callable[..., t.Any],
+                    translator: _Translator) -> Difference:
+    if _is_unchanged(old, new):
+        # unchanged members are not parsed into signatures at all
+        return Difference(name, Change.UNCHANGED, '')
+    try:
+        old_signature = signatures.from_callable(old)
+        new_signature = signatures.from_callable(new)
+        compatible = signatures.is_subtype_of(new_signature, old_signature,
+                                              translator.is_subtype)
+    except (TypeError, ValueError) as error:
+        return Difference(name, Change.UNSUPPORTED, str(error))
+    return (Difference(name, Change.COMPATIBLE, '')
+            if compatible
+            else Difference(name, Change.INCOMPATIBLE,
+                            f'"{new_signature}" is not compatible '
+                            f'with "{old_signature}".'))
+
+
+def _diff_fields(name: str,
+                 old: t.Any,
+                 new: t.Any,
+                 translator: _Translator) -> Difference:
+    old_kind, new_kind = _fields_kinds[type(old)], _fields_kinds.get(type(new))
+    if old_kind != new_kind:
+        return Difference(name, Change.INCOMPATIBLE,
+                          f'{old_kind.capitalize()} is replaced '
+                          f'with {new_kind or "attribute"}.')
+    elif isinstance(old, property):
+        if old.fset is not None and new.fset is None:
+            return Difference(name, Change.INCOMPATIBLE, 'Setter is removed.')
+        elif old.fget is None or new.fget is None:
+            return Difference(name, Change.UNCHANGED, '')
+        return _diff_callables(name, old.fget, new.fget, translator)
+    elif isinstance(old, (classmethod, staticmethod)):
+        return _diff_callables(name, old.__func__, new.__func__, translator)
+    else:
+        return _diff_callables(name, old, new, translator)
+
+
+def _diff_members(name: str,
+                  old: t.Any,
+                  new: t.Any,
+                  translator: _Translator) -> t.Iterator[Difference]:
+    if isinstance(old, type) != isinstance(new, type):
+        yield Difference(name, Change.INCOMPATIBLE,
+                         f'{"Class" if isinstance(old, type) else "Function"}'
+                         f' is replaced with {type(new).__qualname__}.')
+    elif not isinstance(old, type):
+        yield _diff_callables(name, old, new, translator)
+    elif old is new:
+        yield Difference(name, Change.UNCHANGED, '')
+    else:
+        yield _diff_constructors(name, old, new, translator)
+        for field_name in dir(old):
+            if field_name.startswith('_'):
+                continue
+            old_field = _lookup_static(old, field_name)
+            if type(old_field) not in _fields_kinds:
+                continue
+            qualified_name = f'{name}.{field_name}'
+            try:
+                new_field = _lookup_static(new, field_name)
+            except AttributeError:
+                yield Difference(qualified_name, Change.REMOVED, '')
+            else:
+                yield _diff_fields(qualified_name, old_field, new_field,
+                                   translator)
+
+
+def _diff_constructors(name: str,
+                       old: type,
+                       new: type,
+                       translator: _Translator) -> Difference:
+    if all(_is_unchanged(_lookup_static(old, constructor_name),
+                         _lookup_static(new, constructor_name))
+           for constructor_name in ('__init__', '__new__')):
+        return Difference(name, Change.UNCHANGED, '')
+    return _diff_callables(name, old, new, translator)
+
+
+def _is_unchanged(old: t.Any, new: t.Any) -> bool:
+    if old is new:
+        return True
+    old_fingerprint = _to_fingerprint(old)
+    return (old_fingerprint is not None
+            and old_fingerprint == _to_fingerprint(new))
+
+
+def _is_package_module(module_name: str, package_name: str) -> bool:
+    return (module_name == package_name
+            or module_name.startswith(package_name + '.'))
+
+
+def _lookup_static(cls: type, name: str) -> t.Any:
+    for base in cls.__mro__:
+        try:
+            return vars(base)[name]
+        except KeyError:
+            continue
+    raise AttributeError(name)
+
+
+def _to_classes_correspondence(
+        old_modules: t.Mapping[str, types.ModuleType],
+        new_modules: t.Mapping[str, types.ModuleType]
+) -> t.Dict[type, type]:
+    old_classes = _to_classes_by_names(old_modules)
+    return {new_class: old_classes[name]
+            for name, new_class in _to_classes_by_names(new_modules).items()
+            if name in old_classes}
+
+
+def _to_classes_by_names(
+        modules: t.Mapping[str, types.ModuleType]
+) -> t.Dict[t.Tuple[str, str], type]:
+    classes: t.Dict[type, None] = {}
+    for module_name, module in modules.items():
+        collect_namespace_classes(vars(module), module_name, '', classes)
+    return {(cls.__module__, cls.__qualname__): cls for cls in classes}
+
+
+def _to_fingerprint(value: t.Any) -> t.Optional[t.Hashable]:
+    # code objects are compared by contents regardless of their files,
+    # while annotations refer to classes of different versions,
+    # so they are compared by representations
+    code = getattr(value, '__code__', None)
+    if code is None:
+        return None
+    return (code, len(getattr(value, '__defaults__', None) or ()),
+            tuple(getattr(value, '__kwdefaults__', None) or ()),
+            tuple((name, repr(annotation))
+                  for name, annotation
+                  in getattr(value, '__annotations__', {}).items()))
+
+
+def _to_public_members(module: types.ModuleType) -> t.Dict[str, t.Any]:
+    namespace = vars(module)
+    names = namespace.get('__all__')
+    if names is None:
+        names = [name for name in namespace if not name.startswith('_')]
+    package_name = module.__name__.partition('.')[0]
+    # re-exported members of other packages are not diffed
+    return {name: namespace[name]
+            for name in names
+            if (name in namespace
+                and isinstance(namespace[name], _members_types)
+                and _is_package_module(getattr(namespace[name], '__module__',
+                                               None) or '',
+                                       package_name))}
+
+
+_members_types = (type, *instance_methods_types)
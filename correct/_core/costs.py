@@ -0,0 +1,99 @@
+import types
+import typing as t
+from collections import abc
+
+import typing_extensions as te
+
+from .caching import WeakStripedCache
+from .hints import Annotation
+from .utils import (to_arguments,
+                    to_base,
+                    unpack_type_var)
+
+_T = t.TypeVar('_T')
+
+CALLABLE_COST = 4
+PROTOCOL_COST = 16
+
+
+def estimate(annotation: Annotation) -> int:
+    return _costs_cache.lookup((annotation,), _estimate)
+
+
+def estimate_field(value: t.Any) -> int:
+    if isinstance(value, property):
+        return CALLABLE_COST * (1 + (value.fset is not None)
+                                + (value.fdel is not None))
+    elif isinstance(value, (classmethod, staticmethod,
+                            types.BuiltinFunctionType,
+                            types.ClassMethodDescriptorType,
+                            types.FunctionType, types.MethodDescriptorType,
+                            types.WrapperDescriptorType)):
+        return CALLABLE_COST
+    else:
+        return estimate(value)
+
+
+def order(values: t.Sequence[_T],
+          cost: t.Callable[[_T], t.Any]) -> t.Sequence[_T]:
+    return values if len(values) < 2 else sorted(values,
+                                                 key=cost)
+
+
+def order_conjuncts(
+        lefts: t.Sequence[Annotation], rights: t.Sequence[Annotation]
+) -> t.Sequence[Annotation]:
+    # annotations identical to some of the others
+    # can not falsify a conjunction, so they go last
+    return order(lefts,
+                 lambda left: (any(left is right for right in rights),
+                               estimate(left)))
+
+
+def order_disjuncts(
+        left: Annotation, rights: t.Sequence[Annotation]
+) -> t.Sequence[Annotation]:
+    # annotation identical to the other one settles a disjunction,
+    # so it goes first
+    return order(rights,
+                 lambda right: (right is not left, estimate(right)))
+
+
+def order_pairs(lefts: t.Iterable[Annotation],
+                rights: t.Iterable[Annotation],
+                *rest: t.Iterable[t.Any]) -> t.Sequence[t.Tuple[t.Any, ...]]:
+    return order(list(zip(lefts, rights, *rest)), _estimate_pair)
+
+
+def _estimate(key: t.Tuple[Annotation]) -> int:
+    value, = key
+    if (value is t.Any or value is None or value is t.NoReturn
+            or value is te.Self or value is Ellipsis):
+        return 0
+    elif isinstance(value, t.TypeVar):
+        return 1 + estimate(unpack_type_var(value))
+    base = to_base(value)
+    if base is None or base is value:
+        # e.g. ``typing.Generic`` is its own origin
+        return (PROTOCOL_COST
+                if getattr(value, '_is_protocol', False)
+                else 1)
+    return ((CALLABLE_COST if base is abc.Callable else estimate(base))
+            + _estimate_arguments(to_arguments(value)))
+
+
+def _estimate_arguments(arguments: t.Iterable[t.Any]) -> int:
+    return sum(_estimate_arguments(argument)
+               if isinstance(argument, list)
+               else estimate(argument)
+               for argument in arguments)
+
+
+def _estimate_pair(pair: t.Tuple[t.Any, ...]) -> t.Tuple[bool, int]:
+    left, right, *_ = pair
+    return left is right, estimate(left) + estimate(right)
+
+
+_costs_cache: WeakStripedCache[t.Tuple[Annotation], int] = (
+    WeakStripedCache(capacity=1 << 14)
+)
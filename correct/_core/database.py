@@ -0,0 +1,125 @@
+import pickle
+import sys
+import types
+import typing as t
+import zlib
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+
+import paradigm
+from paradigm.base import (OverloadedSignature,
+                           PlainSignature,
+                           signature_from_callable)
+
+Signature = t.Union[OverloadedSignature, PlainSignature]
+
+MODULES_NAMES = ('builtins', 'collections', 'functools', 'itertools', 'math',
+                 'operator')
+PATH = (Path(__file__).parent / 'data'
+        / f'signatures-{sys.implementation.cache_tag}.pickle.zlib')
+
+
+def lookup(value: t.Callable[..., t.Any]) -> t.Optional[Signature]:
+    qualified_name = _to_qualified_name(value)
+    if qualified_name is None:
+        return None
+    try:
+        raw_signature = _load(PATH)[qualified_name]
+    except KeyError:
+        return None
+    if _resolve(qualified_name) is not value:
+        return None
+    try:
+        return pickle.loads(raw_signature)
+    except Exception:
+        return None
+
+
+def collect(
+        modules_names: t.Iterable[str] = MODULES_NAMES
+) -> t.Dict[str, bytes]:
+    result = {}
+    for module_name in modules_names:
+        for value in vars(import_module(module_name)).values():
+            if isinstance(value, type):
+                candidates = [value, *[field
+                                       for field in vars(value).values()
+                                       if isinstance(field,
+                                                     _builtin_methods_types)]]
+            elif isinstance(value, types.BuiltinFunctionType):
+                candidates = [value]
+            else:
+                continue
+            for candidate in candidates:
+                qualified_name = _to_qualified_name(candidate)
+                if (qualified_name is None
+                        or _resolve(qualified_name) is not candidate):
+                    continue
+                try:
+                    raw_signature = pickle.dumps(
+                            signature_from_callable(candidate),
+                            protocol=_PICKLE_PROTOCOL
+                    )
+                except Exception:
+                    continue
+                # signatures referring to placeholders created by "paradigm"
+                # at runtime can not be restored in other processes
+                if b'paradigm._core.arboreal' not in raw_signature:
+                    result[qualified_name] = raw_signature
+    return result
+
+
+def dump(entries: t.Dict[str, bytes], path: Path = PATH) -> None:
+    path.parent.mkdir(parents=True,
+                      exist_ok=True)
+    path.write_bytes(zlib.compress(
+            pickle.dumps((paradigm.__version__, entries),
+                         protocol=_PICKLE_PROTOCOL),
+            level=9
+    ))
+
+
+_PICKLE_PROTOCOL = 4
+_builtin_methods_types = (types.BuiltinFunctionType,
+                          types.ClassMethodDescriptorType,
+                          types.MethodDescriptorType,
+                          types.WrapperDescriptorType)
+
+
+@lru_cache(maxsize=None)
+def _load(path: Path) -> t.Dict[str, bytes]:
+    try:
+        version, entries = pickle.loads(zlib.decompress(path.read_bytes()))
+    except Exception:
+        return {}
+    return entries if version == paradigm.__version__ else {}
+
+
+def _resolve(qualified_name: str) -> t.Any:
+    module_name, *path = qualified_name.split('.')
+    result: t.Any = sys.modules.get(module_name)
+    for name in path:
+        result = (vars(result).get(name)
+                  if isinstance(result, type)
+                  else getattr(result, name, None))
+    return result
+
+
+def _to_qualified_name(value: t.Any) -> t.Optional[str]:
+    owner = getattr(value, '__self__', None)
+    if owner is not None and not isinstance(owner, types.ModuleType):
+        # bound methods have signatures without bound parameter
+        return None
+    owner_type = getattr(value, '__objclass__', None)
+    module_name = (getattr(value, '__module__', None)
+                   if owner_type is None
+                   else owner_type.__module__)
+    qualified_name = getattr(value, '__qualname__', None)
+    return (f'{module_name}.{qualified_name}'
+            if module_name in MODULES_NAMES and qualified_name is not None
+            else None)
+
+
+if __name__ == '__main__':
+    dump(collect())
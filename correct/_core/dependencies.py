@@ -0,0 +1,96 @@
+import types
+import typing as t
+from contextvars import ContextVar
+
+from .caching import WeakStripedCache
+from .utils import (to_arguments,
+                    to_base,
+                    unpack_type_var)
+
+
+class Dependency(t.NamedTuple):
+    module: str
+    name: str
+
+
+class TrackedResult(t.NamedTuple):
+    value: bool
+    dependencies: t.FrozenSet[Dependency]
+
+
+active_dependencies: ContextVar[t.Optional[t.Set[Dependency]]] = ContextVar(
+        'active_dependencies',
+        default=None
+)
+
+
+def run_tracking(function: t.Callable[[], bool]) -> TrackedResult:
+    dependencies: t.Set[Dependency] = set()
+    token = active_dependencies.set(dependencies)
+    try:
+        value = function()
+    finally:
+        active_dependencies.reset(token)
+    return TrackedResult(value, frozenset(dependencies))
+
+
+def to_dependencies(value: t.Any) -> t.FrozenSet[Dependency]:
+    return _dependencies_cache.lookup((value,), _to_dependencies)
+
+
+_callables_types = (types.BuiltinFunctionType, types.BuiltinMethodType,
+                    types.ClassMethodDescriptorType, types.FunctionType,
+                    types.MethodDescriptorType, types.WrapperDescriptorType)
+
+
+def _to_dependencies(key: t.Tuple[t.Any]) -> t.FrozenSet[Dependency]:
+    value, = key
+    if isinstance(value, type):
+        # subclass relations & inherited members depend on all the ancestors
+        return frozenset(Dependency(ancestor.__module__, ancestor.__qualname__)
+                         for ancestor in value.__mro__)
+    elif isinstance(value, t.TypeVar):
+        return to_dependencies(unpack_type_var(value))
+    elif isinstance(value, (classmethod, staticmethod)):
+        return to_dependencies(value.__func__)
+    elif isinstance(value, property):
+        return frozenset().union(*[to_dependencies(accessor)
+                                   for accessor in (value.fget, value.fset,
+                                                    value.fdel)
+                                   if accessor is not None])
+    elif isinstance(value, _callables_types):
+        return _callable_to_dependencies(value)
+    base = to_base(value)
+    return (frozenset()
+            if base is None
+            else to_dependencies(base).union(
+                    *_arguments_to_dependencies(to_arguments(value))
+            ))
+
+
+def _arguments_to_dependencies(
+        arguments: t.Iterable[t.Any]
+) -> t.Iterator[t.FrozenSet[Dependency]]:
+    for argument in arguments:
+        if isinstance(argument, list):
+            yield from _arguments_to_dependencies(argument)
+        else:
+            yield to_dependencies(argument)
+
+
+def _callable_to_dependencies(
+        value: t.Callable[..., t.Any]
+) -> t.FrozenSet[Dependency]:
+    owner = getattr(value, '__objclass__', None)
+    module_name = (getattr(value, '__module__', None)
+                   if owner is None
+                   else owner.__module__)
+    qualified_name = getattr(value, '__qualname__', None)
+    return (frozenset({Dependency(module_name, qualified_name)})
+            if module_name is not None and qualified_name is not None
+            else frozenset())
+
+
+_dependencies_cache: WeakStripedCache[
+    t.Tuple[t.Any], t.FrozenSet[Dependency]
+] = WeakStripedCache(capacity=1 << 14)
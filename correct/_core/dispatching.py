@@ -0,0 +1,108 @@
+import sys
+import typing as t
+
+from paradigm.base import (OptionalParameter,
+                           ParameterKind,
+                           PlainSignature)
+
+from . import signatures
+from .caching import WeakStripedCache
+from .hints import (Annotation,
+                    Specialization)
+from .indexing import SubtypeIndex
+from .utils import annotation_repr
+
+_T = t.TypeVar('_T')
+Implementation = t.Callable[..., _T]
+
+
+class MultiDispatcher(t.Generic[_T]):
+    __slots__ = ('_cache', '_index')
+
+    def __init__(
+            self, is_subtype: t.Callable[[Annotation, Annotation], bool]
+    ) -> None:
+        # argument types are held weakly,
+        # so dynamically created classes are not kept alive by dispatchers
+        self._cache: WeakStripedCache[t.Tuple[type, ...],
+                                      Implementation[_T]] = WeakStripedCache(
+                capacity=1 << 12
+        )
+        self._index: SubtypeIndex[Implementation[_T]] = SubtypeIndex(
+                is_subtype
+        )
+
+    def __call__(self, *args: t.Any, **kwargs: t.Any) -> _T:
+        return self.dispatch(*map(type, args))(*args, **kwargs)
+
+    def dispatch(self, *types: type) -> Implementation[_T]:
+        return self._cache.lookup(types, self._resolve)
+
+    def register(self,
+                 implementation: Implementation[_T]) -> Implementation[_T]:
+        signature = signatures.from_callable(implementation)
+        if not isinstance(signature, PlainSignature):
+            raise TypeError('Overloaded implementations are not supported: '
+                            f'"{implementation!r}".')
+        positionals = [
+            parameter
+            for parameter in signature.parameters
+            if (parameter.kind is ParameterKind.POSITIONAL_ONLY
+                or parameter.kind is ParameterKind.POSITIONAL_OR_KEYWORD)
+        ]
+        annotations = [parameter.annotation for parameter in positionals]
+        if any(isinstance(annotation, str) for annotation in annotations):
+            # postponed annotations are resolved
+            # within the namespace of the implementation
+            hints = t.get_type_hints(implementation)
+            annotations = [hints[parameter.name]
+                           if isinstance(annotation, str)
+                           else annotation
+                           for parameter, annotation in zip(positionals,
+                                                            annotations)]
+        annotations = [_normalize_annotation(annotation)
+                       for annotation in annotations]
+        required_count = sum(not isinstance(parameter, OptionalParameter)
+                             for parameter in positionals)
+        for count in range(required_count, len(annotations) + 1):
+            self._index.register(t.Tuple[tuple(annotations[:count])]
+                                 if count
+                                 else t.Tuple[()],
+                                 implementation)
+        self._cache.clear()
+        return implementation
+
+    def _resolve(self, types: t.Tuple[type, ...]) -> Implementation[_T]:
+        candidates = self._index.lookup(_to_tuple_annotation(types))
+        if not candidates:
+            raise TypeError('No implementation found for arguments of types: '
+                            f'{", ".join(map(annotation_repr, types))}.')
+        elif len({implementation for _, implementation in candidates}) > 1:
+            candidates_annotations_reprs = [
+                annotation_repr(annotation) for annotation, _ in candidates
+            ]
+            raise TypeError(
+                    'Ambiguous implementations for arguments of types '
+                    f'{", ".join(map(annotation_repr, types))}: '
+                    f'{", ".join(candidates_annotations_reprs)}.'
+            )
+        _, result = candidates[0]
+        return result
+
+
+if sys.version_info < (3, 9):
+    def _to_tuple_annotation(types: t.Tuple[type, ...]) -> Annotation:
+        return t.Tuple[types] if types else t.Tuple[()]
+else:
+    def _to_tuple_annotation(types: t.Tuple[type, ...]) -> Annotation:
+        # unlike ``typing.Tuple`` specializations are not cached,
+        # so argument types are not kept alive
+        return Specialization(tuple, types)
+
+
+def _normalize_annotation(value: Annotation) -> Annotation:
+    return (object
+            if value is t.Any
+            else (type(None)
+                  if value is None
+                  else value))
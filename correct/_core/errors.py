@@ -0,0 +1,24 @@
+# exceptions are defined apart from compiled modules,
+# since mypyc does not support subclassing of builtin exceptions
+from .hints import Annotation
+from .utils import annotation_repr
+
+
+class UnsupportedAnnotation(TypeError):
+    def __init__(self, annotation: Annotation) -> None:
+        super().__init__(annotation)
+        self.annotation = annotation
+
+    def __str__(self) -> str:
+        return f'Unsupported annotation: "{annotation_repr(self.annotation)}".'
+
+
+class UnsupportedTypes(TypeError):
+    def __init__(self, left: Annotation, right: Annotation) -> None:
+        super().__init__(left, right)
+        self.left, self.right = left, right
+
+    def __str__(self) -> str:
+        return ('Unsupported types: '
+                f'"{annotation_repr(self.left)}", '
+                f'"{annotation_repr(self.right)}".')
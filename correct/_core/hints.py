@@ -3,9 +3,7 @@ import types
 import typing as t
 
 GenericAlias: t.Any = type(t.List)
-_T = t.TypeVar('_T')
-LegacySpecialization: t.Any = type(t.List[_T])
-del _T
+LegacySpecialization: t.Any = type(t.List[int])
 if sys.version_info < (3, 9):
     Specialization: t.Any = LegacySpecialization
 else:
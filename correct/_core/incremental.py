@@ -0,0 +1,82 @@
+import typing as t
+
+from .caching import invalidate
+from .dependencies import (Dependency,
+                           TrackedResult)
+from .hints import Annotation
+
+_KT = t.TypeVar('_KT')
+
+
+class Rechecker(t.Generic[_KT]):
+    __slots__ = '_dependents', '_is_subtype', '_results'
+
+    def __init__(
+            self,
+            is_subtype: t.Callable[[Annotation, Annotation], TrackedResult]
+    ) -> None:
+        self._dependents: t.Dict[Dependency, t.Set[_KT]] = {}
+        self._is_subtype = is_subtype
+        self._results: t.Dict[_KT, TrackedResult] = {}
+
+    def __contains__(self, key: _KT) -> bool:
+        return key in self._results
+
+    def __getitem__(self, key: _KT) -> bool:
+        return self._results[key].value
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def recheck(self,
+                pairs: t.Mapping[_KT, t.Tuple[Annotation, Annotation]],
+                *,
+                classes: t.Iterable[type] = (),
+                modules: t.Iterable[str] = ()) -> t.Dict[_KT, bool]:
+        classes, modules = tuple(classes), tuple(modules)
+        affected = self.to_affected(classes=classes,
+                                    modules=modules)
+        if classes or modules:
+            # changed classes may still be referenced by cached entries
+            invalidate()
+        for key in [key for key in self._results if key not in pairs]:
+            self._remove(key)
+        result = {}
+        for key, (left, right) in pairs.items():
+            if key in affected or key not in self._results:
+                self._remove(key)
+                self._add(key, self._is_subtype(left, right))
+                result[key] = self._results[key].value
+        return result
+
+    def to_affected(self,
+                    *,
+                    classes: t.Iterable[type] = (),
+                    modules: t.Iterable[str] = ()) -> t.Set[_KT]:
+        changed_dependencies = {Dependency(cls.__module__, cls.__qualname__)
+                                for cls in classes}
+        modules = set(modules)
+        result: t.Set[_KT] = set()
+        for dependency, dependents in self._dependents.items():
+            if (dependency in changed_dependencies
+                    or dependency.module in modules):
+                result.update(dependents)
+        return result
+
+    def to_dependencies(self, key: _KT) -> t.FrozenSet[Dependency]:
+        return self._results[key].dependencies
+
+    def _add(self, key: _KT, result: TrackedResult) -> None:
+        self._results[key] = result
+        for dependency in result.dependencies:
+            self._dependents.setdefault(dependency, set()).add(key)
+
+    def _remove(self, key: _KT) -> None:
+        result = self._results.pop(key, None)
+        if result is None:
+            return
+        for dependency in result.dependencies:
+            dependents = self._dependents[dependency]
+            dependents.discard(key)
+            if not dependents:
+                del self._dependents[dependency]
@@ -0,0 +1,119 @@
+import threading
+import typing as t
+from abc import ABCMeta
+from collections import abc
+
+from .caching import WeakStripedCache
+from .hints import Annotation
+from .predicates import (is_generic_alias,
+                         is_record,
+                         is_specialization,
+                         is_type,
+                         is_union)
+from .utils import (to_base,
+                    to_variants)
+
+_T = t.TypeVar('_T')
+_Entry = t.Tuple[Annotation, _T]
+
+
+class SubtypeIndex(t.Generic[_T]):
+    __slots__ = ('_abstract_buckets', '_cache', '_entries', '_is_subtype',
+                 '_lock', '_nominal_buckets', '_structural_entries')
+
+    def __init__(
+            self, is_subtype: t.Callable[[Annotation, Annotation], bool]
+    ) -> None:
+        self._abstract_buckets: t.Dict[type, t.List[int]] = {}
+        self._cache: WeakStripedCache[
+            t.Tuple[Annotation], t.Sequence[_Entry[_T]]
+        ] = WeakStripedCache(capacity=1 << 12)
+        self._entries: t.List[_Entry[_T]] = []
+        self._is_subtype = is_subtype
+        self._lock = threading.Lock()
+        self._nominal_buckets: t.Dict[type, t.List[int]] = {}
+        self._structural_entries: t.List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, annotation: Annotation) -> t.Sequence[_Entry[_T]]:
+        return self._cache.lookup((annotation,), self._lookup)
+
+    def register(self, annotation: Annotation, value: _T) -> None:
+        with self._lock:
+            index = len(self._entries)
+            self._entries.append((annotation, value))
+            for variant in (to_variants(annotation)
+                            if is_union(annotation)
+                            else (annotation,)):
+                base = _to_nominal_base(variant)
+                if base is None or is_record(base):
+                    # records are matched by fields
+                    # regardless of ancestors of looked up classes
+                    self._structural_entries.append(index)
+                elif isinstance(base, ABCMeta):
+                    # lookups iterate over abstract buckets,
+                    # so they are replaced instead of being modified in place
+                    self._abstract_buckets = {
+                        **self._abstract_buckets,
+                        base: [*self._abstract_buckets.get(base, ()), index]
+                    }
+                else:
+                    self._nominal_buckets.setdefault(base, []).append(index)
+            self._cache.clear()
+
+    def _lookup(
+            self, key: t.Tuple[Annotation]
+    ) -> t.Sequence[_Entry[_T]]:
+        annotation, = key
+        entries, is_subtype = self._entries, self._is_subtype
+        matches = [
+            index
+            for index in sorted(self._to_candidates_indices(annotation))
+            if is_subtype(annotation, entries[index][0])
+        ]
+        return tuple(
+                entries[index]
+                for index in matches
+                if not any(_is_more_specific(entries[other_index][0],
+                                             entries[index][0], is_subtype)
+                           for other_index in matches
+                           if other_index != index)
+        )
+
+    def _to_candidates_indices(self, annotation: Annotation) -> t.Set[int]:
+        base = _to_nominal_base(annotation)
+        if base is None:
+            return set(range(len(self._entries)))
+        result = set(self._structural_entries)
+        nominal_buckets = self._nominal_buckets
+        for ancestor in base.__mro__:
+            result.update(nominal_buckets.get(ancestor, ()))
+        for abstract_base, indices in self._abstract_buckets.items():
+            if issubclass(base, abstract_base):
+                result.update(indices)
+        return result
+
+
+def _is_more_specific(
+        left: Annotation,
+        right: Annotation,
+        is_subtype: t.Callable[[Annotation, Annotation], bool]
+) -> bool:
+    return left is not t.Any and (right is t.Any
+                                  or (is_subtype(left, right)
+                                      and not is_subtype(right, left)))
+
+
+def _to_nominal_base(annotation: Annotation) -> t.Optional[type]:
+    if is_type(annotation):
+        return annotation
+    elif is_generic_alias(annotation) or is_specialization(annotation):
+        base = to_base(annotation)
+        # callables and types of types are matched by classes themselves
+        return (None
+                if base is abc.Callable or base is type or not is_type(base)
+                else base)
+    else:
+        return None
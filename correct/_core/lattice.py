@@ -0,0 +1,110 @@
+import typing as t
+
+from .hints import Annotation
+from .predicates import (generics_roots,
+                         is_union)
+from .utils import (to_base,
+                    to_variants)
+
+
+class Joiner:
+    __slots__ = ('_covered', '_covered_capacity', '_is_subtype',
+                 '_max_variants', '_variants')
+
+    def __init__(self,
+                 is_subtype: t.Callable[[Annotation, Annotation], bool],
+                 *,
+                 covered_capacity: int = 1024,
+                 max_variants: int = 64) -> None:
+        assert covered_capacity >= 0, covered_capacity
+        assert max_variants > 0, max_variants
+        self._covered: t.Dict[Annotation, None] = {}
+        self._covered_capacity = covered_capacity
+        self._is_subtype = is_subtype
+        self._max_variants = max_variants
+        self._variants: t.List[Annotation] = []
+
+    @property
+    def result(self) -> Annotation:
+        variants = self._variants
+        return (t.NoReturn
+                if not variants
+                else (variants[0]
+                      if len(variants) == 1
+                      else t.Union[tuple(variants)]))
+
+    @property
+    def variants(self) -> t.Sequence[Annotation]:
+        return tuple(self._variants)
+
+    def add(self, annotation: Annotation) -> bool:
+        if annotation in self._covered:
+            return False
+        result = False
+        for variant in (to_variants(annotation)
+                        if is_union(annotation)
+                        else (annotation,)):
+            result = self._add_variant(variant) or result
+        self._cover(annotation)
+        return result
+
+    def _add_variant(self, variant: Annotation) -> bool:
+        variants = self._variants
+        if variants and variants[0] is t.Any:
+            return False
+        elif variant is t.Any:
+            self._variants = [t.Any]
+            return True
+        elif any(self._is_subtype(variant, candidate)
+                 for candidate in variants):
+            return False
+        variants = [candidate
+                    for candidate in variants
+                    if not self._is_subtype(candidate, variant)]
+        variants.append(variant)
+        self._variants = (
+            [self._to_common_supertype(variants)]
+            if len(variants) > self._max_variants
+            else variants
+        )
+        return True
+
+    def _to_common_supertype(
+            self, variants: t.Sequence[Annotation]
+    ) -> Annotation:
+        # the most specific ancestor of the first variant's class
+        # which is a supertype of every variant
+        first_base = variants[0]
+        if not isinstance(first_base, type):
+            first_base = to_base(first_base)
+        if isinstance(first_base, type):
+            for candidate in first_base.__mro__:
+                if candidate in generics_roots:
+                    continue
+                try:
+                    is_common = all(self._is_subtype(variant, candidate)
+                                    for variant in variants)
+                except TypeError:
+                    # unsupported candidates are skipped
+                    continue
+                if is_common:
+                    return candidate
+        return t.Any
+
+    def _cover(self, annotation: Annotation) -> None:
+        covered = self._covered
+        if len(covered) >= self._covered_capacity:
+            if not covered:
+                return
+            del covered[next(iter(covered))]
+        covered[annotation] = None
+
+
+def join(left: Annotation,
+         right: Annotation,
+         is_subtype: t.Callable[[Annotation, Annotation], bool]) -> Annotation:
+    joiner = Joiner(is_subtype,
+                    covered_capacity=0)
+    joiner.add(left)
+    joiner.add(right)
+    return joiner.result
@@ -0,0 +1,138 @@
+import typing as t
+from abc import ABCMeta
+
+import numpy as np
+
+try:
+    from _abc import _get_dump  # type: ignore[import]
+except ImportError:
+    def _get_dump(cls: ABCMeta) -> t.Tuple[t.Any, ...]:
+        return (cls._abc_registry,)  # type: ignore[attr-defined]
+
+
+class SubclassMatrix:
+    __slots__ = '_bits', '_classes', '_indices'
+
+    def __init__(self, classes: t.Iterable[type]) -> None:
+        self._classes = tuple(dict.fromkeys(classes))
+        self._indices = {cls: index for index, cls in enumerate(self._classes)}
+        size = len(self._classes)
+        self._bits = np.zeros((size, -(-size // 8)),
+                              dtype=np.uint8)
+        rows: t.List[int] = []
+        columns: t.List[int] = []
+        for row, cls in enumerate(self._classes):
+            ancestors_indices = [self._indices[ancestor]
+                                 for ancestor in cls.__mro__
+                                 if ancestor in self._indices]
+            rows.extend([row] * len(ancestors_indices))
+            columns.extend(ancestors_indices)
+        self._set(np.array(rows,
+                           dtype=np.intp),
+                  np.array(columns,
+                           dtype=np.intp))
+        # virtual subclasses of abstract classes are not reflected in MROs,
+        # so they are checked explicitly against classes which can have them
+        sources_flags: t.Dict[type, bool] = {}
+        sources = np.array([index
+                            for index, cls in enumerate(self._classes)
+                            if (isinstance(cls, ABCMeta)
+                                and _can_have_virtual_subclasses(
+                                        cls, sources_flags
+                                ))],
+                           dtype=np.intp)
+        if not sources.size:
+            return
+        virtual = np.array(
+                [[_is_virtual_subclass(candidate, self._classes[source])
+                  for source in sources]
+                 for candidate in self._classes],
+                dtype=bool
+        ).reshape(size, sources.size)
+        rows_array, sources_positions = np.nonzero(virtual)
+        self._set(rows_array, sources[sources_positions])
+
+    @property
+    def classes(self) -> t.Sequence[type]:
+        return self._classes
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def is_subclass(self, left: type, right: type) -> bool:
+        column = self._indices[right]
+        return bool(self._bits[self._indices[left], column >> 3]
+                    & (0x80 >> (column & 7)))
+
+    def subclasses(self, value: type) -> t.List[type]:
+        return self._select(self.to_subclasses_mask(value))
+
+    def superclasses(self, value: type) -> t.List[type]:
+        return self._select(self.to_superclasses_mask(value))
+
+    def to_array(self, *, packed: bool = False) -> np.ndarray:
+        return (self._bits.copy()
+                if packed
+                else np.unpackbits(self._bits,
+                                   axis=1,
+                                   count=len(self._classes)).astype(bool))
+
+    def to_subclasses_mask(self, value: type) -> np.ndarray:
+        column = self._indices[value]
+        return (self._bits[:, column >> 3] & (0x80 >> (column & 7))) != 0
+
+    def to_superclasses_mask(self, value: type) -> np.ndarray:
+        return np.unpackbits(self._bits[self._indices[value]],
+                             count=len(self._classes)).astype(bool)
+
+    def _select(self, mask: np.ndarray) -> t.List[type]:
+        classes = self._classes
+        return [classes[index] for index in np.flatnonzero(mask)]
+
+    def _set(self, rows: np.ndarray, columns: np.ndarray) -> None:
+        np.bitwise_or.at(self._bits, (rows, columns >> 3),
+                         (0x80 >> (columns & 7)).astype(np.uint8))
+
+
+def _can_have_virtual_subclasses(cls: type,
+                                 cache: t.Dict[type, bool]) -> bool:
+    # abstract classes consult their subclasses as well,
+    # so the whole subtree is traversed
+    stack = [cls]
+    while stack:
+        candidate = stack[-1]
+        if candidate in cache:
+            stack.pop()
+            continue
+        subclasses: t.List[type] = type.__subclasses__(candidate)
+        unvisited_subclasses = [subclass
+                                for subclass in subclasses
+                                if subclass not in cache]
+        if unvisited_subclasses:
+            stack.extend(unvisited_subclasses)
+            continue
+        stack.pop()
+        cache[candidate] = (_has_own_virtual_subclasses(candidate)
+                            or any(cache[subclass]
+                                   for subclass in subclasses))
+    return cache[cls]
+
+
+def _has_own_virtual_subclasses(cls: type) -> bool:
+    # inherited subclass hooks are assumed to be guarded
+    # like the ones of "collections.abc" classes & protocols are,
+    # so only classes defining hooks or having registered subclasses count
+    namespace = vars(cls)
+    return isinstance(cls, ABCMeta) and (
+        bool(_get_dump(cls)[0])
+        or ('__subclasshook__' in namespace
+            and namespace.get('_is_protocol', True))
+    )
+
+
+def _is_virtual_subclass(value: type, cls: type) -> bool:
+    try:
+        return issubclass(value, cls)
+    except TypeError:
+        # e.g. protocols which are not runtime checkable
+        return False
@@ -0,0 +1,187 @@
+import pkgutil
+import sys
+import types
+import typing as t
+from importlib import import_module
+from multiprocessing import Pool
+
+from .checking import Status
+from .predicates import (is_field_subtype,
+                         instance_methods_types)
+from .utils import annotation_repr
+from .variance import Variance
+
+
+class Override(t.NamedTuple):
+    owner: type
+    base: type
+    name: str
+
+
+class OverrideCheck(t.NamedTuple):
+    override: Override
+    status: Status
+    reason: str
+
+
+def check_overrides(classes: t.Iterable[type],
+                    *,
+                    jobs: int = 1,
+                    chunk_size: int = 1024) -> t.List[OverrideCheck]:
+    assert jobs > 0, jobs
+    assert chunk_size > 0, chunk_size
+    # members are shared by aliases & re-exported classes,
+    # so each distinct pair of members is checked once
+    representatives: t.Dict[t.Tuple[t.Any, t.Any], Override] = {}
+    overrides = to_overrides(classes)
+    for override in overrides:
+        representatives.setdefault(_to_members(override), override)
+    outcomes = dict(zip(representatives,
+                        _check_representatives(
+                                list(representatives.values()), jobs,
+                                chunk_size
+                        )))
+    return [OverrideCheck(override, status,
+                          _to_reason(override, status, error_message))
+            for override in overrides
+            for status, error_message in [outcomes[_to_members(override)]]]
+
+
+def collect_classes(package_name: str) -> t.List[type]:
+    result: t.Dict[type, None] = {}
+    for module in walk_package(import_module(package_name)):
+        collect_namespace_classes(vars(module), module.__name__, '', result)
+    return list(result)
+
+
+def collect_namespace_classes(namespace: t.Mapping[str, t.Any],
+                              module_name: str,
+                              qualified_name_prefix: str,
+                              result: t.Dict[type, None]) -> None:
+    for name, value in namespace.items():
+        if (isinstance(value, type)
+                and value.__module__ == module_name
+                and value.__qualname__ == qualified_name_prefix + name
+                and value not in result):
+            result[value] = None
+            collect_namespace_classes(vars(value), module_name,
+                                      value.__qualname__ + '.', result)
+
+
+def to_overrides(classes: t.Iterable[type]) -> t.List[Override]:
+    result: t.Dict[Override, None] = {}
+    for owner in dict.fromkeys(classes):
+        for name, member in vars(owner).items():
+            if name in _exempt_names or not isinstance(member, _fields_types):
+                continue
+            # every base is checked for multiple inheritance
+            # to cover all the definitions which are overridden
+            for direct_base in owner.__bases__:
+                base = next((ancestor
+                             for ancestor in direct_base.__mro__
+                             if name in vars(ancestor)),
+                            None)
+                if (base is not None
+                        and isinstance(vars(base)[name], _fields_types)):
+                    result.setdefault(Override(owner, base, name))
+    return list(result)
+
+
+def walk_package(package: types.ModuleType) -> t.List[types.ModuleType]:
+    result = [package]
+    for module_info in pkgutil.walk_packages(getattr(package, '__path__', []),
+                                             prefix=package.__name__ + '.',
+                                             onerror=_skip):
+        if module_info.name.rpartition('.')[2] == '__main__':
+            # entry points run programs on import
+            continue
+        try:
+            result.append(import_module(module_info.name))
+        except (Exception, SystemExit):
+            # modules with missing optional dependencies
+            # or exiting on import (e.g. scripts) are skipped
+            continue
+    return result
+
+
+_Outcome = t.Tuple[Status, t.Optional[str]]
+_fields_types = (classmethod, property, staticmethod, *instance_methods_types)
+_exempt_names = frozenset({'__class_getitem__', '__init__',
+                           '__init_subclass__', '__new__',
+                           '__subclasshook__'})
+
+
+def _check_override(override: Override) -> _Outcome:
+    owner, base, name = override
+    try:
+        result = is_field_subtype(Variance.INVARIANT, Variance.COVARIANT,
+                                  vars(owner)[name], vars(base)[name])
+    except (TypeError, ValueError) as error:
+        # e.g. unsupported annotations or callables without signatures
+        return Status.UNSUPPORTED, str(error)
+    return (Status.SUBTYPE if result else Status.NOT_SUBTYPE), None
+
+
+def _check_overrides_chunk(overrides: t.Sequence[Override]
+                           ) -> t.List[_Outcome]:
+    return [_check_override(override) for override in overrides]
+
+
+def _check_representatives(overrides: t.Sequence[Override],
+                           jobs: int,
+                           chunk_size: int) -> t.List[_Outcome]:
+    if jobs == 1:
+        return _check_overrides_chunk(overrides)
+    # classes are passed to workers by reference,
+    # so the ones which can not be imported by name are checked locally
+    remote_indices = [index
+                      for index, override in enumerate(overrides)
+                      if (_is_importable(override.owner)
+                          and _is_importable(override.base))]
+    remote_indices_set = set(remote_indices)
+    result: t.List[t.Optional[_Outcome]] = [
+        None if index in remote_indices_set else _check_override(override)
+        for index, override in enumerate(overrides)
+    ]
+    chunks = [[overrides[index]
+               for index in remote_indices[offset:offset + chunk_size]]
+              for offset in range(0, len(remote_indices), chunk_size)]
+    if not chunks:
+        return t.cast(t.List[_Outcome], result)
+    with Pool(min(jobs, len(chunks))) as pool:
+        remote_outcomes = [
+            outcome
+            for chunk_outcomes in pool.imap(_check_overrides_chunk, chunks)
+            for outcome in chunk_outcomes
+        ]
+    for index, outcome in zip(remote_indices, remote_outcomes):
+        result[index] = outcome
+    return t.cast(t.List[_Outcome], result)
+
+
+def _is_importable(cls: type) -> bool:
+    value: t.Any = sys.modules.get(cls.__module__)
+    for name in cls.__qualname__.split('.'):
+        value = getattr(value, name, None)
+    return value is cls
+
+
+def _skip(_: str) -> None:
+    pass
+
+
+def _to_members(override: Override) -> t.Tuple[t.Any, t.Any]:
+    owner, base, name = override
+    return vars(owner)[name], vars(base)[name]
+
+
+def _to_reason(override: Override,
+               status: Status,
+               error_message: t.Optional[str]) -> str:
+    if status is Status.UNSUPPORTED:
+        assert error_message is not None, override
+        return error_message
+    owner, base, name = override
+    return (f'"{annotation_repr(owner)}.{name}" is '
+            f'{"" if status is Status.SUBTYPE else "not "}'
+            f'compatible with "{annotation_repr(base)}.{name}".')
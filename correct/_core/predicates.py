@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import enum
+import re
 import sys
 import types
 import typing as t
-from collections import (Counter,
-                         abc)
+from collections import (ChainMap,
+                         Counter,
+                         OrderedDict,
+                         abc,
+                         defaultdict,
+                         deque)
 from functools import partial
 from inspect import isabstract
 
 import typing_extensions as te
 
+from . import costs
+from .budget import active_budget
+from .caching import WeakStripedCache
+from .dependencies import (Dependency,
+                           active_dependencies,
+                           to_dependencies)
+from .errors import (UnsupportedAnnotation,
+                     UnsupportedTypes)
 from .hints import (Annotation,
                     EllipsisType,
                     GenericAlias,
@@ -30,6 +45,131 @@ from .variance import Variance
 def is_subtype(default_left_variance: Variance,
                default_right_variance: Variance,
                left: Annotation, right: Annotation) -> bool:
+    budget = active_budget.get()
+    if budget is not None:
+        budget.spend()
+    dependencies = active_dependencies.get()
+    if dependencies is not None:
+        return _is_tracked_subtype(dependencies, default_left_variance,
+                                   default_right_variance, left, right)
+    result = _prefilter(default_left_variance, default_right_variance, left,
+                        right)
+    if result is None:
+        result = _subtype_results_cache.lookup(
+                (default_left_variance, default_right_variance, left, right),
+                _to_subtype_result
+        )
+    return result
+
+
+def _is_tracked_subtype(dependencies: t.Set[Dependency],
+                        default_left_variance: Variance,
+                        default_right_variance: Variance,
+                        left: Annotation,
+                        right: Annotation) -> bool:
+    result, result_dependencies = _tracked_subtype_results_cache.lookup(
+            (default_left_variance, default_right_variance, left, right),
+            _to_tracked_subtype_result
+    )
+    dependencies.update(result_dependencies)
+    return result
+
+
+def _to_tracked_subtype_result(
+        key: t.Tuple[Variance, Variance, Annotation, Annotation]
+) -> t.Tuple[bool, t.FrozenSet[Dependency]]:
+    default_left_variance, default_right_variance, left, right = key
+    # nested checks record their dependencies into the fresh set,
+    # so cached results carry dependencies of all the checks they made
+    dependencies = {*to_dependencies(left), *to_dependencies(right)}
+    token = active_dependencies.set(dependencies)
+    try:
+        result = _prefilter(default_left_variance, default_right_variance,
+                            left, right)
+        if result is None:
+            result = _to_subtype_result(key)
+    finally:
+        active_dependencies.reset(token)
+    return result, frozenset(dependencies)
+
+
+class PrefilterTier(enum.IntEnum):
+    IDENTITY = enum.auto()
+    EQUALITY = enum.auto()
+    TOP = enum.auto()
+    CLASSES = enum.auto()
+
+
+# updated without locking, so counts are approximate under contention
+prefilter_hits: t.Dict[PrefilterTier, int] = dict.fromkeys(PrefilterTier, 0)
+
+
+def _prefilter(default_left_variance: Variance,
+               default_right_variance: Variance,
+               left: Annotation,
+               right: Annotation) -> t.Optional[bool]:
+    if left is right:
+        if left is t.Any or is_type_var(left):
+            result = True
+        elif not _is_reflexive(default_left_variance, default_right_variance):
+            result = False
+        elif isinstance(left, _annotations_types):
+            result = True
+        else:
+            return None
+        prefilter_hits[PrefilterTier.IDENTITY] += 1
+        return result
+    elif (isinstance(left, _specializations_types)
+          and isinstance(right, _specializations_types)
+          and left == right):
+        prefilter_hits[PrefilterTier.EQUALITY] += 1
+        return _is_reflexive(default_left_variance, default_right_variance)
+    elif left is t.Any or right is t.Any:
+        prefilter_hits[PrefilterTier.TOP] += 1
+        return True
+    # classes are left to class checks,
+    # since ABCs (e.g. ``Hashable``) can accept ``object`` as a subclass
+    elif right is object and left is None:
+        prefilter_hits[PrefilterTier.TOP] += 1
+        return (default_right_variance is Variance.COVARIANT
+                and default_left_variance is not Variance.CONTRAVARIANT)
+    elif left is object and right is None:
+        prefilter_hits[PrefilterTier.TOP] += 1
+        return (default_right_variance is Variance.CONTRAVARIANT
+                and default_left_variance is not Variance.COVARIANT)
+    elif is_type(left) and is_type(right):
+        try:
+            result = (
+                (default_left_variance is Variance.INVARIANT
+                 and issubclass(left, right) and issubclass(right, left))
+                if default_right_variance is Variance.INVARIANT
+                else ((default_left_variance is not Variance.CONTRAVARIANT
+                       and issubclass(left, right))
+                      if default_right_variance is Variance.COVARIANT
+                      else (default_left_variance is not Variance.COVARIANT
+                            and issubclass(right, left)))
+            )
+        except TypeError:
+            # e.g. typed dictionaries do not support class checks
+            return None
+        if not result and is_record(left) and is_record(right):
+            # records which are not nominal subtypes are compared by fields
+            return None
+        prefilter_hits[PrefilterTier.CLASSES] += 1
+        return result
+    else:
+        return None
+
+
+def _is_reflexive(left_variance: Variance, right_variance: Variance) -> bool:
+    return (left_variance is right_variance
+            or left_variance is Variance.INVARIANT)
+
+
+def _to_subtype_result(
+        key: t.Tuple[Variance, Variance, Annotation, Annotation]
+) -> bool:
+    default_left_variance, default_right_variance, left, right = key
     if is_type_var(left):
         left, left_variance = unpack_type_var(left), type_var_to_variance(left)
     else:
@@ -53,6 +193,28 @@ def is_subtype(default_left_variance: Variance,
                                             ~right_variance)))))
 
 
+_specializations_types = (LegacySpecialization, Specialization, UnionType)
+_annotations_types = (type, GenericAlias, *_specializations_types)
+_subtype_results_cache: WeakStripedCache[
+    t.Tuple[Variance, Variance, Annotation, Annotation], bool
+] = WeakStripedCache(capacity=1 << 16)
+_tracked_subtype_results_cache: WeakStripedCache[
+    t.Tuple[Variance, Variance, Annotation, Annotation],
+    t.Tuple[bool, t.FrozenSet[Dependency]]
+] = WeakStripedCache(capacity=1 << 16)
+# predicates are bound once, so recursive checks do not allocate them
+subtype_predicates: t.Dict[
+    t.Tuple[Variance, Variance], t.Callable[[Annotation, Annotation], bool]
+] = {(left_variance, right_variance): partial(is_subtype, left_variance,
+                                              right_variance)
+     for left_variance in Variance
+     for right_variance in Variance}
+# left side is kept invariant,
+# so variances of its type variables (e.g. contravariant ones) are respected
+is_covariant_subtype = subtype_predicates[Variance.INVARIANT,
+                                          Variance.COVARIANT]
+
+
 class AnnotationKind(enum.IntEnum):
     CONSTANT = enum.auto()
     GENERIC_ALIAS = enum.auto()
@@ -79,7 +241,7 @@ def _classify(value: Annotation) -> AnnotationKind:
     elif is_union(value):
         return AnnotationKind.UNION
     else:
-        raise TypeError(f'Unsupported annotation: "{annotation_repr(value)}".')
+        raise UnsupportedAnnotation(value)
 
 
 class FieldKind(enum.IntEnum):
@@ -89,6 +251,12 @@ class FieldKind(enum.IntEnum):
     STATIC_METHOD = enum.auto()
 
 
+instance_methods_types = (types.BuiltinFunctionType, types.BuiltinMethodType,
+                          types.ClassMethodDescriptorType, types.FunctionType,
+                          types.LambdaType, types.MethodDescriptorType,
+                          types.WrapperDescriptorType)
+
+
 def _classify_field(
         value: Annotation
 ) -> t.Union[AnnotationKind, FieldKind]:
@@ -98,20 +266,16 @@ def _classify_field(
         return FieldKind.CLASS_METHOD
     elif isinstance(value, staticmethod):
         return FieldKind.STATIC_METHOD
-    elif isinstance(value, (types.BuiltinFunctionType, types.BuiltinMethodType,
-                            types.ClassMethodDescriptorType,
-                            types.FunctionType, types.LambdaType,
-                            types.MethodDescriptorType,
-                            types.WrapperDescriptorType)):
+    elif isinstance(value, instance_methods_types):
         return FieldKind.INSTANCE_METHOD
     else:
         return _classify(value)
 
 
-def _is_field_subtype(left_variance: Variance,
-                      right_variance: Variance,
-                      left: Annotation,
-                      right: Annotation) -> bool:
+def is_field_subtype(left_variance: Variance,
+                     right_variance: Variance,
+                     left: Annotation,
+                     right: Annotation) -> bool:
     from . import signatures
 
     left_kind, right_kind = _classify_field(left), _classify_field(right)
@@ -121,7 +285,7 @@ def _is_field_subtype(left_variance: Variance,
         return signatures.is_subtype_of(
                 signatures.from_callable(left.__func__),
                 signatures.from_callable(right.__func__),
-                partial(is_subtype, left_variance, right_variance)
+                subtype_predicates[left_variance, right_variance]
         )
     elif left_kind is FieldKind.CLASS_METHOD:
         return False
@@ -131,17 +295,18 @@ def _is_field_subtype(left_variance: Variance,
         return signatures.is_subtype_of(
                 signatures.from_callable(left.__func__),
                 signatures.from_callable(right.__func__),
-                partial(is_subtype, left_variance, right_variance)
+                subtype_predicates[left_variance, right_variance]
         )
     elif left_kind is FieldKind.STATIC_METHOD:
         return False
     elif right_kind is FieldKind.INSTANCE_METHOD:
         if left_kind is not FieldKind.INSTANCE_METHOD:
             return False
-        return signatures.is_subtype_of(signatures.from_callable(left),
-                                        signatures.from_callable(right),
-                                        partial(is_subtype, left_variance,
-                                                right_variance))
+        return signatures.is_subtype_of(
+                signatures.from_callable(left),
+                signatures.from_callable(right),
+                subtype_predicates[left_variance, right_variance]
+        )
     elif left_kind is FieldKind.INSTANCE_METHOD:
         if right_kind is AnnotationKind.GENERIC_ALIAS:
             return to_base(right) is abc.Callable
@@ -155,17 +320,18 @@ def _is_field_subtype(left_variance: Variance,
         right_annotations, right_returns = to_arguments(right)
         return signatures.is_subtype_of_callable(
                 left_signature, right_annotations, right_returns,
-                partial(is_subtype, left_variance, right_variance)
+                subtype_predicates[left_variance, right_variance]
         )
     elif right_kind is FieldKind.PROPERTY:
         if left_kind is not FieldKind.PROPERTY:
             return False
         assert left.fget is not None, left
         assert right.fget is not None, right
-        if not signatures.is_subtype_of(signatures.from_callable(left.fget),
-                                        signatures.from_callable(right.fget),
-                                        partial(is_subtype, left_variance,
-                                                right_variance)):
+        if not signatures.is_subtype_of(
+                signatures.from_callable(left.fget),
+                signatures.from_callable(right.fget),
+                subtype_predicates[left_variance, right_variance]
+        ):
             return False
         if right.fset is not None:
             if left.fset is None:
@@ -173,7 +339,7 @@ def _is_field_subtype(left_variance: Variance,
             elif not signatures.is_subtype_of(
                     signatures.from_callable(left.fset),
                     signatures.from_callable(right.fset),
-                    partial(is_subtype, left_variance, right_variance)
+                    subtype_predicates[left_variance, right_variance]
             ):
                 return False
         if right.fdel is not None:
@@ -182,7 +348,7 @@ def _is_field_subtype(left_variance: Variance,
             elif not signatures.is_subtype_of(
                     signatures.from_callable(left.fdel),
                     signatures.from_callable(right.fdel),
-                    partial(is_subtype, left_variance, right_variance)
+                    subtype_predicates[left_variance, right_variance]
             ):
                 return False
         return True
@@ -191,7 +357,7 @@ def _is_field_subtype(left_variance: Variance,
             return False
         return signatures.is_subtype_of_callable_returns(
                 signatures.from_callable(left.fget), right,
-                partial(is_subtype, left_variance, right_variance)
+                subtype_predicates[left_variance, right_variance]
         )
     else:
         assert left_kind not in FieldKind, left_kind
@@ -221,17 +387,22 @@ def _is_subtype(left: Annotation,
             right_variants = to_variants(right)
             return all(any(is_subtype(left_variance, right_variance,
                                       left_variant, right_variant)
-                           for right_variant in right_variants)
-                       for left_variant in left_variants)
+                           for right_variant
+                           in costs.order_disjuncts(left_variant,
+                                                    right_variants))
+                       for left_variant
+                       in costs.order_conjuncts(left_variants,
+                                                right_variants))
         else:
             return all(is_subtype(left_variance, right_variance, left_variant,
                                   right)
-                       for left_variant in left_variants)
+                       for left_variant
+                       in costs.order_conjuncts(left_variants, (right,)))
     elif right_kind is AnnotationKind.UNION:
-        right_variants = to_variants(right)
         return any(is_subtype(left_variance, right_variance, left,
                               right_variant)
-                   for right_variant in right_variants)
+                   for right_variant
+                   in costs.order_disjuncts(left, to_variants(right)))
     elif left_kind is AnnotationKind.CONSTANT:
         return right is object or left is right
     elif right_kind is AnnotationKind.CONSTANT:
@@ -242,27 +413,18 @@ def _is_subtype(left: Annotation,
         return False
     elif left_kind is AnnotationKind.PROTOCOL:
         if right_kind is AnnotationKind.PROTOCOL:
-            left_fields, right_fields = (_protocol_to_fields(left),
-                                         _protocol_to_fields(right))
+            left_fields, right_fields = (protocol_to_fields(left),
+                                         protocol_to_fields(right))
             if not (left_fields.keys() <= right_fields.keys()):
                 return False
-            return all(_is_field_subtype(left_variance, right_variance,
-                                         left_field, right_fields[field_name])
+            return all(is_field_subtype(left_variance, right_variance,
+                                        left_field, right_fields[field_name])
                        for field_name, left_field in left_fields.items())
         else:
             return False
     elif right_kind is AnnotationKind.PROTOCOL:
-        right_fields = _protocol_to_fields(right)
-        for right_field_name, right_field in right_fields.items():
-            try:
-                left_field = getattr(left, right_field_name)
-            except AttributeError:
-                return False
-            else:
-                if not _is_field_subtype(left_variance, right_variance,
-                                         left_field, right_field):
-                    return False
-        return True
+        return _to_protocol_mismatch(left, right, left_variance,
+                                     right_variance) is None
     elif left_kind is AnnotationKind.SPECIALIZATION:
         left_base, left_arguments = to_base(left), to_arguments(left)
         if left_base is t.ClassVar:
@@ -300,14 +462,17 @@ def _is_subtype(left: Annotation,
                         right_argument = right_arguments[0]
                         return all(is_subtype(left_variance, right_variance,
                                               left_argument, right_argument)
-                                   for left_argument in left_arguments)
+                                   for left_argument
+                                   in costs.order_conjuncts(left_arguments,
+                                                            right_arguments))
                     else:
                         return (len(left_arguments) == len(right_arguments)
                                 and
                                 all(is_subtype(left_variance, right_variance,
                                                left_argument, right_argument)
                                     for left_argument, right_argument
-                                    in zip(left_arguments, right_arguments)))
+                                    in costs.order_pairs(left_arguments,
+                                                         right_arguments)))
                 else:
                     assert len(right_arguments) == 1, right
                     right_argument, = right_arguments
@@ -318,7 +483,9 @@ def _is_subtype(left: Annotation,
                     else:
                         return all(is_subtype(left_variance, right_variance,
                                               left_argument, right_argument)
-                                   for left_argument in left_arguments)
+                                   for left_argument
+                                   in costs.order_conjuncts(left_arguments,
+                                                            right_arguments))
             elif left_base is type:
                 assert len(left_arguments) == 1, left
                 left_argument, = left_arguments
@@ -332,11 +499,13 @@ def _is_subtype(left: Annotation,
                         return True
                     elif isinstance(left_argument, type):
                         from . import signatures
-                        return signatures.is_subtype_of_callable_annotations(
-                                signatures.from_callable(left_argument),
-                                right_annotations,
-                                partial(is_subtype, left_variance,
-                                        right_variance)
+                        return (
+                            signatures
+                            .is_constructor_subtype_of_callable_annotations(
+                                    left_argument, right_annotations,
+                                    subtype_predicates[left_variance,
+                                                       right_variance]
+                            )
                         )
                 elif right_base is type:
                     assert len(right_arguments) == 1, right
@@ -356,20 +525,14 @@ def _is_subtype(left: Annotation,
                 elif right_base is type:
                     return False
             else:
-                left_arguments = _complete_arguments(left_arguments, left_base)
-                right_arguments = _complete_arguments(right_arguments,
-                                                      right_base)
-                if (len(left_arguments) == len(right_arguments)
-                        or (issubclass(left_base, abc.Mapping)
-                            and len(left_arguments) == 2)
-                        or left_base in (abc.AsyncGenerator, abc.Coroutine,
-                                         abc.Generator)):
-                    return all(is_subtype(left_variance, right_variance,
-                                          left_argument, right_argument)
-                               for left_argument, right_argument
-                               in zip(left_arguments, right_arguments))
+                result = _is_ancestor_specialization_subtype(
+                        left_base, left_arguments, right_base,
+                        right_arguments, left_variance, right_variance
+                )
+                if result is not None:
+                    return result
         elif isinstance(right, type):
-            return issubclass(left_base, right)
+            return not te.is_typeddict(right) and issubclass(left_base, right)
     else:
         assert left_kind is AnnotationKind.TYPE, left_kind
         if right_kind is AnnotationKind.SPECIALIZATION:
@@ -390,22 +553,116 @@ def _is_subtype(left: Annotation,
                     return True
                 else:
                     from . import signatures
-                    return signatures.is_subtype_of_callable_annotations(
-                            signatures.from_callable(left), right_annotations,
-                            partial(is_subtype, left_variance, right_variance)
+                    return (
+                        signatures
+                        .is_constructor_subtype_of_callable_annotations(
+                                left, right_annotations,
+                                subtype_predicates[left_variance,
+                                                   right_variance]
+                        )
                     )
             elif right_base is type:
                 assert len(right_arguments) == 1, right
                 right_argument, = right_arguments
                 return is_subtype(left_variance, right_variance, left,
                                   right_argument)
+            elif te.is_typeddict(left) or is_named_tuple(left):
+                return is_subtype(left_variance, right_variance,
+                                  _record_to_specialization(left), right)
+            elif not issubclass(left, right_base):
+                return False
             else:
-                return issubclass(left, right_base)
+                result = _is_ancestor_specialization_subtype(
+                        left,
+                        ((t.Any,) * len(_to_parameters(left))
+                         if is_generic(left)
+                         else ()),
+                        right_base, right_arguments, left_variance,
+                        right_variance
+                )
+                # classes without declared arguments of the ancestor
+                # are its specializations with ``typing.Any`` arguments
+                return result is None or result
         else:
             assert right_kind is AnnotationKind.TYPE, right_kind
-            return issubclass(left, right)
-    raise TypeError('Unsupported types: '
-                    f'"{annotation_repr(left)}", "{annotation_repr(right)}".')
+            if te.is_typeddict(right):
+                # typed dictionaries do not support class checks
+                return te.is_typeddict(left) and _is_record_subtype(
+                        left, right, left_variance, right_variance
+                )
+            return issubclass(left, right) or (
+                    is_record(left) and is_record(right)
+                    and _is_record_subtype(left, right, left_variance,
+                                           right_variance)
+            )
+    raise UnsupportedTypes(left, right)
+
+
+def _is_ancestor_specialization_subtype(
+        left_base: type,
+        left_arguments: t.Tuple[Annotation, ...],
+        right_base: type,
+        right_arguments: t.Tuple[Annotation, ...],
+        left_variance: Variance,
+        right_variance: Variance
+) -> t.Optional[bool]:
+    left_base, left_arguments = _to_ancestor_specialization(
+            left_base, left_arguments, right_base
+    )
+    left_arguments = _complete_arguments(left_arguments, left_base)
+    right_arguments = _complete_arguments(right_arguments, right_base)
+    if not (len(left_arguments) == len(right_arguments)
+            or (issubclass(left_base, abc.Mapping)
+                and len(left_arguments) == 2)
+            or left_base in (abc.AsyncGenerator, abc.Coroutine,
+                             abc.Generator)):
+        return None
+    arguments_variances = to_arguments_variances(right_base)
+    if (arguments_variances is None
+            or len(arguments_variances) != len(right_arguments)):
+        return all(is_subtype(left_variance, right_variance, left_argument,
+                              right_argument)
+                   for left_argument, right_argument
+                   in costs.order_pairs(left_arguments, right_arguments))
+    return all(is_subtype(Variance.INVARIANT, argument_variance,
+                          left_argument, right_argument)
+               for left_argument, right_argument, argument_variance
+               in costs.order_pairs(left_arguments, right_arguments,
+                                    arguments_variances))
+
+
+def _is_record_subtype(left: type,
+                       right: type,
+                       left_variance: Variance,
+                       right_variance: Variance) -> bool:
+    left_fields, right_fields = (record_to_fields(left),
+                                 record_to_fields(right))
+    if left_fields.kind is not right_fields.kind:
+        return False
+    elif right_fields.kind is RecordKind.NAMED_TUPLE:
+        # items are accessed by positions, so names should match in order
+        if left_fields.names != right_fields.names:
+            return False
+    elif not (right_fields.keys <= left_fields.keys):
+        return False
+    elif right_fields.kind is RecordKind.TYPED_DICT:
+        # required keys of the right record should be required in the left
+        # and vice versa
+        if (left_fields.required_keys & right_fields.keys
+                != right_fields.required_keys):
+            return False
+    elif right_fields.mutable and not left_fields.mutable:
+        return False
+    # mutable fields are both read & written, so they are invariant
+    fields_left_variance, fields_right_variance = (
+        (Variance.INVARIANT, Variance.INVARIANT)
+        if right_fields.mutable
+        else (left_variance, right_variance)
+    )
+    left_types = left_fields.types
+    return all(is_subtype(fields_left_variance, fields_right_variance,
+                          left_types[name], right_type)
+               for name, right_type in right_fields.types.items())
 
 
 def _is_callable_subtype(
@@ -430,7 +687,8 @@ def _is_callable_subtype(
                 and all(is_subtype(left_variance, right_variance,
                                    right_annotation, left_annotation)
                         for left_annotation, right_annotation
-                        in zip(left_annotations, right_annotations)))
+                        in costs.order_pairs(left_annotations,
+                                             right_annotations)))
 
 
 if sys.version_info < (3, 9):
@@ -460,6 +718,10 @@ def is_protocol(value: t.Any,
     return isinstance(value, _protocol_meta)
 
 
+def is_generic(value: type, _generic: t.Any = t.Generic) -> bool:
+    return issubclass(value, _generic)
+
+
 def is_type(value: t.Any) -> bool:
     return isinstance(value, type) and not is_protocol(value)
 
@@ -488,7 +750,175 @@ def _complete_arguments(arguments: t.Tuple[Annotation, ...],
     return arguments
 
 
-def _protocol_to_fields(
+def to_arguments_variances(
+        origin: type
+) -> t.Optional[t.Tuple[Variance, ...]]:
+    try:
+        return _standard_arguments_variances[origin]
+    except KeyError:
+        return (_generics_arguments_variances_cache.lookup(
+                    (origin,), _to_generic_arguments_variances
+                )
+                if is_generic(origin)
+                else None)
+
+
+def _to_generic_arguments_variances(
+        key: t.Tuple[type]
+) -> t.Optional[t.Tuple[Variance, ...]]:
+    origin, = key
+    parameters = _to_parameters(origin)
+    return (tuple(map(type_var_to_variance, parameters))
+            if all(map(is_type_var, parameters))
+            else None)
+
+
+_covariant: t.Tuple[Variance, ...] = (Variance.COVARIANT,)
+_invariant: t.Tuple[Variance, ...] = (Variance.INVARIANT,)
+# variances of arguments after completion with "_complete_arguments"
+_standard_arguments_variances: t.Dict[type, t.Tuple[Variance, ...]] = {
+    **dict.fromkeys([abc.AsyncIterable, abc.AsyncIterator, abc.Awaitable,
+                     abc.Collection, abc.Container, abc.ItemsView,
+                     abc.Iterable, abc.Iterator, abc.KeysView,
+                     abc.MappingView, abc.Reversible, abc.Sequence, abc.Set,
+                     abc.ValuesView, frozenset,
+                     contextlib.AbstractAsyncContextManager,
+                     contextlib.AbstractContextManager],
+                    _covariant),
+    **dict.fromkeys([abc.MutableSequence, abc.MutableSet, deque, list,
+                     re.Match, re.Pattern, set],
+                    _invariant),
+    **dict.fromkeys([abc.MutableMapping, ChainMap, Counter, OrderedDict,
+                     defaultdict, dict],
+                    _invariant * 2),
+    abc.Mapping: (Variance.INVARIANT, Variance.COVARIANT),
+    abc.AsyncGenerator: (Variance.COVARIANT, Variance.CONTRAVARIANT),
+    abc.Coroutine: (Variance.COVARIANT, Variance.CONTRAVARIANT,
+                    Variance.COVARIANT),
+    abc.Generator: (Variance.COVARIANT, Variance.CONTRAVARIANT,
+                    Variance.COVARIANT),
+}
+
+
+def _to_ancestor_specialization(
+        base: type, arguments: t.Tuple[Annotation, ...], ancestor: type
+) -> t.Tuple[type, t.Tuple[Annotation, ...]]:
+    if base is ancestor or not is_generic(base):
+        return base, arguments
+    ancestors_arguments = generic_to_ancestors_arguments(base)
+    try:
+        ancestor_arguments = ancestors_arguments[ancestor]
+    except KeyError:
+        # ancestor is not declared explicitly,
+        # so we are looking for the closest declared one inheriting from it
+        for candidate in base.__mro__[1:]:
+            if (candidate in ancestors_arguments
+                    and issubclass(candidate, ancestor)):
+                ancestor, ancestor_arguments = (candidate,
+                                                ancestors_arguments[candidate])
+                break
+        else:
+            return base, arguments
+    substitution = dict(zip(_to_parameters(base), arguments))
+    return ancestor, tuple(_substitute(argument, substitution)
+                           for argument in ancestor_arguments)
+
+
+def generic_to_ancestors_arguments(
+        value: type
+) -> t.Dict[type, t.Tuple[Annotation, ...]]:
+    return _generics_ancestors_arguments_cache.lookup(
+            (value,), _to_generic_ancestors_arguments
+    )
+
+
+def _to_generic_ancestors_arguments(
+        key: t.Tuple[type]
+) -> t.Dict[type, t.Tuple[Annotation, ...]]:
+    value, = key
+    result: t.Dict[type, t.Tuple[Annotation, ...]] = {}
+    for base in vars(value).get('__orig_bases__', value.__bases__):
+        origin = to_base(base)
+        arguments: t.Tuple[Annotation, ...]
+        if origin is None:
+            origin, arguments = base, ()
+        else:
+            arguments = to_arguments(base)
+        if not isinstance(origin, type) or origin in generics_roots:
+            continue
+        elif not is_generic(origin):
+            if arguments:
+                result.setdefault(origin, arguments)
+            continue
+        parameters = _to_parameters(origin)
+        if not arguments:
+            arguments = (t.Any,) * len(parameters)
+        result.setdefault(origin, arguments)
+        substitution = dict(zip(parameters, arguments))
+        for ancestor, ancestor_arguments in generic_to_ancestors_arguments(
+                origin
+        ).items():
+            result.setdefault(ancestor,
+                              tuple(_substitute(argument, substitution)
+                                    for argument in ancestor_arguments))
+    return result
+
+
+def _to_parameters(value: t.Any) -> t.Tuple[t.TypeVar, ...]:
+    return value.__parameters__
+
+
+def _substitute(annotation: Annotation,
+                substitution: t.Mapping[t.TypeVar, Annotation]) -> Annotation:
+    if is_type_var(annotation):
+        return substitution.get(annotation, annotation)
+    parameters = getattr(annotation, '__parameters__', ())
+    return (annotation[tuple(substitution.get(parameter, parameter)
+                             for parameter in parameters)]
+            if parameters and not isinstance(annotation, type)
+            else annotation)
+
+
+def _to_protocol_mismatch(left: Annotation,
+                          right: t.Type[t.Any],
+                          left_variance: Variance,
+                          right_variance: Variance) -> t.Optional[str]:
+    key = left, right, left_variance, right_variance
+    # cached mismatches skip fields checks along with their dependencies
+    return (_find_protocol_mismatch(key)
+            if active_dependencies.get() is not None
+            else _protocols_mismatches_cache.lookup(key,
+                                                    _find_protocol_mismatch))
+
+
+def _find_protocol_mismatch(
+        key: t.Tuple[Annotation, t.Type[t.Any], Variance, Variance]
+) -> t.Optional[str]:
+    left, right, left_variance, right_variance = key
+    for right_field_name, right_field in protocol_to_fields(right).items():
+        try:
+            left_field = getattr(left, right_field_name)
+        except AttributeError:
+            return right_field_name
+        else:
+            if not is_field_subtype(left_variance, right_variance,
+                                    left_field, right_field):
+                return right_field_name
+    return None
+
+
+def protocol_to_fields(value: t.Type[t.Any]) -> t.Dict[str, Annotation]:
+    return _protocols_fields_cache.lookup((value,), _to_protocol_fields)
+
+
+def _to_protocol_fields(
+        key: t.Tuple[t.Type[t.Any]]
+) -> t.Dict[str, Annotation]:
+    value, = key
+    return _collect_protocol_fields(value)
+
+
+def _collect_protocol_fields(
         value: t.Type[t.Any],
         fields_names_to_skip: t.Container[str] = frozenset(
                 {'__abstractmethods__', '__annotations__', '__weakref__',
@@ -496,7 +926,10 @@ def _protocol_to_fields(
                  '__args__', '__slots__', '__next_in_mro__', '__parameters__',
                  '__origin__', '__orig_bases__', '__extra__', '__tree_hash__',
                  '__doc__', '__subclasshook__', '__init__', '__new__',
-                 '__module__', '_MutableMapping__marker', '_gorg'}
+                 '__module__', '_MutableMapping__marker', '_gorg',
+                 '__protocol_attrs__', '__non_callable_proto_members__',
+                 '__callable_proto_members_only__', '__firstlineno__',
+                 '__static_attributes__', '__type_params__'}
         )
 ) -> t.Dict[str, Annotation]:
     assert is_protocol(value), value
@@ -510,4 +943,104 @@ def _protocol_to_fields(
                       if (not name.startswith('_abc_')
                           and name not in fields_names_to_skip))
         result.update(te.get_type_hints(base))
-    return result
+    return dict(sorted(result.items(),
+                       key=_to_field_cost))
+
+
+def _to_field_cost(item: t.Tuple[str, Annotation]) -> int:
+    _, field = item
+    return costs.estimate_field(field)
+
+
+class RecordKind(enum.IntEnum):
+    DATACLASS = enum.auto()
+    NAMED_TUPLE = enum.auto()
+    TYPED_DICT = enum.auto()
+
+
+class RecordFields(t.NamedTuple):
+    kind: RecordKind
+    names: t.Tuple[str, ...]
+    keys: t.FrozenSet[str]
+    required_keys: t.FrozenSet[str]
+    mutable: bool
+    types: t.Dict[str, Annotation]
+
+
+def is_named_tuple(value: type) -> bool:
+    return issubclass(value, tuple) and hasattr(value, '_fields')
+
+
+def is_record(value: type) -> bool:
+    return (dataclasses.is_dataclass(value)
+            or te.is_typeddict(value)
+            or is_named_tuple(value))
+
+
+def _record_to_specialization(value: type) -> Annotation:
+    fields = record_to_fields(value)
+    if fields.kind is RecordKind.TYPED_DICT:
+        # structural subtypes of typed dictionaries can have extra keys
+        # with values of any types, so only values of ``object`` are safe
+        return t.Mapping[str, object]
+    assert fields.kind is RecordKind.NAMED_TUPLE, value
+    return (t.Tuple[tuple(fields.types[name] for name in fields.names)]
+            if fields.names
+            else t.Tuple[()])
+
+
+def record_to_fields(value: type) -> RecordFields:
+    return _records_fields_cache.lookup((value,), _to_record_fields)
+
+
+def _to_record_fields(key: t.Tuple[type]) -> RecordFields:
+    value: t.Any
+    value, = key
+    hints = te.get_type_hints(value)
+    if te.is_typeddict(value):
+        kind, names, mutable = RecordKind.TYPED_DICT, tuple(hints), True
+        keys = frozenset(names)
+        required_keys = frozenset(
+                getattr(value, '__required_keys__',
+                        keys if value.__total__ else ())
+        )
+    elif dataclasses.is_dataclass(value):
+        kind = RecordKind.DATACLASS
+        names = tuple(field.name for field in dataclasses.fields(value))
+        keys = required_keys = frozenset(names)
+        # parameters of dataclasses are missing from their stubs
+        mutable = not getattr(value, '__dataclass_params__').frozen
+    else:
+        assert issubclass(value, tuple), value
+        kind, names, mutable = RecordKind.NAMED_TUPLE, value._fields, False
+        keys = required_keys = frozenset(names)
+    # fields without annotations (e.g. of ``collections.namedtuple``)
+    # can hold anything
+    types = {name: hints.get(name, t.Any) for name in names}
+    return RecordFields(kind, names, keys, required_keys, mutable,
+                        dict(sorted(types.items(),
+                                    key=_to_record_field_cost)))
+
+
+def _to_record_field_cost(item: t.Tuple[str, Annotation]) -> int:
+    _, annotation = item
+    return costs.estimate(annotation)
+
+
+# ``typing.Protocol`` is available since Python 3.8
+generics_roots = (t.Generic, te.Protocol, getattr(t, 'Protocol', te.Protocol))
+_generics_arguments_variances_cache: WeakStripedCache[
+    t.Tuple[type], t.Optional[t.Tuple[Variance, ...]]
+] = WeakStripedCache()
+_generics_ancestors_arguments_cache: WeakStripedCache[
+    t.Tuple[type], t.Dict[type, t.Tuple[Annotation, ...]]
+] = WeakStripedCache()
+_protocols_mismatches_cache: WeakStripedCache[
+    t.Tuple[Annotation, t.Type[t.Any], Variance, Variance], t.Optional[str]
+] = WeakStripedCache()
+_protocols_fields_cache: WeakStripedCache[
+    t.Tuple[t.Type[t.Any]], t.Dict[str, Annotation]
+] = WeakStripedCache()
+_records_fields_cache: WeakStripedCache[
+    t.Tuple[type], RecordFields
+] = WeakStripedCache()
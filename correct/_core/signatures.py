@@ -1,4 +1,5 @@
 import typing as _t
+from itertools import repeat as _repeat
 
 from paradigm.base import (OptionalParameter as _OptionalParameter,
                            OverloadedSignature as _OverloadedSignature,
@@ -7,6 +8,9 @@ from paradigm.base import (OptionalParameter as _OptionalParameter,
                            RequiredParameter as _RequiredParameter,
                            signature_from_callable as _signature_from_callable)
 
+from . import (costs as _costs,
+               database as _database)
+from .caching import WeakStripedCache as _WeakStripedCache
 from .hints import Annotation as _Annotation
 
 _Parameter = _t.Union[_OptionalParameter, _RequiredParameter]
@@ -17,7 +21,22 @@ def from_callable(value: _t.Callable[..., _t.Any],
                   none_type: _t.Type[None] = type(None)) -> _Signature:
     return (_PlainSignature(returns=None)
             if value is none_type
-            else _signature_from_callable(value))
+            else _signatures_cache.lookup((value,), _from_callable_key))
+
+
+def _from_callable_key(
+        key: _t.Tuple[_t.Callable[..., _t.Any]]
+) -> _Signature:
+    value, = key
+    signature = _database.lookup(value)
+    return (_signature_from_callable(value)
+            if signature is None
+            else signature)
+
+
+_signatures_cache: _WeakStripedCache[
+    _t.Tuple[_t.Callable[..., _t.Any]], _Signature
+] = _WeakStripedCache(capacity=4096)
 
 
 def is_subtype_of(
@@ -26,13 +45,23 @@ def is_subtype_of(
         is_subtype: _t.Callable[[_Annotation, _Annotation], bool]
 ) -> bool:
     if isinstance(left, _OverloadedSignature):
+        left_signatures = _costs.order(left.signatures, _estimate_signature)
+        if isinstance(right, _OverloadedSignature):
+            # overloads are ordered once for all the left signatures
+            right_signatures = _costs.order(right.signatures,
+                                            _estimate_signature)
+            return all(_is_subtype_of_any(signature, right_signatures,
+                                          is_subtype)
+                       for signature in left_signatures)
         return all(is_subtype_of(signature, right, is_subtype)
-                   for signature in left.signatures)
+                   for signature in left_signatures)
     else:
         assert isinstance(left, _PlainSignature), left
         if isinstance(right, _OverloadedSignature):
-            return any(is_subtype_of(left, signature, is_subtype)
-                       for signature in right.signatures)
+            return _is_subtype_of_any(
+                    left, _costs.order(right.signatures, _estimate_signature),
+                    is_subtype
+            )
         else:
             assert isinstance(right, _PlainSignature), right
             if not is_subtype(left.returns, right.returns):
@@ -108,17 +137,16 @@ def is_subtype_of(
                     return False
                 if left_variadic_positional is None:
                     return False
-                if not all(
-                        is_subtype(right_parameter.annotation,
-                                   left_parameter.annotation)
-                        for left_parameter, right_parameter
-                        in zip(left_positionals,
-                               right_positionals_only[:len(left_positionals)])
-                ) or not all(
-                        is_subtype(right_parameter.annotation,
-                                   left_variadic_positional.annotation)
-                        for right_parameter
-                        in right_positionals_only[len(left_positionals):]
+                if not _are_parameters_subtypes(
+                        left_positionals,
+                        right_positionals_only[:len(left_positionals)],
+                        is_subtype
+                ) or not _are_parameters_subtypes(
+                        _repeat(left_variadic_positional,
+                                len(right_positionals_only)
+                                - len(left_positionals)),
+                        right_positionals_only[len(left_positionals):],
+                        is_subtype
                 ):
                     return False
                 if left_variadic_keyword is None:
@@ -158,11 +186,9 @@ def is_subtype_of(
                         > sum(isinstance(parameter, _OptionalParameter)
                               for parameter in start_left_positionals)):
                     return False
-                if not all(is_subtype(right_parameter.annotation,
-                                      left_parameter.annotation)
-                           for left_parameter, right_parameter
-                           in zip(start_left_positionals,
-                                  right_positionals_only)):
+                if not _are_parameters_subtypes(start_left_positionals,
+                                                right_positionals_only,
+                                                is_subtype):
                     return False
                 right_positionals_or_keywords = right_parameters_by_kind[
                     _ParameterKind.POSITIONAL_OR_KEYWORD
@@ -175,22 +201,22 @@ def is_subtype_of(
                         right_positionals_or_keywords
                         [:len(rest_left_positionals)]
                     )
-                    if not all(
-                            is_subtype(right_parameter.annotation,
-                                       left_parameter.annotation)
-                            for left_parameter, right_parameter
-                            in zip(rest_left_positionals,
-                                   start_right_positionals_or_keywords)
+                    if not _are_parameters_subtypes(
+                            rest_left_positionals,
+                            start_right_positionals_or_keywords,
+                            is_subtype
                     ):
                         return False
                     rest_right_positionals_or_keywords = (
                         right_positionals_or_keywords
                         [len(rest_left_positionals):]
                     )
-                    if not all(is_subtype(right_parameter.annotation,
-                                          left_variadic_positional.annotation)
-                               for right_parameter
-                               in rest_right_positionals_or_keywords):
+                    if not _are_parameters_subtypes(
+                            _repeat(left_variadic_positional,
+                                    len(rest_right_positionals_or_keywords)),
+                            rest_right_positionals_or_keywords,
+                            is_subtype
+                    ):
                         return False
                     for right_parameter in rest_right_positionals_or_keywords:
                         try:
@@ -217,11 +243,11 @@ def is_subtype_of(
                         rest_left_positionals
                         [:len(right_positionals_or_keywords)]
                     )
-                    if not all(is_subtype(right_parameter.annotation,
-                                          left_parameter.annotation)
-                               for left_parameter, right_parameter
-                               in zip(start_rest_left_positionals,
-                                      right_positionals_or_keywords)):
+                    if not _are_parameters_subtypes(
+                            start_rest_left_positionals,
+                            right_positionals_or_keywords,
+                            is_subtype
+                    ):
                         return False
                     rest_rest_left_positionals = (
                         rest_left_positionals
@@ -311,41 +337,131 @@ def is_subtype_of_callable_returns(
         return is_subtype(left_signature.returns, right_returns)
 
 
+def is_constructor_subtype_of_callable_annotations(
+        cls: type,
+        right_annotations: _t.Sequence[_Annotation],
+        is_subtype: _t.Callable[[_Annotation, _Annotation], bool]
+) -> bool:
+    shapes = _constructors_shapes_cache.lookup((cls,),
+                                               _to_constructor_shapes)
+    return any(_is_positional_shape_subtype(shape, right_annotations,
+                                            is_subtype)
+               for shape in shapes)
+
+
+class _PositionalShape(_t.NamedTuple):
+    accepts_positionals_only: bool
+    annotations: _t.Tuple[_Annotation, ...]
+    required_count: int
+    variadic_annotation: _t.Optional[_Annotation]
+
+
 def _is_plain_signature_subtype(
         left_signature: _PlainSignature,
         right_annotations: _t.Sequence[_Annotation],
         is_subtype: _t.Callable[[_Annotation, _Annotation], bool]
 ) -> bool:
-    if not all(parameter.kind is not _ParameterKind.KEYWORD_ONLY
-               or isinstance(parameter, _OptionalParameter)
-               for parameter in left_signature.parameters):
+    return _is_positional_shape_subtype(_to_positional_shape(left_signature),
+                                        right_annotations, is_subtype)
+
+
+def _is_positional_shape_subtype(
+        shape: _PositionalShape,
+        right_annotations: _t.Sequence[_Annotation],
+        is_subtype: _t.Callable[[_Annotation, _Annotation], bool]
+) -> bool:
+    if not shape.accepts_positionals_only:
         return False
-    left_positionals = [
+    left_annotations = shape.annotations
+    if len(left_annotations) < len(right_annotations):
+        variadic_annotation = shape.variadic_annotation
+        return (variadic_annotation is not None
+                and all(is_subtype(annotation, variadic_annotation)
+                        for annotation
+                        in right_annotations[len(left_annotations):]))
+    return (len(right_annotations) >= shape.required_count
+            and all(map(is_subtype, right_annotations, left_annotations)))
+
+
+def _to_constructor_shapes(
+        key: _t.Tuple[type]
+) -> _t.Tuple[_PositionalShape, ...]:
+    cls, = key
+    signature = from_callable(cls)
+    return tuple(map(_to_positional_shape,
+                     signature.signatures
+                     if isinstance(signature, _OverloadedSignature)
+                     else [signature]))
+
+
+def _to_positional_shape(signature: _PlainSignature) -> _PositionalShape:
+    positionals = [
         parameter
-        for parameter in left_signature.parameters
+        for parameter in signature.parameters
         if (parameter.kind is _ParameterKind.POSITIONAL_ONLY
             or parameter.kind is _ParameterKind.POSITIONAL_OR_KEYWORD)
     ]
-    if len(left_positionals) < len(right_annotations):
-        left_variadic_positional_annotation = next(
-                (parameter.annotation
-                 for parameter in left_signature.parameters
-                 if parameter.kind is _ParameterKind.VARIADIC_POSITIONAL),
-                None
-        )
-        return (left_variadic_positional_annotation is not None
-                and all(is_subtype(annotation,
-                                   left_variadic_positional_annotation)
-                        for annotation
-                        in right_annotations[len(left_positionals):]))
-    left_annotations, left_extra_parameters = (
-        [parameter.annotation
-         for parameter in left_positionals[:len(right_annotations)]],
-        left_positionals[len(right_annotations):]
+    return _PositionalShape(
+            all(parameter.kind is not _ParameterKind.KEYWORD_ONLY
+                or isinstance(parameter, _OptionalParameter)
+                for parameter in signature.parameters),
+            tuple(parameter.annotation for parameter in positionals),
+            max((index
+                 for index, parameter in enumerate(positionals,
+                                                   start=1)
+                 if not isinstance(parameter, _OptionalParameter)),
+                default=0),
+            next((parameter.annotation
+                  for parameter in signature.parameters
+                  if parameter.kind is _ParameterKind.VARIADIC_POSITIONAL),
+                 None)
     )
-    return (all(isinstance(parameter, _OptionalParameter)
-                for parameter in left_extra_parameters)
-            and all(map(is_subtype, right_annotations, left_annotations)))
+
+
+# constructors of classes are resolved from ``__init__``, ``__new__``
+# & metaclass ``__call__``, so their shapes are kept for the classes lifetime
+# rather than competing for the bounded signatures cache
+_constructors_shapes_cache: _WeakStripedCache[
+    _t.Tuple[type], _t.Tuple[_PositionalShape, ...]
+] = _WeakStripedCache()
+
+
+def _are_parameters_subtypes(
+        left_parameters: _t.Iterable[_Parameter],
+        right_parameters: _t.Iterable[_Parameter],
+        is_subtype: _t.Callable[[_Annotation, _Annotation], bool]
+) -> bool:
+    # parameters are contravariant, cheaper pairs are checked first,
+    # so parameters are consumed eagerly and should be finite
+    return all(is_subtype(right_annotation, left_annotation)
+               for right_annotation, left_annotation
+               in _costs.order_pairs(
+                    (parameter.annotation for parameter in right_parameters),
+                    (parameter.annotation for parameter in left_parameters)
+            ))
+
+
+def _estimate_signature(signature: _Signature) -> int:
+    if isinstance(signature, _OverloadedSignature):
+        return sum(map(_estimate_signature, signature.signatures))
+    return _costs.estimate(signature.returns) + sum(
+            _costs.estimate(parameter.annotation)
+            for parameter in signature.parameters
+    )
+
+
+def _is_subtype_of_any(
+        left: _PlainSignature,
+        right_signatures: _t.Sequence[_PlainSignature],
+        is_subtype: _t.Callable[[_Annotation, _Annotation], bool]
+) -> bool:
+    # signature identical to the left one settles a disjunction,
+    # so it goes first
+    return ((any(signature is left for signature in right_signatures)
+             and is_subtype_of(left, left, is_subtype))
+            or any(is_subtype_of(left, signature, is_subtype)
+                   for signature in right_signatures
+                   if signature is not left))
 
 
 def _to_parameters_by_kind(
@@ -1,6 +1,5 @@
 import sys
 import typing as t
-from functools import singledispatch
 
 import typing_extensions as te
 
@@ -21,40 +20,20 @@ to_base = te.get_origin
 to_variants = to_arguments
 
 
-@singledispatch
 def annotation_repr(value: Annotation) -> str:
-    return repr(value)
-
-
-@annotation_repr.register(type)
-def _(value: type) -> str:
-    return f'{value.__module__}.{value.__qualname__}'
-
-
-@annotation_repr.register(LegacySpecialization)
-@annotation_repr.register(Specialization)
-def _(value: t.Union[LegacySpecialization, Specialization]) -> str:
-    base = to_base(value)
-    arguments = to_arguments(value)
-    return (((f'{annotation_repr(t.Optional)}'
-              f'[{annotation_repr(arguments[arguments[0] is type(None)])}]')
-             if len(arguments) == 2 and type(None) in arguments
-             else (f'{annotation_repr(base)}'
-                   f'[{", ".join(map(annotation_repr, arguments))}]'))
-            if base is t.Union
-            else (((f'{annotation_repr(base)}'
-                    f'[{", ".join(map(annotation_repr, arguments))}]')
-                   if arguments
-                   else f'{value.__module__}.{annotation_repr(base)}')
-                  if value._name is None
-                  else ((f'{value.__module__}.{value._name}'
-                         f'[{", ".join(map(annotation_repr, arguments))}]')
-                        if arguments
-                        else f'{value.__module__}.{value._name}')))
+    # dispatched explicitly rather than with ``functools.singledispatch``,
+    # since mypyc does not support it with ``typing.TypeVar``
+    if isinstance(value, (LegacySpecialization, Specialization)):
+        return _specialization_repr(value)
+    elif isinstance(value, t.TypeVar):
+        return type_var_repr(value)
+    elif isinstance(value, type):
+        return _type_repr(value)
+    else:
+        return repr(value)
 
 
-@annotation_repr.register(t.TypeVar)
-def _(value: t.TypeVar) -> str:
+def type_var_repr(value: t.TypeVar) -> str:
     arguments = [repr(value.__name__)]
     arguments.extend(map(annotation_repr, value.__constraints__))
     if value.__bound__ is not None:
@@ -86,3 +65,29 @@ def unpack_type_var(value: t.TypeVar) -> Annotation:
         return t.Union[value.__constraints__]
     else:
         return t.Any
+
+
+def _specialization_repr(
+        value: t.Union[LegacySpecialization, Specialization]
+) -> str:
+    base = to_base(value)
+    arguments = to_arguments(value)
+    return (((f'{annotation_repr(t.Optional)}'
+              f'[{annotation_repr(arguments[arguments[0] is type(None)])}]')
+             if len(arguments) == 2 and type(None) in arguments
+             else (f'{annotation_repr(base)}'
+                   f'[{", ".join(map(annotation_repr, arguments))}]'))
+            if base is t.Union
+            else (((f'{annotation_repr(base)}'
+                    f'[{", ".join(map(annotation_repr, arguments))}]')
+                   if arguments
+                   else f'{value.__module__}.{annotation_repr(base)}')
+                  if value._name is None
+                  else ((f'{value.__module__}.{value._name}'
+                         f'[{", ".join(map(annotation_repr, arguments))}]')
+                        if arguments
+                        else f'{value.__module__}.{value._name}')))
+
+
+def _type_repr(value: type) -> str:
+    return f'{value.__module__}.{value.__qualname__}'
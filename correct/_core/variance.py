@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import enum
-import typing as t
-
-auto: t.Callable[[], t.Any] = enum.auto
 
 
 class Variance(enum.IntEnum):
-    CONTRAVARIANT: Variance = auto()
-    COVARIANT: Variance = auto()
-    INVARIANT: Variance = auto()
+    CONTRAVARIANT = enum.auto()
+    COVARIANT = enum.auto()
+    INVARIANT = enum.auto()
 
     def __invert__(self) -> Variance:
         if self is self.COVARIANT:
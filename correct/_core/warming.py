@@ -0,0 +1,131 @@
+import types
+import typing as t
+
+import typing_extensions as te
+from paradigm.base import (OverloadedSignature,
+                           PlainSignature)
+
+from . import (costs,
+               signatures)
+from .overrides import collect_namespace_classes
+from .predicates import (generic_to_ancestors_arguments,
+                         instance_methods_types,
+                         is_generic,
+                         is_protocol,
+                         is_record,
+                         is_type_var,
+                         protocol_to_fields,
+                         record_to_fields,
+                         to_arguments_variances)
+from .utils import (to_arguments,
+                    to_base,
+                    unpack_type_var)
+
+
+def precompile(module: types.ModuleType) -> None:
+    visited: t.Set[int] = set()
+    namespace = vars(module)
+    _warm_hints(module, visited)
+    classes: t.Dict[type, None] = {}
+    collect_namespace_classes(namespace, module.__name__, '', classes)
+    for cls in classes:
+        _warm_class(cls, visited)
+    for value in namespace.values():
+        if (isinstance(value, instance_methods_types)
+                and getattr(value, '__module__', None) == module.__name__):
+            _warm_callable(value, visited)
+
+
+_fields_types = (classmethod, property, staticmethod, *instance_methods_types)
+
+
+def _warm_annotation(annotation: t.Any, visited: t.Set[int]) -> None:
+    if isinstance(annotation, list):
+        for element in annotation:
+            _warm_annotation(element, visited)
+        return
+    elif id(annotation) in visited:
+        return
+    visited.add(id(annotation))
+    try:
+        costs.estimate(annotation)
+        if is_type_var(annotation):
+            _warm_annotation(unpack_type_var(annotation), visited)
+        elif isinstance(annotation, type):
+            if is_protocol(annotation):
+                for field in protocol_to_fields(annotation).values():
+                    if isinstance(field, _fields_types):
+                        _warm_field(field, visited)
+                    else:
+                        _warm_annotation(field, visited)
+            elif is_record(annotation):
+                for field in record_to_fields(annotation).types.values():
+                    _warm_annotation(field, visited)
+            if is_generic(annotation):
+                to_arguments_variances(annotation)
+                for arguments in generic_to_ancestors_arguments(
+                        annotation
+                ).values():
+                    for argument in arguments:
+                        _warm_annotation(argument, visited)
+        else:
+            base = to_base(annotation)
+            if base is not None:
+                _warm_annotation(base, visited)
+                for argument in to_arguments(annotation):
+                    _warm_annotation(argument, visited)
+    except Exception:
+        # unsupported annotations are reported on use
+        return
+
+
+def _warm_callable(value: t.Callable[..., t.Any],
+                   visited: t.Set[int]) -> None:
+    if id(value) in visited:
+        return
+    visited.add(id(value))
+    try:
+        signature = signatures.from_callable(value)
+    except (TypeError, ValueError):
+        # callables without signatures are reported on use
+        return
+    _warm_signature(signature, visited)
+
+
+def _warm_class(cls: type, visited: t.Set[int]) -> None:
+    _warm_annotation(cls, visited)
+    _warm_hints(cls, visited)
+    for field in vars(cls).values():
+        _warm_field(field, visited)
+
+
+def _warm_field(value: t.Any, visited: t.Set[int]) -> None:
+    if isinstance(value, (classmethod, staticmethod)):
+        _warm_callable(value.__func__, visited)
+    elif isinstance(value, property):
+        for accessor in (value.fget, value.fset, value.fdel):
+            if accessor is not None:
+                _warm_callable(accessor, visited)
+    elif isinstance(value, instance_methods_types):
+        _warm_callable(value, visited)
+
+
+def _warm_hints(value: t.Any, visited: t.Set[int]) -> None:
+    try:
+        hints = te.get_type_hints(value)
+    except Exception:
+        # unresolvable forward references are reported on use
+        return
+    for hint in hints.values():
+        _warm_annotation(hint, visited)
+
+
+def _warm_signature(signature: t.Union[OverloadedSignature, PlainSignature],
+                    visited: t.Set[int]) -> None:
+    if isinstance(signature, OverloadedSignature):
+        for overload in signature.signatures:
+            _warm_signature(overload, visited)
+    else:
+        _warm_annotation(signature.returns, visited)
+        for parameter in signature.parameters:
+            _warm_annotation(parameter.annotation, visited)
@@ -0,0 +1,86 @@
+import threading as _threading
+import types as _types
+from typing import Optional as _Optional
+
+from ._core.caching import (freeze as _freeze,
+                            invalidate as _invalidate)
+from ._core.warming import precompile as _precompile
+
+
+def freeze() -> None:
+    """
+    Freezes contents of all caches for sharing by forked processes.
+
+    Cached entries are moved to tables which are never written to afterwards
+    and all objects tracked by the garbage collector
+    are moved to its permanent generation (on CPython),
+    so after warming caches up in a parent process
+    (e.g. with ``precompile``) and calling this function right before forking
+    pages holding them are not copied by collections in children.
+    Entries computed afterwards are cached as usual,
+    while invalidation discards frozen ones as well.
+
+    >>> from correct.predicates import is_subtype
+    >>> is_subtype(int, int)
+    True
+    >>> freeze()
+    >>> is_subtype(int, int)
+    True
+    """
+    _freeze()
+
+
+def invalidate() -> None:
+    """
+    Invalidates all caches.
+
+    Caches are weakly keyed on annotations and callables,
+    so redefined classes never hit entries of their predecessors,
+    and are invalidated automatically on registration of virtual subclasses
+    with ``abc.ABCMeta.register``,
+    but reloading a module or patching members of existing classes
+    should be followed by this call.
+
+    >>> from abc import ABC
+    >>> from correct.predicates import is_subtype
+    >>> class Base(ABC):
+    ...     pass
+    >>> is_subtype(Base, Base)
+    True
+    >>> invalidate()
+    >>> is_subtype(Base, Base)
+    True
+    """
+    _invalidate()
+
+
+def precompile(module: _types.ModuleType,
+               *,
+               background: bool = False) -> _Optional[_threading.Thread]:
+    """
+    Warms caches up with annotations of given module.
+
+    Signatures of functions & methods, costs of annotations,
+    fields of protocols and ancestors & variances of generics
+    found in the module are computed ahead of time,
+    so first checks of its annotations do not pay for them.
+    With ``background`` flag set warming is done by a daemon thread
+    which is returned to be joined if needed.
+
+    >>> import json
+    >>> precompile(json)
+    >>> thread = precompile(json,
+    ...                     background=True)
+    >>> thread.join()
+    >>> thread.is_alive()
+    False
+    """
+    if not background:
+        _precompile(module)
+        return None
+    result = _threading.Thread(target=_precompile,
+                               args=(module,),
+                               name=f'precompile-{module.__name__}',
+                               daemon=True)
+    result.start()
+    return result
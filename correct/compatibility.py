@@ -0,0 +1,78 @@
+import os as _os
+import types as _types
+import typing as _t
+
+from ._core.compatibility import (Change as _Change,
+                                  Difference as _Difference,
+                                  diff_modules as _diff_modules,
+                                  load_package as _load_package,
+                                  to_report as _to_report)
+
+Change = _Change
+Difference = _Difference
+
+
+def diff_modules(
+        old_modules: _t.Mapping[str, _types.ModuleType],
+        new_modules: _t.Mapping[str, _types.ModuleType]
+) -> _t.List[Difference]:
+    """
+    Checks if public functions & classes of new versions of modules
+    can be used in place of the old ones:
+    their signatures should accept supertypes of old parameters annotations
+    and return subtypes of old returns annotations.
+
+    Modules are given by their names,
+    classes of the new version are matched with the old ones
+    by qualified names, so nominal checks between versions are possible.
+    Members with the same code & annotations are considered unchanged
+    without parsing their signatures.
+
+    >>> from types import ModuleType
+    >>> old_module, new_module = ModuleType('package'), ModuleType('package')
+    >>> exec('def scale(value: int) -> int:\\n'
+    ...      '    return value\\n', vars(old_module))
+    >>> exec('def scale(value: float) -> int:\\n'
+    ...      '    return int(value)\\n', vars(new_module))
+    >>> [(difference.name, difference.change)
+    ...  for difference in diff_modules({'package': old_module},
+    ...                                 {'package': new_module})]
+    [('package.scale', <Change.INCOMPATIBLE: 5>)]
+    """
+    return _diff_modules(old_modules, new_modules)
+
+
+def diff_paths(
+        package_name: str,
+        old_path: _t.Union[str, '_os.PathLike[str]'],
+        new_path: _t.Union[str, '_os.PathLike[str]']
+) -> _t.List[Difference]:
+    """
+    Checks compatibility of versions of a package
+    with their roots in given directories, see ``diff_modules``.
+
+    Versions are imported side by side along with all their submodules,
+    while importing one of them the other ones are hidden
+    from ``sys.modules``, so absolute imports inside of a package
+    resolve to the same version.
+    Submodules which fail to import are skipped.
+    """
+    return _diff_modules(_load_package(package_name, old_path),
+                         _load_package(package_name, new_path))
+
+
+def to_report(differences: _t.Iterable[Difference]) -> str:
+    """
+    Returns compact report on differences
+    with numbers of changes of each kind
+    followed by removed, incompatible & unsupported members.
+
+    >>> report = to_report([Difference('package.scale', Change.REMOVED, ''),
+    ...                     Difference('package.shift', Change.UNCHANGED, '')])
+    >>> summary, *details = report.splitlines()
+    >>> summary.split(', ')[:4]
+    ['unchanged: 1', 'compatible: 0', 'added: 0', 'removed: 1']
+    >>> details
+    ['removed package.scale']
+    """
+    return _to_report(differences)
@@ -0,0 +1,44 @@
+import typing as _t
+
+from ._core.dispatching import (Implementation as _Implementation,
+                                MultiDispatcher as _MultiDispatcher)
+from ._core.predicates import (
+    is_covariant_subtype as _is_covariant_subtype
+)
+
+_T = _t.TypeVar('_T')
+MultiDispatcher = _MultiDispatcher
+
+
+def multidispatch(
+        implementation: _Implementation[_T]
+) -> _MultiDispatcher[_T]:
+    """
+    Creates dispatcher which selects implementation
+    by types of positional arguments
+    among registered ones with annotations of positional parameters.
+
+    Argument types are compared covariantly
+    (with respect to variances of type variables in annotations),
+    the most specific implementation is resolved once per tuple of types
+    and reused on subsequent calls.
+
+    >>> @multidispatch
+    ... def describe(value: object) -> str:
+    ...     return 'object'
+    >>> @describe.register
+    ... def _(value: int) -> str:
+    ...     return 'integer'
+    >>> @describe.register
+    ... def _(value: int, other: int) -> str:
+    ...     return 'pair of integers'
+    >>> describe('')
+    'object'
+    >>> describe(True)
+    'integer'
+    >>> describe(0, 1)
+    'pair of integers'
+    """
+    result: _MultiDispatcher[_T] = _MultiDispatcher(_is_covariant_subtype)
+    result.register(implementation)
+    return result
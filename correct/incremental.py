@@ -0,0 +1,39 @@
+import typing as _t
+
+from ._core.dependencies import Dependency as _Dependency
+from ._core.incremental import Rechecker as _Rechecker
+from .predicates import is_subtype_tracked as _is_subtype_tracked
+
+Dependency = _Dependency
+_KT = _t.TypeVar('_KT')
+
+
+class Rechecker(_Rechecker[_KT]):
+    """
+    Keeps results of subtype checks for keyed pairs of annotations
+    along with their dependencies
+    and re-evaluates only pairs affected by changes.
+
+    Pairs without results are evaluated
+    and results of pairs which are not passed anymore are dropped.
+
+    >>> class Base:
+    ...     pass
+    >>> rechecker = Rechecker()
+    >>> rechecker.recheck({'own': (Base, Base), 'builtin': (int, int)})
+    {'own': True, 'builtin': True}
+    >>> rechecker.recheck({'own': (Base, Base), 'builtin': (int, int)})
+    {}
+    >>> class Base:
+    ...     pass
+    >>> rechecker.recheck({'own': (Base, Base), 'builtin': (int, int)},
+    ...                   classes=[Base])
+    {'own': True}
+    >>> sorted(rechecker.to_affected(modules=['builtins']))
+    ['builtin', 'own']
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(_is_subtype_tracked)
@@ -0,0 +1,39 @@
+import typing as _t
+
+from ._core.indexing import SubtypeIndex as _SubtypeIndex
+from ._core.predicates import (
+    is_covariant_subtype as _is_covariant_subtype
+)
+
+_T = _t.TypeVar('_T')
+
+
+class SubtypeIndex(_SubtypeIndex[_T]):
+    """
+    Maps annotations to values
+    with lookup of the most specific entries
+    registered under supertypes of a given annotation.
+
+    Entries are bucketed by their base classes,
+    so lookup visits only buckets of query ancestors
+    and entries with structural annotations (protocols, callables, etc.),
+    lookup results are cached until the next registration.
+
+    >>> from typing import Sequence
+    >>> index = SubtypeIndex()
+    >>> index.register(object, 'object')
+    >>> index.register(int, 'int')
+    >>> index.register(Sequence[int], 'sequence of integers')
+    >>> index.lookup(bool)
+    ((<class 'int'>, 'int'),)
+    >>> index.lookup(float)
+    ((<class 'object'>, 'object'),)
+    >>> from typing import List
+    >>> index.lookup(List[int])
+    ((typing.Sequence[int], 'sequence of integers'),)
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(_is_covariant_subtype)
@@ -0,0 +1,71 @@
+import typing as _t
+
+from ._core.hints import Annotation as _Annotation
+from ._core.lattice import (Joiner as _Joiner,
+                            join as _join)
+from ._core.predicates import (
+    is_covariant_subtype as _is_covariant_subtype
+)
+
+
+class Joiner(_Joiner):
+    """
+    Accumulates least upper bound of observed annotations
+    keeping only maximal variants.
+
+    Annotations are compared covariantly,
+    recently absorbed annotations are remembered
+    (at most ``covered_capacity`` of them)
+    to skip re-checking on repeated observations,
+    when ``max_variants`` is exceeded the result is widened
+    to the most specific common ancestor class of variants
+    (or ``Any`` if there is none), so memory stays bounded.
+
+    >>> joiner = Joiner()
+    >>> joiner.result
+    typing.NoReturn
+    >>> joiner.add(bool)
+    True
+    >>> joiner.add(int)
+    True
+    >>> joiner.add(bool)
+    False
+    >>> joiner.result
+    <class 'int'>
+    >>> joiner.add(str)
+    True
+    >>> joiner.result
+    typing.Union[int, str]
+    >>> bounded_joiner = Joiner(max_variants=2)
+    >>> for cls in (int, str, float):
+    ...     _ = bounded_joiner.add(cls)
+    >>> bounded_joiner.result
+    <class 'object'>
+    """
+
+    __slots__ = ()
+
+    def __init__(self,
+                 *,
+                 covered_capacity: int = 1024,
+                 max_variants: int = 64) -> None:
+        super().__init__(_is_covariant_subtype,
+                         covered_capacity=covered_capacity,
+                         max_variants=max_variants)
+
+
+def join(left: _Annotation, right: _Annotation) -> _Annotation:
+    """
+    Returns least upper bound of annotations.
+
+    >>> join(bool, int)
+    <class 'int'>
+    >>> join(int, bool)
+    <class 'int'>
+    >>> join(int, str)
+    typing.Union[int, str]
+    >>> from typing import Union
+    >>> join(Union[bool, str], int)
+    typing.Union[str, int]
+    """
+    return _join(left, right, _is_covariant_subtype)
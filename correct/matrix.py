@@ -0,0 +1,35 @@
+from ._core.matrix import SubclassMatrix as _SubclassMatrix
+
+
+class SubclassMatrix(_SubclassMatrix):
+    """
+    Bulk ``issubclass`` relation over given classes
+    stored as a bitset matrix with rows of ancestors.
+
+    Built from MROs of classes
+    along with virtual subclasses of abstract classes
+    defining subclass hooks or having registered subclasses,
+    answers whole rows & columns with vectorized operations.
+
+    Requires ``numpy``.
+
+    >>> from collections.abc import Sequence
+    >>> matrix = SubclassMatrix([object, int, bool, str, tuple, Sequence])
+    >>> matrix.is_subclass(bool, int)
+    True
+    >>> matrix.subclasses(Sequence)
+    [<class 'str'>, <class 'tuple'>, <class 'collections.abc.Sequence'>]
+    >>> matrix.superclasses(bool)
+    [<class 'object'>, <class 'int'>, <class 'bool'>]
+    >>> matrix.to_subclasses_mask(int)
+    array([False,  True,  True, False, False, False])
+    >>> matrix.to_array(packed=True)
+    array([[128],
+           [192],
+           [224],
+           [148],
+           [140],
+           [132]], dtype=uint8)
+    """
+
+    __slots__ = ()
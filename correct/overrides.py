@@ -0,0 +1,58 @@
+import typing as _t
+
+from ._core.overrides import (Override as _Override,
+                              OverrideCheck as _OverrideCheck,
+                              check_overrides as _check_overrides,
+                              collect_classes as _collect_classes)
+
+Override = _Override
+OverrideCheck = _OverrideCheck
+
+
+def check_classes(classes: _t.Iterable[type],
+                  *,
+                  jobs: int = 1) -> _t.List[OverrideCheck]:
+    """
+    Checks if methods, properties, class & static methods of given classes
+    are compatible with definitions they override in base classes.
+
+    Each distinct pair of overriding & overridden members is checked once,
+    with ``jobs`` greater than one checks are distributed
+    over worker processes, classes which can not be imported by name
+    are checked in the calling one.
+
+    >>> from correct.predicates import Status
+    >>> class Base:
+    ...     def method(self, value: int) -> int:
+    ...         return value
+    >>> class Compatible(Base):
+    ...     def method(self, value: object) -> bool:
+    ...         return bool(value)
+    >>> class Incompatible(Base):
+    ...     def method(self, value: bool) -> int:
+    ...         return value
+    >>> result, = check_classes([Compatible])
+    >>> result.status is Status.SUBTYPE
+    True
+    >>> result, = check_classes([Incompatible])
+    >>> result.status is Status.NOT_SUBTYPE
+    True
+    >>> result.override.base is Base
+    True
+    """
+    return _check_overrides(classes,
+                            jobs=jobs)
+
+
+def check_package(name: str, *, jobs: int = 1) -> _t.List[OverrideCheck]:
+    """
+    Checks overrides of classes defined in a package and all its submodules,
+    submodules which fail to import are skipped.
+
+    >>> results = check_package('json')
+    >>> [(result.override.owner.__name__, result.override.name)
+    ...  for result in results]
+    [('JSONDecodeError', '__reduce__')]
+    """
+    return _check_overrides(_collect_classes(name),
+                            jobs=jobs)
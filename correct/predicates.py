@@ -1,7 +1,66 @@
+import typing as _t
+
+from ._core.budget import (Budget as _Budget,
+                           BudgetedResult as _BudgetedResult,
+                           run_within as _run_within)
+from ._core.checker import (Checker as _Checker,
+                            CheckerStats as _CheckerStats)
+from ._core.checking import (CheckResult as _CheckResult,
+                             Status as _Status,
+                             check as _check)
+from ._core.dependencies import (TrackedResult as _TrackedResult,
+                                 run_tracking as _run_tracking)
 from ._core.hints import Annotation as _Annotation
-from ._core.predicates import is_subtype as _is_subtype
+from ._core.predicates import (PrefilterTier as _PrefilterTier,
+                               is_subtype as _is_subtype,
+                               prefilter_hits as _prefilter_hits)
 from ._core.variance import Variance as _Variance
 
+BudgetedResult = _BudgetedResult
+CheckResult = _CheckResult
+CheckerStats = _CheckerStats
+PrefilterTier = _PrefilterTier
+Status = _Status
+TrackedResult = _TrackedResult
+Variance = _Variance
+
+
+class Checker(_Checker):
+    """
+    Checks subtyping of annotations with given defaults
+    of variances & budget.
+
+    Predicates are bound once on construction,
+    results are cached by each checker separately on top of shared caches
+    (with ``capacity`` limiting its own cache),
+    so services can keep isolated pre-warmed checkers,
+    e.g. one per tenant.
+
+    >>> checker = Checker(right_variance=Variance.COVARIANT)
+    >>> checker
+    Checker(left_variance=Variance.INVARIANT, \
+right_variance=Variance.COVARIANT, max_steps=None, timeout=None)
+    >>> checker.is_subtype(bool, int)
+    True
+    >>> checker.is_subtype(bool, int)
+    True
+    >>> checker.stats
+    CheckerStats(checks=2, misses=1)
+    >>> checker.check(int, bool).reason
+    '"builtins.int" is not a subtype of "builtins.bool".'
+    >>> from typing import List
+    >>> checker.is_subtype_within(List[bool], List[int],
+    ...                           max_steps=0).value is None
+    True
+    >>> result = checker.is_subtype_tracked(bool, int)
+    >>> result.value
+    True
+    >>> sorted(dependency.name for dependency in result.dependencies)
+    ['bool', 'int', 'object']
+    """
+
+    __slots__ = ()
+
 
 def is_subtype(left: _Annotation, right: _Annotation) -> bool:
     """
@@ -23,3 +82,97 @@ def is_subtype(left: _Annotation, right: _Annotation) -> bool:
     True
     """
     return _is_subtype(_Variance.INVARIANT, _Variance.INVARIANT, left, right)
+
+
+def is_subtype_within(left: _Annotation,
+                      right: _Annotation,
+                      *,
+                      max_steps: _t.Optional[int] = None,
+                      timeout: _t.Optional[float] = None) -> BudgetedResult:
+    """
+    Checks if annotation is a subtype of another
+    within given number of recursive steps and/or seconds.
+
+    Returns result with ``None`` value if budget is exhausted
+    along with number of steps made and seconds elapsed.
+
+    >>> from typing import List
+    >>> is_subtype_within(List[int], List[int]).value
+    True
+    >>> is_subtype_within(List[int], List[bool]).value
+    False
+    >>> result = is_subtype_within(List[int], List[int],
+    ...                            max_steps=0)
+    >>> result.value, result.steps
+    (None, 0)
+    """
+    return _run_within(
+            lambda: _is_subtype(_Variance.INVARIANT, _Variance.INVARIANT,
+                                left, right),
+            _Budget(max_steps=max_steps,
+                    timeout=timeout)
+    )
+
+
+def is_subtype_tracked(left: _Annotation,
+                       right: _Annotation) -> TrackedResult:
+    """
+    Checks if annotation is a subtype of another
+    recording classes & callables the result depends on.
+
+    Dependencies are identified by modules & qualified names,
+    so they stay valid after reloading of modules.
+
+    >>> from typing import List
+    >>> result = is_subtype_tracked(List[bool], List[int])
+    >>> result.value
+    False
+    >>> sorted(dependency.name for dependency in result.dependencies)
+    ['bool', 'int', 'list', 'object']
+    """
+    return _run_tracking(lambda: _is_subtype(_Variance.INVARIANT,
+                                             _Variance.INVARIANT,
+                                             left, right))
+
+
+def check(left: _Annotation, right: _Annotation) -> CheckResult:
+    """
+    Checks if annotation is a subtype of another without raising
+    on unsupported annotations.
+
+    Returns result with status and lazily formatted reason,
+    outcomes are cached, so repeated checks of unsupported annotations
+    do not raise internally either.
+
+    >>> result = check(int, int)
+    >>> result
+    CheckResult(SUBTYPE)
+    >>> bool(result)
+    True
+    >>> check(bool, int).reason
+    '"builtins.bool" is not a subtype of "builtins.int".'
+    >>> result = check(int, 0)
+    >>> result.status is Status.UNSUPPORTED
+    True
+    >>> result.reason
+    'Unsupported annotation: "0".'
+    """
+    return _check(_Variance.INVARIANT, _Variance.INVARIANT, left, right)
+
+
+def to_prefilter_hits() -> _t.Dict[PrefilterTier, int]:
+    """
+    Returns numbers of checks settled by each tier of pre-filter
+    which runs before general classification of annotations:
+    identical annotations, equal specializations,
+    ``typing.Any``/``object`` and plain classes.
+
+    Counts are cumulative and may miss some hits under contention.
+
+    >>> before = to_prefilter_hits()[PrefilterTier.CLASSES]
+    >>> is_subtype(bool, int)
+    False
+    >>> to_prefilter_hits()[PrefilterTier.CLASSES] - before
+    1
+    """
+    return dict(_prefilter_hits)
@@ -1,3 +1,5 @@
+import os
+import platform
 from pathlib import Path
 
 from setuptools import (find_packages,
@@ -12,8 +14,19 @@ def read_file(path_string: str) -> str:
     return Path(path_string).read_text(encoding='utf-8')
 
 
+parameters = {}
+if (os.getenv('CORRECT_USE_MYPYC') == '1'
+        and platform.python_implementation() == 'CPython'):
+    from mypyc.build import mypycify
+
+    # sources are shipped along with extensions as a fallback
+    parameters['ext_modules'] = mypycify(
+            ['correct/_core/predicates.py', 'correct/_core/signatures.py',
+             'correct/_core/utils.py', 'correct/_core/variance.py']
+    )
 setup(name=correct.__name__,
       packages=find_packages(exclude=('tests', 'tests.*')),
+      package_data={'correct._core': ['data/*.pickle.zlib']},
       version=correct.__version__,
       description=correct.__doc__,
       long_description=read_file('README.md'),
@@ -34,4 +47,6 @@ setup(name=correct.__name__,
       url=project_base_url,
       download_url=project_base_url + 'archive/master.zip',
       python_requires='>=3.7',
-      install_requires=read_file('requirements.txt'))
+      install_requires=read_file('requirements.txt'),
+      extras_require={'numpy': read_file('requirements-numpy.txt')},
+      **parameters)
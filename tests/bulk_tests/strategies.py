@@ -0,0 +1,79 @@
+import json
+import typing as t
+from collections import abc
+
+from hypothesis import strategies
+from hypothesis.strategies import SearchStrategy
+
+from correct._core.variance import Variance
+from correct.hints import Annotation
+
+Case = t.Tuple[str, Annotation]
+
+leaves_cases = strategies.sampled_from([
+    ('int', int), ('builtins.int', int), ('bool', bool), ('str', str),
+    ('object', object), ('None', None), ('typing.Any', t.Any),
+    ('typing.SupportsInt', t.SupportsInt),
+    ('collections.abc.Sequence', abc.Sequence),
+    ('collections.abc.Hashable', abc.Hashable)
+])
+
+
+def to_list_case(case: Case) -> Case:
+    expression, annotation = case
+    return f'typing.List[{expression}]', t.List[annotation]
+
+
+def to_optional_case(case: Case) -> Case:
+    expression, annotation = case
+    return f'typing.Optional[{expression}]', t.Optional[annotation]
+
+
+def to_union_case(cases: t.List[Case]) -> Case:
+    expressions, annotations = zip(*cases)
+    return (f'typing.Union[{", ".join(expressions)}]',
+            t.Union[annotations])
+
+
+def to_tuple_case(cases: t.List[Case]) -> Case:
+    expressions, annotations = zip(*cases)
+    return (f'typing.Tuple[{", ".join(expressions)}]',
+            t.Tuple[annotations])
+
+
+def to_callable_case(cases: t.List[Case]) -> Case:
+    (returns_expression, returns), *parameters_cases = cases
+    parameters_expressions = [expression
+                              for expression, _ in parameters_cases]
+    parameters = [annotation for _, annotation in parameters_cases]
+    return (f'typing.Callable[[{", ".join(parameters_expressions)}], '
+            f'{returns_expression}]',
+            t.Callable[parameters, returns])
+
+
+def nest_cases(base: SearchStrategy[Case]) -> SearchStrategy[Case]:
+    cases_lists = strategies.lists(base,
+                                   min_size=1,
+                                   max_size=3)
+    return (base.map(to_list_case)
+            | base.map(to_optional_case)
+            | cases_lists.map(to_union_case)
+            | cases_lists.map(to_tuple_case)
+            | cases_lists.map(to_callable_case))
+
+
+cases = strategies.recursive(leaves_cases, nest_cases,
+                             max_leaves=10)
+invalid_expressions = strategies.sampled_from(['0 + 1', 'print("")',
+                                               'int.__sub', '-int',
+                                               'unknown_module.Class'])
+variances = strategies.sampled_from(list(Variance))
+
+
+def to_line(left_case: Case, right_case: Case) -> str:
+    (left_expression, _), (right_expression, _) = left_case, right_case
+    return json.dumps({'left': left_expression, 'right': right_expression})
+
+
+cases_pairs_lists = strategies.lists(strategies.tuples(cases, cases),
+                                     max_size=10)
@@ -0,0 +1,89 @@
+import json
+import sys
+import tempfile
+import typing as t
+from pathlib import Path
+
+from hypothesis import given
+
+from correct._core.bulk import check_lines
+from correct._core.checking import check
+from correct._core.variance import Variance
+from . import strategies
+
+
+@given(strategies.cases_pairs_lists, strategies.variances)
+def test_basic(cases_pairs: t.List[t.Tuple[strategies.Case,
+                                           strategies.Case]],
+               variance: Variance) -> None:
+    lines = [strategies.to_line(left_case, right_case)
+             for left_case, right_case in cases_pairs]
+
+    result, _ = check_lines(variance, lines)
+
+    assert len(result) == len(lines)
+    assert all(line.endswith('\n') for line in result)
+    assert all(
+            json.loads(output)['status']
+            == check(variance, variance, left, right).status.name.lower()
+            for output, ((_, left), (_, right)) in zip(result, cases_pairs)
+    )
+
+
+@given(strategies.cases, strategies.invalid_expressions,
+       strategies.variances)
+def test_unresolvable(case: strategies.Case,
+                      expression: str,
+                      variance: Variance) -> None:
+    left_expression, _ = case
+    line = json.dumps({'id': 0, 'left': left_expression,
+                       'right': expression})
+
+    result, _ = check_lines(variance, [line])
+
+    output, = map(json.loads, result)
+    assert output['id'] == 0
+    assert output['status'] == 'unresolved'
+    assert isinstance(output['reason'], str)
+
+
+@given(strategies.cases, strategies.variances)
+def test_signatureless_class(case: strategies.Case,
+                             variance: Variance) -> None:
+    expression, _ = case
+    lines = [json.dumps({'id': 0, 'left': 'collections._tuplegetter',
+                         'right': 'typing.Callable[[int], '
+                                  'collections._tuplegetter]'}),
+             json.dumps({'id': 1, 'left': expression, 'right': expression})]
+
+    result, _ = check_lines(variance, lines)
+
+    assert [output['id'] for output in map(json.loads, result)] == [0, 1]
+
+
+def test_invalid() -> None:
+    lines = ['{', json.dumps({'left': 'int'})]
+
+    result, _ = check_lines(Variance.COVARIANT, lines)
+
+    outputs = list(map(json.loads, result))
+    assert [output['status'] for output in outputs] == ['invalid'] * 2
+    assert [output['line'] for output in outputs] == lines
+
+
+def test_exiting_module() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        Path(root, 'exiting_module.py').write_text('raise SystemExit(1)\n')
+        sys.path.insert(0, root)
+        try:
+            result, _ = check_lines(
+                    Variance.COVARIANT,
+                    [json.dumps({'id': 0, 'left': 'exiting_module.Value',
+                                 'right': 'int'})]
+            )
+        finally:
+            sys.path.remove(root)
+
+    output, = map(json.loads, result)
+    assert output['id'] == 0
+    assert output['status'] == 'unresolved'
@@ -0,0 +1,34 @@
+import pytest
+from hypothesis import given
+
+from correct._core.bulk import Resolver
+from . import strategies
+
+
+@given(strategies.cases)
+def test_basic(case: strategies.Case) -> None:
+    expression, annotation = case
+    resolver = Resolver()
+
+    result = resolver.resolve(expression)
+
+    assert result == annotation
+
+
+@given(strategies.cases)
+def test_interning(case: strategies.Case) -> None:
+    expression, _ = case
+    resolver = Resolver()
+
+    result = resolver.resolve(expression)
+
+    assert resolver.resolve(expression) is result
+    assert len(resolver) == 1
+
+
+@given(strategies.invalid_expressions)
+def test_invalid(expression: str) -> None:
+    resolver = Resolver()
+
+    with pytest.raises(Exception):
+        resolver.resolve(expression)
@@ -0,0 +1,13 @@
+import importlib
+
+from hypothesis import strategies
+
+from tests.predicates_tests.strategies import plain_static_annotations
+
+modules = strategies.sampled_from(['collections', 'collections.abc',
+                                   'email.message', 'functools', 'io',
+                                   'json', 'numbers', 'pathlib',
+                                   'typing']).map(importlib.import_module)
+annotations_pairs = strategies.tuples(plain_static_annotations,
+                                      plain_static_annotations)
+keys_lists = strategies.lists(strategies.integers())
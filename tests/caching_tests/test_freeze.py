@@ -0,0 +1,68 @@
+import gc
+import typing as t
+
+from hypothesis import given
+
+from correct._core.caching import (StripedCache,
+                                   WeakStripedCache)
+from correct.caching import (freeze,
+                             invalidate)
+from tests.utils import is_covariant_subtype
+from . import strategies
+
+
+@given(strategies.annotations_pairs)
+def test_results(annotations_pair: t.Tuple[t.Any, t.Any]) -> None:
+    left, right = annotations_pair
+    invalidate()
+    result = is_covariant_subtype(left, right)
+
+    freeze()
+    # not available on PyPy which has no reference counting
+    unfreeze_collector = getattr(gc, 'unfreeze', None)
+    if unfreeze_collector is not None:
+        unfreeze_collector()
+
+    assert is_covariant_subtype(left, right) is result
+
+
+@given(strategies.keys_lists)
+def test_entries(keys: t.List[int]) -> None:
+    cache: StripedCache[int, str] = StripedCache()
+    for key in keys:
+        cache.lookup(key, str)
+
+    cache.freeze()
+
+    assert len(cache) == len(set(keys))
+    assert all(cache.lookup(key, _fail) == str(key) for key in keys)
+
+
+@given(strategies.keys_lists)
+def test_invalidation(keys: t.List[int]) -> None:
+    cache: StripedCache[int, str] = StripedCache()
+    for key in keys:
+        cache.lookup(key, str)
+    cache.freeze()
+
+    invalidate()
+
+    assert all(cache.lookup(key, repr) == repr(key) for key in keys)
+
+
+def test_dead_entries() -> None:
+    cache: WeakStripedCache[t.Tuple[type], str] = WeakStripedCache()
+
+    class Local:
+        pass
+
+    cache.lookup((Local,), repr)
+    cache.freeze()
+    del Local
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+def _fail(key: t.Any) -> t.NoReturn:
+    raise AssertionError(key)
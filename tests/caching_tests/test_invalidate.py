@@ -0,0 +1,57 @@
+import gc
+import weakref
+from abc import ABC
+
+import typing_extensions as te
+
+from correct.caching import invalidate
+from tests.utils import is_covariant_subtype
+
+
+def test_virtual_subclass_registration() -> None:
+    class Base(ABC):
+        pass
+
+    class Derived:
+        pass
+
+    assert not is_covariant_subtype(Derived, Base)
+
+    Base.register(Derived)
+
+    assert is_covariant_subtype(Derived, Base)
+
+
+def test_members_patching() -> None:
+    class Sized(te.Protocol):
+        def size(self) -> int:
+            ...
+
+    class Implementation:
+        def size(self) -> int:
+            return 0
+
+    assert is_covariant_subtype(Implementation, Sized)
+
+    del Implementation.size
+    invalidate()
+
+    assert not is_covariant_subtype(Implementation, Sized)
+
+
+def test_collection() -> None:
+    class Sized(te.Protocol):
+        def size(self) -> int:
+            ...
+
+    class Implementation:
+        def size(self) -> int:
+            return 0
+
+    assert is_covariant_subtype(Implementation, Sized)
+
+    references = [weakref.ref(Sized), weakref.ref(Implementation)]
+    del Sized, Implementation
+    gc.collect()
+
+    assert all(reference() is None for reference in references)
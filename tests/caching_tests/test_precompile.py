@@ -0,0 +1,43 @@
+import types
+import typing as t
+
+from hypothesis import given
+
+from correct.caching import (invalidate,
+                             precompile)
+from tests.utils import is_covariant_subtype
+from . import strategies
+
+
+@given(strategies.modules)
+def test_basic(module: types.ModuleType) -> None:
+    result = precompile(module)
+
+    assert result is None
+
+
+@given(strategies.modules)
+def test_background(module: types.ModuleType) -> None:
+    result = precompile(module,
+                        background=True)
+
+    assert result is not None
+    assert result.daemon
+
+    result.join()
+
+    assert not result.is_alive()
+
+
+@given(strategies.modules, strategies.annotations_pairs)
+def test_results(module: types.ModuleType,
+                 annotations_pair: t.Tuple[t.Any, t.Any]) -> None:
+    left, right = annotations_pair
+    invalidate()
+    cold_result = is_covariant_subtype(left, right)
+
+    invalidate()
+    precompile(module)
+    warm_result = is_covariant_subtype(left, right)
+
+    assert warm_result is cold_result
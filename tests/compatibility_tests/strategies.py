@@ -0,0 +1,25 @@
+import typing as t
+
+from hypothesis import strategies
+
+annotations_sources = strategies.sampled_from([
+    'bool', 'int', 'float', 'object', 'str', 'typing.Any',
+    'typing.Optional[int]', 'typing.List[int]', 'typing.Sequence[int]',
+    'Model', 'typing.List[Model]'
+])
+functions_names = strategies.sampled_from(['first', 'second', 'third'])
+
+
+def to_module_source(functions: t.Dict[str, t.Tuple[str, str]]) -> str:
+    return ''.join(['import typing\n\n\n'
+                    'class Model:\n'
+                    '    pass\n',
+                    *[f'\n\ndef {name}(value: {parameter}) -> {returns}:\n'
+                      f'    return value\n'
+                      for name, (parameter, returns) in functions.items()]])
+
+
+functions = strategies.dictionaries(
+        functions_names, strategies.tuples(annotations_sources,
+                                           annotations_sources)
+)
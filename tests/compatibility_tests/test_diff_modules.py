@@ -0,0 +1,59 @@
+import typing as t
+
+from hypothesis import given
+
+from correct._core.predicates import is_covariant_subtype
+from correct.compatibility import (Change,
+                                   diff_modules)
+from . import strategies
+from .utils import (PACKAGE_NAME,
+                    resolve,
+                    to_module)
+
+Functions = t.Dict[str, t.Tuple[str, str]]
+
+
+@given(strategies.functions, strategies.functions)
+def test_basic(old_functions: Functions, new_functions: Functions) -> None:
+    old_module = to_module(strategies.to_module_source(old_functions))
+    new_module = to_module(strategies.to_module_source(new_functions))
+
+    result = diff_modules({PACKAGE_NAME: old_module},
+                          {PACKAGE_NAME: new_module})
+
+    changes = {difference.name: difference.change
+               for difference in result}
+    assert {name
+            for name, change in changes.items()
+            if change is Change.REMOVED} == {
+        f'{PACKAGE_NAME}.{name}'
+        for name in old_functions.keys() - new_functions.keys()
+    }
+    assert {name
+            for name, change in changes.items()
+            if change is Change.ADDED} == {
+        f'{PACKAGE_NAME}.{name}'
+        for name in new_functions.keys() - old_functions.keys()
+    }
+    assert all(
+            (changes[f'{PACKAGE_NAME}.{name}'] is not Change.INCOMPATIBLE)
+            is (is_covariant_subtype(resolve(old_module, old_parameter),
+                                     resolve(old_module, new_parameter))
+                and is_covariant_subtype(resolve(old_module, new_returns),
+                                         resolve(old_module, old_returns)))
+            for name, (old_parameter, old_returns) in old_functions.items()
+            if name in new_functions
+            for new_parameter, new_returns in [new_functions[name]]
+    )
+
+
+@given(strategies.functions)
+def test_same_sources(functions: Functions) -> None:
+    source = strategies.to_module_source(functions)
+
+    result = diff_modules({PACKAGE_NAME: to_module(source)},
+                          {PACKAGE_NAME: to_module(source)})
+
+    assert all(difference.change is Change.UNCHANGED
+               for difference in result)
+    assert len(result) == len(functions) + 1
@@ -0,0 +1,44 @@
+import sys
+import tempfile
+import typing as t
+from pathlib import Path
+
+from hypothesis import given
+
+from correct.compatibility import (diff_modules,
+                                   diff_paths)
+from . import strategies
+from .utils import (PACKAGE_NAME,
+                    to_module)
+
+Functions = t.Dict[str, t.Tuple[str, str]]
+
+
+@given(strategies.functions, strategies.functions)
+def test_basic(old_functions: Functions, new_functions: Functions) -> None:
+    old_source = strategies.to_module_source(old_functions)
+    new_source = strategies.to_module_source(new_functions)
+    with tempfile.TemporaryDirectory() as old_path, \
+            tempfile.TemporaryDirectory() as new_path:
+        write_package(old_path, old_source)
+        write_package(new_path, new_source)
+
+        result = diff_paths(PACKAGE_NAME, old_path, new_path)
+
+    assert PACKAGE_NAME not in sys.modules
+    assert [(difference.name, difference.change)
+            for difference in result] == [
+        (difference.name, difference.change)
+        for difference in diff_modules(
+                {PACKAGE_NAME: to_module(old_source)},
+                {PACKAGE_NAME: to_module(new_source)}
+        )
+    ]
+
+
+def write_package(root: str, source: str) -> None:
+    package_path = Path(root, PACKAGE_NAME)
+    package_path.mkdir()
+    (package_path / '__init__.py').write_text(source)
+    # entry points are not imported
+    (package_path / '__main__.py').write_text('raise SystemExit(1)\n')
@@ -0,0 +1,14 @@
+import typing as t
+from types import ModuleType
+
+PACKAGE_NAME = 'package_under_test'
+
+
+def to_module(source: str) -> ModuleType:
+    result = ModuleType(PACKAGE_NAME)
+    exec(source, vars(result))
+    return result
+
+
+def resolve(module: ModuleType, source: str) -> t.Any:
+    return eval(source, vars(module))
@@ -5,7 +5,7 @@ from typing import TypeVar
 import pytest
 from hypothesis import settings
 
-from correct._core.utils import annotation_repr
+from correct._core.utils import type_var_repr
 
 on_ci = bool(os.getenv('CI', False))
 is_pypy = sys.implementation.name == 'pypy'
@@ -18,7 +18,12 @@ settings.register_profile('default',
 @pytest.fixture(scope='session',
                 autouse=True)
 def setup_repr() -> None:
-    TypeVar.__repr__ = annotation_repr.dispatch(TypeVar)
+    TypeVar.__repr__ = _type_var_repr
+
+
+def _type_var_repr(self: TypeVar) -> str:
+    # compiled functions are not bound as methods
+    return type_var_repr(self)
 
 
 @pytest.hookimpl(trylast=True)
@@ -0,0 +1,20 @@
+import builtins
+import types
+
+from hypothesis import strategies
+
+builtins_callables = strategies.sampled_from([
+    candidate
+    for value in vars(builtins).values()
+    if isinstance(value, type)
+    for candidate in [value, *vars(value).values()]
+    if isinstance(candidate, (type, types.BuiltinFunctionType,
+                              types.ClassMethodDescriptorType,
+                              types.MethodDescriptorType,
+                              types.WrapperDescriptorType))
+])
+python_callables = strategies.sampled_from([
+    value
+    for value in vars(types).values()
+    if isinstance(value, types.FunctionType)
+])
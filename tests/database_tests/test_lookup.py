@@ -0,0 +1,24 @@
+import typing as t
+
+from hypothesis import given
+from paradigm.base import signature_from_callable
+
+from correct._core.database import lookup
+from . import strategies
+
+
+@given(strategies.builtins_callables)
+def test_builtins(value: t.Callable[..., t.Any]) -> None:
+    result = lookup(value)
+
+    assert result is None or result == signature_from_callable(value)
+
+
+@given(strategies.python_callables)
+def test_fallback(value: t.Callable[..., t.Any]) -> None:
+    assert lookup(value) is None
+
+
+def test_bound_methods() -> None:
+    assert lookup(''.join) is None
+    assert lookup([].append) is None
@@ -0,0 +1,12 @@
+from hypothesis import strategies
+
+from tests.predicates_tests.strategies import (
+    is_not_special_generic_alias_origin
+)
+
+classes = strategies.from_type(type).filter(
+        is_not_special_generic_alias_origin
+)
+classes_lists = strategies.lists(classes,
+                                 min_size=1,
+                                 max_size=3)
@@ -0,0 +1,101 @@
+import gc
+import inspect
+import typing as t
+import weakref
+
+import pytest
+from hypothesis import given
+
+from correct.dispatching import multidispatch
+from tests.utils import is_covariant_subtype
+from . import strategies
+
+
+@given(strategies.classes_lists)
+def test_basic(classes: t.List[type]) -> None:
+    implementation = multidispatch(_to_implementation([]))
+
+    for arity in range(1, len(classes) + 1):
+        implementation.register(_to_implementation(classes[:arity]))
+
+    for arity in range(len(classes) + 1):
+        assert implementation.dispatch(*classes[:arity])() == tuple(
+                classes[:arity]
+        )
+
+
+@given(strategies.classes_lists, strategies.classes_lists)
+def test_dispatch(classes: t.List[type], types: t.List[type]) -> None:
+    implementation = multidispatch(_to_implementation(classes))
+
+    try:
+        result = implementation.dispatch(*types)
+    except TypeError:
+        assert not (len(types) == len(classes)
+                    and all(map(is_covariant_subtype, types, classes)))
+    else:
+        assert result is implementation.dispatch(*types)
+        assert len(types) == len(classes)
+        assert all(map(is_covariant_subtype, types, classes))
+
+
+def test_ambiguity() -> None:
+    @multidispatch
+    def implementation(first: int, second: object) -> str:
+        return 'first'
+
+    @implementation.register
+    def _(first: object, second: int) -> str:
+        return 'second'
+
+    assert implementation(0, '') == 'first'
+    assert implementation('', 0) == 'second'
+    with pytest.raises(TypeError):
+        implementation(0, 0)
+
+
+def test_type_variables() -> None:
+    contravariant_bool = t.TypeVar('contravariant_bool',
+                                   bound=bool,
+                                   contravariant=True)
+
+    @multidispatch
+    def implementation(value: str) -> str:
+        return 'string'
+
+    @implementation.register
+    def _(value: contravariant_bool) -> str:
+        return 'integer'
+
+    assert implementation(0) == 'integer'
+    assert implementation('') == 'string'
+
+
+def test_collection() -> None:
+    @multidispatch
+    def implementation(value: object) -> str:
+        return 'object'
+
+    class Local:
+        pass
+
+    assert implementation(Local()) == 'object'
+    reference = weakref.ref(Local)
+    del Local
+    gc.collect()
+
+    assert reference() is None
+
+
+def _to_implementation(
+        classes: t.List[type]
+) -> t.Callable[..., t.Tuple[type, ...]]:
+    def implementation(*_: t.Any) -> t.Tuple[type, ...]:
+        return tuple(classes)
+
+    implementation.__signature__ = inspect.Signature(  # type: ignore
+            [inspect.Parameter(f'_{index}', inspect.Parameter.POSITIONAL_ONLY,
+                               annotation=cls)
+             for index, cls in enumerate(classes)]
+    )
+    return implementation
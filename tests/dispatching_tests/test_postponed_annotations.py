@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import typing as t
+
+from correct.dispatching import multidispatch
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: int
+
+
+def test_basic() -> None:
+    @multidispatch
+    def implementation(value: object) -> str:
+        return 'object'
+
+    @implementation.register
+    def _(value: Point) -> str:
+        return 'point'
+
+    @implementation.register
+    def _(value: t.Sequence[int], other: t.Optional[int]) -> str:
+        return 'sequence & optional integer'
+
+    assert implementation('') == 'object'
+    assert implementation(Point(0, 0)) == 'point'
+    assert implementation([], None) == 'sequence & optional integer'
@@ -0,0 +1,13 @@
+from hypothesis import strategies
+
+from tests.predicates_tests.strategies import plain_static_annotations
+
+annotations_pairs = strategies.tuples(plain_static_annotations,
+                                      plain_static_annotations)
+pairs = strategies.dictionaries(strategies.integers(0, 100),
+                                annotations_pairs,
+                                max_size=10)
+modules_names = strategies.sampled_from(['builtins', 'collections.abc',
+                                         'numbers', 'typing'])
+modules_names_lists = strategies.lists(modules_names,
+                                       max_size=2)
@@ -0,0 +1,79 @@
+import typing as t
+
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.incremental import Rechecker
+from correct.predicates import is_subtype
+from . import strategies
+
+Pairs = t.Dict[int, t.Tuple[Annotation, Annotation]]
+
+
+@given(strategies.pairs)
+def test_basic(pairs: Pairs) -> None:
+    rechecker = Rechecker()
+
+    result = rechecker.recheck(pairs)
+
+    assert result == {key: is_subtype(left, right)
+                      for key, (left, right) in pairs.items()}
+    assert len(rechecker) == len(pairs)
+    assert all(key in rechecker for key in pairs)
+
+
+@given(strategies.pairs)
+def test_unchanged(pairs: Pairs) -> None:
+    rechecker = Rechecker()
+    rechecker.recheck(pairs)
+
+    result = rechecker.recheck(pairs)
+
+    assert result == {}
+    assert all(rechecker[key] is is_subtype(left, right)
+               for key, (left, right) in pairs.items())
+
+
+@given(strategies.pairs, strategies.pairs)
+def test_replaced_pairs(first_pairs: Pairs, second_pairs: Pairs) -> None:
+    rechecker = Rechecker()
+    rechecker.recheck(first_pairs)
+
+    result = rechecker.recheck(second_pairs)
+
+    assert result.keys() <= second_pairs.keys()
+    assert second_pairs.keys() - first_pairs.keys() <= result.keys()
+    assert len(rechecker) == len(second_pairs)
+
+
+@given(strategies.pairs, strategies.modules_names_lists)
+def test_changed_modules(pairs: Pairs, modules_names: t.List[str]) -> None:
+    rechecker = Rechecker()
+    rechecker.recheck(pairs)
+
+    result = rechecker.recheck(pairs,
+                               modules=modules_names)
+
+    assert result.keys() == {
+        key
+        for key in pairs
+        if any(dependency.module in modules_names
+               for dependency in rechecker.to_dependencies(key))
+    }
+    assert all(value is is_subtype(*pairs[key])
+               for key, value in result.items())
+
+
+@given(strategies.pairs)
+def test_changed_classes(pairs: Pairs) -> None:
+    rechecker = Rechecker()
+    rechecker.recheck(pairs)
+
+    result = rechecker.recheck(pairs,
+                               classes=[int])
+
+    assert result.keys() == {
+        key
+        for key in pairs
+        if ('builtins', 'int') in rechecker.to_dependencies(key)
+    }
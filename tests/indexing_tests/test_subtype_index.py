@@ -0,0 +1,107 @@
+import dataclasses
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.indexing import SubtypeIndex
+from tests.utils import (implication,
+                         is_covariant_subtype)
+from . import strategies
+
+
+@given(strategies.annotations_lists, strategies.annotations)
+def test_lookup(annotations: t.List[Annotation],
+                annotation: Annotation) -> None:
+    index = SubtypeIndex()
+    for position, element in enumerate(annotations):
+        index.register(element, position)
+
+    result = index.lookup(annotation)
+
+    assert all(is_covariant_subtype(annotation, entry_annotation)
+               for entry_annotation, _ in result)
+    assert implication(
+            any(is_covariant_subtype(annotation, element)
+                for element in annotations),
+            bool(result)
+    )
+
+
+@given(strategies.annotations_lists, strategies.annotations)
+def test_specificity(annotations: t.List[Annotation],
+                     annotation: Annotation) -> None:
+    index = SubtypeIndex()
+    for position, element in enumerate(annotations):
+        index.register(element, position)
+
+    result = index.lookup(annotation)
+
+    assert all(
+            not is_covariant_subtype(element, entry_annotation)
+            or is_covariant_subtype(entry_annotation, element)
+            for entry_annotation, _ in result
+            for element in annotations
+            if (element is not t.Any
+                and is_covariant_subtype(annotation, element))
+    )
+
+
+@given(strategies.annotations_lists, strategies.annotations,
+       strategies.annotations)
+def test_registration(annotations: t.List[Annotation],
+                      annotation: Annotation,
+                      registered: Annotation) -> None:
+    index, fresh_index = SubtypeIndex(), SubtypeIndex()
+    for position, element in enumerate(annotations):
+        index.register(element, position)
+        fresh_index.register(element, position)
+    index.lookup(annotation)
+
+    index.register(registered, len(annotations))
+    fresh_index.register(registered, len(annotations))
+
+    assert index.lookup(annotation) == fresh_index.lookup(annotation)
+
+
+@given(strategies.annotations_lists, strategies.annotations_lists)
+def test_concurrent_lookup(annotations: t.List[Annotation],
+                           queries: t.List[Annotation]) -> None:
+    index, sequential_index = SubtypeIndex(), SubtypeIndex()
+    for position, element in enumerate(annotations):
+        sequential_index.register(element, position)
+
+    with ThreadPoolExecutor(4) as executor:
+        for _ in executor.map(index.lookup, queries * 2):
+            pass
+        for _ in executor.map(index.register, annotations,
+                              range(len(annotations))):
+            pass
+        result = list(executor.map(index.lookup, queries * 2))
+
+    assert len(index) == len(annotations)
+    assert all(
+            {position for _, position in entries}
+            == {position for _, position in sequential_index.lookup(query)}
+            for entries, query in zip(result, queries * 2)
+    )
+
+
+def test_records() -> None:
+    @dataclasses.dataclass
+    class Coordinate:
+        x: int
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: str
+
+    index = SubtypeIndex()
+    index.register(Coordinate, 'coordinate')
+
+    result = index.lookup(Point)
+
+    assert is_covariant_subtype(Point, Coordinate)
+    assert result == ((Coordinate, 'coordinate'),)
@@ -0,0 +1,8 @@
+from hypothesis import strategies
+
+from tests.predicates_tests.strategies import plain_static_annotations
+
+annotations = plain_static_annotations
+annotations_lists = strategies.lists(annotations,
+                                     max_size=5)
+max_variants_counts = strategies.integers(1, 3)
@@ -0,0 +1,30 @@
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.lattice import join
+from correct.predicates import is_subtype
+from tests.utils import is_covariant_subtype
+from . import strategies
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_basic(first: Annotation, second: Annotation) -> None:
+    result = join(first, second)
+
+    assert is_subtype(result, result)
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_upper_bound(first: Annotation, second: Annotation) -> None:
+    result = join(first, second)
+
+    assert is_covariant_subtype(first, result)
+    assert is_covariant_subtype(second, result)
+
+
+@given(strategies.annotations)
+def test_idempotence(annotation: Annotation) -> None:
+    result = join(annotation, annotation)
+
+    assert is_covariant_subtype(result, annotation)
+    assert is_covariant_subtype(annotation, result)
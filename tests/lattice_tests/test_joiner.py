@@ -0,0 +1,59 @@
+import typing as t
+
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.lattice import Joiner
+from tests.utils import is_covariant_subtype
+from . import strategies
+
+
+@given(strategies.annotations_lists)
+def test_upper_bound(annotations: t.List[Annotation]) -> None:
+    joiner = Joiner()
+
+    for annotation in annotations:
+        joiner.add(annotation)
+
+    assert all(is_covariant_subtype(annotation, joiner.result)
+               for annotation in annotations)
+
+
+@given(strategies.annotations_lists)
+def test_antichain(annotations: t.List[Annotation]) -> None:
+    joiner = Joiner()
+
+    for annotation in annotations:
+        joiner.add(annotation)
+
+    assert all(not is_covariant_subtype(variant, other_variant)
+               for index, variant in enumerate(joiner.variants)
+               for other_variant in joiner.variants[index + 1:])
+
+
+@given(strategies.annotations_lists, strategies.max_variants_counts)
+def test_boundedness(annotations: t.List[Annotation],
+                     max_variants: int) -> None:
+    joiner = Joiner(max_variants=max_variants)
+
+    for annotation in annotations:
+        joiner.add(annotation)
+
+    assert len(joiner.variants) <= max_variants
+    assert all(is_covariant_subtype(annotation, joiner.result)
+               for annotation in annotations)
+
+
+@given(strategies.annotations_lists, strategies.annotations)
+def test_repeated_observation(annotations: t.List[Annotation],
+                              annotation: Annotation) -> None:
+    # absorbed annotations are not remembered,
+    # so repeated observations are settled by joining
+    joiner = Joiner(covered_capacity=0)
+    for element in annotations:
+        joiner.add(element)
+    joiner.add(annotation)
+    result = joiner.result
+
+    assert not joiner.add(annotation)
+    assert joiner.result == result
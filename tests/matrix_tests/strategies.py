@@ -0,0 +1,7 @@
+from hypothesis import strategies
+
+from tests.dispatching_tests.strategies import classes
+
+classes_lists = strategies.lists(classes,
+                                 min_size=1,
+                                 max_size=10)
@@ -0,0 +1,69 @@
+import typing as t
+
+import pytest
+from hypothesis import given
+
+from . import strategies
+
+np = pytest.importorskip('numpy')
+
+from correct.matrix import SubclassMatrix  # noqa: E402
+
+
+def is_subclass(left: type, right: type) -> t.Optional[bool]:
+    try:
+        return issubclass(left, right)
+    except TypeError:
+        return None
+
+
+@given(strategies.classes_lists)
+def test_basic(classes: t.List[type]) -> None:
+    result = SubclassMatrix(classes)
+
+    assert len(result) == len(set(classes))
+    assert set(result.classes) == set(classes)
+    assert result.to_array().shape == (len(result), len(result))
+    assert result.to_array().dtype == np.bool_
+
+
+@given(strategies.classes_lists)
+def test_consistency(classes: t.List[type]) -> None:
+    result = SubclassMatrix(classes)
+
+    assert all(result.is_subclass(left, right)
+               is (is_subclass(left, right) or right in left.__mro__)
+               for left in classes
+               for right in classes)
+
+
+@given(strategies.classes_lists)
+def test_rows_and_columns(classes: t.List[type]) -> None:
+    result = SubclassMatrix(classes)
+
+    array = result.to_array()
+    assert all(
+            (result.to_subclasses_mask(cls) == array[:, index]).all()
+            and (result.to_superclasses_mask(cls) == array[index]).all()
+            and result.subclasses(cls) == [
+                candidate
+                for candidate in result.classes
+                if result.is_subclass(candidate, cls)
+            ]
+            and result.superclasses(cls) == [
+                candidate
+                for candidate in result.classes
+                if result.is_subclass(cls, candidate)
+            ]
+            for index, cls in enumerate(result.classes)
+    )
+
+
+@given(strategies.classes_lists)
+def test_packing(classes: t.List[type]) -> None:
+    result = SubclassMatrix(classes)
+
+    assert (np.unpackbits(result.to_array(packed=True),
+                          axis=1,
+                          count=len(result)).astype(bool)
+            == result.to_array()).all()
@@ -0,0 +1,41 @@
+import typing as t
+from collections import abc
+
+from hypothesis import strategies
+
+from correct.hints import Annotation
+
+annotations = strategies.sampled_from([
+    bool, int, float, object, str, t.Any, t.Optional[int], t.List[int],
+    t.Sequence[int], abc.Sequence, t.Callable[[int], str]
+])
+
+
+def to_method(parameter_annotation: Annotation,
+              return_annotation: Annotation) -> t.Callable[..., t.Any]:
+    def method(self: t.Any, value: t.Any) -> t.Any:
+        return value
+
+    method.__annotations__ = {'value': parameter_annotation,
+                              'return': return_annotation}
+    return method
+
+
+def to_hierarchy(base_annotations: t.Tuple[Annotation, Annotation],
+                 override_annotations: t.Tuple[Annotation, Annotation]
+                 ) -> t.Tuple[type, type]:
+    base = type('Base', (), {'method': to_method(*base_annotations)})
+    derived = type('Derived', (base,),
+                   {'method': to_method(*override_annotations)})
+    return base, derived
+
+
+methods_annotations = strategies.tuples(annotations, annotations)
+hierarchies = strategies.builds(to_hierarchy, methods_annotations,
+                                methods_annotations)
+hierarchies_lists = strategies.lists(hierarchies,
+                                     max_size=5)
+# ``unittest`` has an entry point module which exits on import
+packages_names = strategies.sampled_from(['email', 'json', 'logging',
+                                          'unittest'])
+jobs_counts = strategies.integers(1, 3)
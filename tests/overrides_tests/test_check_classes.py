@@ -0,0 +1,57 @@
+import typing as t
+
+from hypothesis import given
+
+from correct._core.predicates import is_covariant_subtype
+from correct.hints import Annotation
+from correct.overrides import check_classes
+from correct.predicates import Status
+from . import strategies
+
+
+@given(strategies.hierarchies_lists)
+def test_basic(hierarchies: t.List[t.Tuple[type, type]]) -> None:
+    classes = [cls for hierarchy in hierarchies for cls in hierarchy]
+
+    result = check_classes(classes)
+
+    assert len(result) == len(hierarchies)
+    assert all(check.override.owner in classes
+               and check.override.base in check.override.owner.__mro__[1:]
+               and check.override.name in vars(check.override.owner)
+               and check.override.name in vars(check.override.base)
+               and isinstance(check.reason, str)
+               for check in result)
+
+
+@given(strategies.methods_annotations, strategies.methods_annotations)
+def test_compatibility(base_annotations: t.Tuple[Annotation, Annotation],
+                       override_annotations: t.Tuple[Annotation, Annotation]
+                       ) -> None:
+    _, derived = strategies.to_hierarchy(base_annotations,
+                                         override_annotations)
+
+    result, = check_classes([derived])
+
+    base_parameter, base_returns = base_annotations
+    override_parameter, override_returns = override_annotations
+    assert (result.status is Status.SUBTYPE) is (
+            is_covariant_subtype(override_returns, base_returns)
+            and is_covariant_subtype(base_parameter, override_parameter)
+    )
+
+
+@given(strategies.methods_annotations)
+def test_reflexivity(annotations: t.Tuple[Annotation, Annotation]) -> None:
+    _, derived = strategies.to_hierarchy(annotations, annotations)
+
+    result, = check_classes([derived])
+
+    assert result.status is Status.SUBTYPE
+
+
+@given(strategies.hierarchies_lists)
+def test_duplicates(hierarchies: t.List[t.Tuple[type, type]]) -> None:
+    classes = [cls for hierarchy in hierarchies for cls in hierarchy]
+
+    assert check_classes(classes + classes) == check_classes(classes)
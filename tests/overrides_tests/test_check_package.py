@@ -0,0 +1,14 @@
+from hypothesis import given
+
+from correct.overrides import check_package
+from . import strategies
+
+
+@given(strategies.packages_names, strategies.jobs_counts)
+def test_basic(package_name: str, jobs: int) -> None:
+    result = check_package(package_name,
+                           jobs=jobs)
+
+    assert all(check.override.owner.__module__.startswith(package_name)
+               for check in result)
+    assert result == check_package(package_name)
@@ -1,5 +1,7 @@
 import sys
+import types
 import typing as t
+from collections import abc
 from functools import partial
 from itertools import repeat
 
@@ -9,6 +11,7 @@ from paradigm.base import signature_from_callable
 
 from correct._core.predicates import is_generic_alias
 from correct._core.utils import to_base
+from correct._core.variance import Variance
 from correct.hints import Annotation
 from tests.utils import GenericAlias
 
@@ -86,11 +89,11 @@ def has_parseable_signature(value: type) -> bool:
         return True
 
 
+constructible_classes = (strategies.from_type(type)
+                         .filter(has_parseable_signature))
 plain_static_annotations = strategies.recursive(
         strategies.from_type(type).filter(is_not_special_generic_alias_origin)
-        | strategies.builds(t.Type.__getitem__,
-                            (strategies.from_type(type)
-                             .filter(has_parseable_signature))),
+        | strategies.builds(t.Type.__getitem__, constructible_classes),
         nest_annotations
 )
 type_variables_names = strategies.text()
@@ -122,3 +125,53 @@ annotations = strategies.recursive(
         nest_annotations,
         max_leaves=3
 )
+# ABCs with subclass hooks, some of which accept ``object``
+abstract_classes = strategies.sampled_from([abc.Callable, abc.Hashable,
+                                            abc.Iterable, abc.Sized])
+steps_counts = strategies.integers(0, 10)
+unsupported_annotations = (strategies.integers()
+                           | strategies.text()
+                           | strategies.just(Ellipsis))
+variances = strategies.sampled_from(list(Variance))
+
+
+def to_generic_subclass(alias: GenericAlias) -> type:
+    parameters = tuple(t.TypeVar(f'T{index}')
+                       for index
+                       in range(generic_alias_to_parameters_count(alias)))
+    # parameters are passed to the base in reversed order
+    # to check that they are remapped
+    return types.new_class('GenericSubclass',
+                           (alias[parameters[::-1]], t.Generic[parameters]))
+
+
+def to_generic_subclass_case(
+        alias: GenericAlias
+) -> SearchStrategy[t.Tuple[GenericAlias, type, t.Tuple[Annotation, ...],
+                            t.Tuple[Annotation, ...]]]:
+    arguments = strategies.tuples(
+            *repeat(plain_static_annotations,
+                    generic_alias_to_parameters_count(alias))
+    )
+    return strategies.tuples(strategies.just(alias),
+                             strategies.builds(to_generic_subclass,
+                                               strategies.just(alias)),
+                             arguments, arguments)
+
+
+generic_subclasses_cases = strategies.sampled_from([
+    alias
+    for alias in special_generic_aliases_values
+    if (generic_alias_to_parameters_count(alias) > 0
+        and alias not in (t.Callable, t.Counter, t.ItemsView, t.Match,
+                          t.Pattern))
+]).flatmap(to_generic_subclass_case)
+covariant_generic_aliases = strategies.sampled_from(
+        [t.AbstractSet, t.Collection, t.Container, t.FrozenSet, t.Iterable,
+         t.Iterator, t.Reversible, t.Sequence]
+)
+invariant_generic_aliases = strategies.sampled_from(
+        [t.Deque, t.List, t.MutableSequence, t.MutableSet, t.Set]
+)
+plain_static_annotations_lists = strategies.lists(plain_static_annotations,
+                                                  max_size=3)
@@ -0,0 +1,84 @@
+import collections
+import dataclasses
+import gc
+import typing as t
+import weakref
+
+from hypothesis import given
+import typing_extensions as te
+
+from correct.hints import Annotation
+from correct.predicates import (Status,
+                                check,
+                                is_subtype)
+from . import strategies
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_basic(first: Annotation, second: Annotation) -> None:
+    result = check(first, second)
+
+    assert isinstance(result.status, Status)
+    assert isinstance(result.reason, str)
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_consistency(first: Annotation, second: Annotation) -> None:
+    result = check(first, second)
+
+    assert bool(result) is is_subtype(first, second)
+    assert result.status is (Status.SUBTYPE
+                             if is_subtype(first, second)
+                             else Status.NOT_SUBTYPE)
+
+
+@given(strategies.annotations, strategies.unsupported_annotations)
+def test_unsupported(first: Annotation, second: Annotation) -> None:
+    result = check(first, second)
+
+    try:
+        expected = is_subtype(first, second)
+    except (TypeError, ValueError) as error:
+        assert result.status is Status.UNSUPPORTED
+        assert not result
+        assert result.reason == str(error)
+    else:
+        assert bool(result) is expected
+
+
+def test_signatureless_class() -> None:
+    cls = collections._tuplegetter  # type: ignore[attr-defined]
+
+    result = check(cls, t.Callable[[int], cls])
+
+    assert result.status is Status.UNSUPPORTED
+    assert not result
+    assert isinstance(result.reason, str)
+
+
+def test_unresolvable_forward_references() -> None:
+    @dataclasses.dataclass
+    class Unresolvable:
+        value: 'Missing'  # type: ignore[name-defined] # noqa: F821
+
+    @dataclasses.dataclass
+    class Local:
+        value: int
+
+    result = check(Local, Unresolvable)
+
+    assert result.status is Status.UNSUPPORTED
+    assert not result
+    assert 'Missing' in result.reason
+
+
+def test_collection() -> None:
+    class Local:
+        pass
+
+    assert check(Local, te.Literal[1]).status is Status.UNSUPPORTED
+    reference = weakref.ref(Local)
+    del Local
+    gc.collect()
+
+    assert reference() is None
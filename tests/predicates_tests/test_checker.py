@@ -0,0 +1,87 @@
+import pytest
+from hypothesis import given
+
+from correct._core.predicates import is_subtype as core_is_subtype
+from correct.hints import Annotation
+from correct.predicates import (Checker,
+                                Status,
+                                Variance)
+from . import strategies
+
+
+@given(strategies.variances, strategies.variances, strategies.annotations,
+       strategies.annotations)
+def test_is_subtype(left_variance: Variance,
+                    right_variance: Variance,
+                    first: Annotation,
+                    second: Annotation) -> None:
+    checker = Checker(left_variance=left_variance,
+                      right_variance=right_variance)
+    try:
+        expected = core_is_subtype(left_variance, right_variance, first,
+                                   second)
+    except TypeError:
+        with pytest.raises(TypeError):
+            checker.is_subtype(first, second)
+    else:
+        assert checker.is_subtype(first, second) is expected
+        assert checker.is_subtype(first, second) is expected
+
+
+@given(strategies.variances, strategies.variances, strategies.annotations,
+       strategies.annotations)
+def test_check(left_variance: Variance,
+               right_variance: Variance,
+               first: Annotation,
+               second: Annotation) -> None:
+    checker = Checker(left_variance=left_variance,
+                      right_variance=right_variance)
+
+    result = checker.check(first, second)
+
+    if result.status is Status.UNSUPPORTED:
+        with pytest.raises(TypeError):
+            checker.is_subtype(first, second)
+    else:
+        assert bool(result) is checker.is_subtype(first, second)
+
+
+@given(strategies.plain_static_annotations,
+       strategies.plain_static_annotations)
+def test_stats(first: Annotation, second: Annotation) -> None:
+    checker = Checker()
+
+    checker.is_subtype(first, second)
+    checker.is_subtype(first, second)
+
+    assert checker.stats == (2, 1)
+    assert len(checker) == 1
+
+    checker.clear()
+
+    assert checker.stats == (0, 0)
+    assert len(checker) == 0
+
+
+@given(strategies.plain_static_annotations,
+       strategies.plain_static_annotations, strategies.steps_counts)
+def test_budget(first: Annotation,
+                second: Annotation,
+                max_steps: int) -> None:
+    checker = Checker(max_steps=max_steps)
+
+    result = checker.is_subtype_within(first, second)
+
+    assert result.steps <= max_steps
+    assert (result.value is None
+            or result.value is checker.is_subtype(first, second))
+
+
+@given(strategies.plain_static_annotations,
+       strategies.plain_static_annotations)
+def test_tracking(first: Annotation, second: Annotation) -> None:
+    checker = Checker()
+
+    result = checker.is_subtype_tracked(first, second)
+
+    assert result.value is checker.is_subtype(first, second)
@@ -0,0 +1,36 @@
+import gc
+import typing as t
+import weakref
+
+from hypothesis import given
+
+from correct._core import signatures
+from correct.hints import Annotation
+from tests.utils import is_covariant_subtype
+from . import strategies
+
+
+@given(strategies.constructible_classes,
+       strategies.plain_static_annotations_lists)
+def test_consistency(cls: type, annotations: t.List[Annotation]) -> None:
+    result = signatures.is_constructor_subtype_of_callable_annotations(
+            cls, annotations, is_covariant_subtype
+    )
+
+    assert result is signatures.is_subtype_of_callable_annotations(
+            signatures.from_callable(cls), annotations, is_covariant_subtype
+    )
+
+
+def test_collection() -> None:
+    class Local:
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    assert is_covariant_subtype(Local, t.Callable[[bool], object])
+    assert not is_covariant_subtype(Local, t.Callable[[str], object])
+    reference = weakref.ref(Local)
+    del Local
+    gc.collect()
+
+    assert reference() is None
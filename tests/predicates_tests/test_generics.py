@@ -0,0 +1,52 @@
+import typing as t
+
+from hypothesis import given
+
+from correct.hints import Annotation
+from tests.utils import (GenericAlias,
+                         is_covariant_subtype)
+from . import strategies
+
+
+@given(strategies.generic_subclasses_cases)
+def test_ancestor(
+        case: t.Tuple[GenericAlias, type, t.Tuple[Annotation, ...],
+                      t.Tuple[Annotation, ...]]
+) -> None:
+    alias, subclass, left_arguments, right_arguments = case
+
+    assert (is_covariant_subtype(subclass[left_arguments],
+                                 alias[right_arguments])
+            is is_covariant_subtype(alias[left_arguments[::-1]],
+                                    alias[right_arguments]))
+
+
+@given(strategies.generic_subclasses_cases)
+def test_reflexivity(
+        case: t.Tuple[GenericAlias, type, t.Tuple[Annotation, ...],
+                      t.Tuple[Annotation, ...]]
+) -> None:
+    alias, subclass, arguments, _ = case
+
+    assert is_covariant_subtype(subclass[arguments],
+                                alias[arguments[::-1]])
+
+
+_T = t.TypeVar('_T')
+
+
+class Repository(t.Sequence[_T]):
+    pass
+
+
+class IntegersRepository(Repository[int]):
+    pass
+
+
+def test_class_ancestor() -> None:
+    assert is_covariant_subtype(IntegersRepository, Repository[int])
+    assert is_covariant_subtype(IntegersRepository, t.Sequence[int])
+    assert is_covariant_subtype(IntegersRepository, t.Iterable[object])
+    assert is_covariant_subtype(Repository, t.Sequence[str])
+    assert not is_covariant_subtype(IntegersRepository, Repository[str])
+    assert not is_covariant_subtype(IntegersRepository, t.Sequence[str])
@@ -0,0 +1,42 @@
+import pytest
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.predicates import (is_subtype,
+                                is_subtype_tracked)
+from . import strategies
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_basic(first: Annotation, second: Annotation) -> None:
+    try:
+        expected = is_subtype(first, second)
+    except TypeError:
+        with pytest.raises(TypeError):
+            is_subtype_tracked(first, second)
+    else:
+        result = is_subtype_tracked(first, second)
+
+        assert result.value is expected
+        assert isinstance(result.dependencies, frozenset)
+
+
+@given(strategies.plain_static_annotations,
+       strategies.plain_static_annotations)
+def test_ancestors(first: Annotation, second: Annotation) -> None:
+    result = is_subtype_tracked(first, second)
+
+    assert all((cls.__module__, cls.__qualname__) in result.dependencies
+               for annotation in (first, second)
+               if isinstance(annotation, type)
+               for cls in annotation.__mro__)
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_idempotence(first: Annotation, second: Annotation) -> None:
+    try:
+        result = is_subtype_tracked(first, second)
+    except TypeError:
+        return
+
+    assert is_subtype_tracked(first, second) == result
@@ -0,0 +1,35 @@
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.predicates import (is_subtype,
+                                is_subtype_within)
+from . import strategies
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_basic(first: Annotation, second: Annotation) -> None:
+    result = is_subtype_within(first, second)
+
+    assert result.value is is_subtype(first, second)
+    assert result.steps >= 0
+    assert result.elapsed >= 0
+
+
+@given(strategies.annotations, strategies.annotations,
+       strategies.steps_counts)
+def test_steps_limit(first: Annotation,
+                     second: Annotation,
+                     max_steps: int) -> None:
+    result = is_subtype_within(first, second,
+                               max_steps=max_steps)
+
+    assert result.steps <= max_steps
+    assert result.value is None or result.value is is_subtype(first, second)
+
+
+@given(strategies.annotations, strategies.annotations)
+def test_expired_deadline(first: Annotation, second: Annotation) -> None:
+    result = is_subtype_within(first, second,
+                               timeout=0)
+
+    assert result.value is None or result.value is is_subtype(first, second)
@@ -0,0 +1,58 @@
+import typing as t
+
+from hypothesis import given
+
+from correct._core.predicates import (PrefilterTier,
+                                      _prefilter,
+                                      _to_subtype_result,
+                                      prefilter_hits)
+from correct._core.variance import Variance
+from correct.hints import Annotation
+from correct.predicates import is_subtype
+from . import strategies
+
+
+@given(strategies.variances, strategies.variances, strategies.annotations,
+       strategies.annotations)
+def test_basic(left_variance: Variance,
+               right_variance: Variance,
+               first: Annotation,
+               second: Annotation) -> None:
+    result = _prefilter(left_variance, right_variance, first, second)
+
+    assert result is None or isinstance(result, bool)
+
+
+@given(strategies.variances, strategies.variances, strategies.annotations,
+       strategies.annotations)
+def test_consistency(left_variance: Variance,
+                     right_variance: Variance,
+                     first: Annotation,
+                     second: Annotation) -> None:
+    result = _prefilter(left_variance, right_variance, first, second)
+
+    assert result is None or result is _to_subtype_result(
+            (left_variance, right_variance, first, second)
+    )
+
+
+@given(strategies.variances, strategies.variances, strategies.annotations)
+def test_identity(left_variance: Variance,
+                  right_variance: Variance,
+                  annotation: Annotation) -> None:
+    hits_count = prefilter_hits[PrefilterTier.IDENTITY]
+
+    result = _prefilter(left_variance, right_variance, annotation,
+                        annotation)
+
+    assert result is not None
+    assert prefilter_hits[PrefilterTier.IDENTITY] > hits_count
+
+
+@given(strategies.abstract_classes)
+def test_object_against_abstract_classes(cls: type) -> None:
+    result = is_subtype(object, cls)
+
+    assert result is (issubclass(object, cls) and issubclass(cls, object))
+    assert is_subtype(t.Callable[[cls], None],
+                      t.Callable[[object], None]) is result
@@ -0,0 +1,45 @@
+import gc
+import weakref
+
+import typing_extensions as te
+
+from tests.utils import is_covariant_subtype
+
+
+class Sized(te.Protocol):
+    def size(self) -> int:
+        ...
+
+
+class Named(te.Protocol):
+    def name(self) -> str:
+        ...
+
+    def size(self) -> int:
+        ...
+
+
+class Implementation:
+    def size(self) -> int:
+        return 0
+
+
+def test_conformance() -> None:
+    assert is_covariant_subtype(Implementation, Sized)
+    assert is_covariant_subtype(Implementation, Sized)
+    assert not is_covariant_subtype(Implementation, Named)
+    assert not is_covariant_subtype(Implementation, Named)
+
+
+def test_collection() -> None:
+    class Local:
+        def size(self) -> int:
+            return 0
+
+    assert is_covariant_subtype(Local, Sized)
+    assert not is_covariant_subtype(Local, Named)
+    reference = weakref.ref(Local)
+    del Local
+    gc.collect()
+
+    assert reference() is None
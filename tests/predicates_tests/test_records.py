@@ -0,0 +1,131 @@
+import dataclasses
+import gc
+import typing as t
+import weakref
+from collections import namedtuple
+
+import typing_extensions as te
+
+from correct._core.predicates import (RecordKind,
+                                      record_to_fields)
+from correct.predicates import is_subtype
+from tests.utils import is_covariant_subtype
+
+
+class Point(te.TypedDict):
+    x: int
+    y: int
+
+
+class Coordinate(te.TypedDict):
+    x: int
+
+
+class PartialCoordinate(te.TypedDict, total=False):
+    x: int
+
+
+class BooleanCoordinate(te.TypedDict):
+    x: bool
+
+
+@dataclasses.dataclass
+class MutablePoint:
+    x: int
+    y: int
+
+
+@dataclasses.dataclass
+class MutableCoordinate:
+    x: int
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenPoint:
+    x: bool
+    y: int
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenCoordinate:
+    x: int
+
+
+class Pair(t.NamedTuple):
+    first: int
+    second: str
+
+
+class BooleanPair(t.NamedTuple):
+    first: bool
+    second: str
+
+
+class SwappedPair(t.NamedTuple):
+    second: str
+    first: int
+
+
+UntypedPair = namedtuple('UntypedPair', ['first', 'second'])
+
+
+def test_typed_dicts() -> None:
+    assert is_covariant_subtype(Point, Coordinate)
+    assert is_subtype(Point, Point)
+    assert not is_covariant_subtype(Coordinate, Point)
+    assert not is_covariant_subtype(Point, PartialCoordinate)
+    assert not is_covariant_subtype(PartialCoordinate, Coordinate)
+    assert not is_covariant_subtype(BooleanCoordinate, Coordinate)
+    assert not is_covariant_subtype(dict, Coordinate)
+    assert not is_covariant_subtype(t.Dict[str, int], Coordinate)
+    assert is_covariant_subtype(Point, dict)
+    assert is_covariant_subtype(Point, t.Mapping[str, object])
+    assert is_covariant_subtype(Point, t.Iterable[str])
+    assert not is_covariant_subtype(Point, t.Mapping[str, int])
+    assert not is_covariant_subtype(Point, t.Dict[str, int])
+
+
+def test_dataclasses() -> None:
+    assert is_covariant_subtype(MutablePoint, MutableCoordinate)
+    assert not is_covariant_subtype(MutableCoordinate, MutablePoint)
+    assert is_covariant_subtype(FrozenPoint, FrozenCoordinate)
+    assert is_covariant_subtype(MutablePoint, FrozenCoordinate)
+    assert not is_covariant_subtype(FrozenPoint, MutableCoordinate)
+    assert not is_subtype(FrozenPoint, FrozenCoordinate)
+
+
+def test_named_tuples() -> None:
+    assert is_covariant_subtype(BooleanPair, Pair)
+    assert not is_covariant_subtype(Pair, BooleanPair)
+    assert not is_covariant_subtype(SwappedPair, Pair)
+    assert is_covariant_subtype(Pair, UntypedPair)
+    assert not is_covariant_subtype(Pair, MutablePoint)
+    assert is_covariant_subtype(Pair, t.Tuple[int, str])
+    assert is_covariant_subtype(Pair, t.Sequence[t.Union[int, str]])
+    assert not is_covariant_subtype(Pair, t.Tuple[str, str])
+    assert not is_covariant_subtype(Pair, t.Sequence[int])
+
+
+def test_fields_table() -> None:
+    point_fields = record_to_fields(Point)
+    partial_coordinate_fields = record_to_fields(PartialCoordinate)
+
+    assert point_fields.kind is RecordKind.TYPED_DICT
+    assert point_fields.keys == point_fields.required_keys == {'x', 'y'}
+    assert partial_coordinate_fields.required_keys == frozenset()
+    assert record_to_fields(Point) is point_fields
+    assert record_to_fields(FrozenPoint).mutable is False
+    assert record_to_fields(Pair).names == ('first', 'second')
+
+
+def test_collection() -> None:
+    @dataclasses.dataclass
+    class Local:
+        x: int
+
+    assert is_covariant_subtype(Local, MutableCoordinate)
+    reference = weakref.ref(Local)
+    del Local
+    gc.collect()
+
+    assert reference() is None
@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from correct.hints import Annotation
+from correct.predicates import is_subtype
+from tests.utils import (GenericAlias,
+                         is_covariant_subtype)
+from . import strategies
+
+
+@given(strategies.covariant_generic_aliases,
+       strategies.plain_static_annotations,
+       strategies.plain_static_annotations)
+def test_covariant_arguments(alias: GenericAlias,
+                             first: Annotation,
+                             second: Annotation) -> None:
+    assert (is_covariant_subtype(alias[first], alias[second])
+            is is_covariant_subtype(first, second))
+
+
+@given(strategies.invariant_generic_aliases,
+       strategies.plain_static_annotations,
+       strategies.plain_static_annotations)
+def test_invariant_arguments(alias: GenericAlias,
+                             first: Annotation,
+                             second: Annotation) -> None:
+    assert (is_covariant_subtype(alias[first], alias[second])
+            is is_subtype(first, second))
@@ -1,6 +1,10 @@
 from correct._core.hints import GenericAlias as _GenericAlias
+from correct._core.predicates import (
+    is_covariant_subtype as _is_covariant_subtype
+)
 
 GenericAlias = _GenericAlias
+is_covariant_subtype = _is_covariant_subtype
 
 
 def implication(antecedent: bool, consequent: bool) -> bool: